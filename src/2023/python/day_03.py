@@ -38,21 +38,12 @@ def part1(input_file: Path) -> int:
 def part2(input_file: Path) -> int:
     """Solution 2023 / day 3 part 2."""
     textmap = aoc.Loader(input_file).as_textmap()
-    all_numbers = textmap.find_horizontal_numbers()
-
-    all_number_coordinates = tuple(
-        (number, aoc.grid.get_coordinates_from_line(start=start, end=end, bounds=textmap.bounds))
-        for (number, start, end) in all_numbers
-    )
+    numbers = aoc.grid.tokens(textmap, r"\d+")
 
     gear_ratio = 0
     gears = textmap.find_all("*")
     for gear in gears:
-        adjacent_numbers = tuple(
-            number
-            for number, coordinates in all_number_coordinates
-            if aoc.grid.is_adjacent(gear, coordinates, diagonal_sides=True)
-        )
+        adjacent_numbers = tuple(int(numbers[token_id]) for token_id in numbers.touching(gear))
 
         if len(adjacent_numbers) == 2:
             gear_ratio += adjacent_numbers[0] * adjacent_numbers[1]
@@ -20,19 +20,9 @@ def part1(data_file: Path) -> int:
         Path to the file containing pairs of integers.
     """
     textmap = aoc.Loader(data_file).as_textmap()
-    padded = textmap.pad(3, ".")
-    word_start_locations = padded.find_all("X")
-
-    count = 0
     directions = aoc.constants.ADJACENCY_DELTAS_WITH_DIAGONALS
 
-    for x, y in word_start_locations:
-        for dx, dy in directions:
-            word = "".join([padded.get(x + i * dx, y + i * dy) for i in range(4)])
-            if word == "XMAS":
-                count += 1
-
-    return count
+    return len(textmap.find_word("XMAS", directions))
 
 
 def part2(data_file: Path) -> int:
@@ -45,18 +35,9 @@ def part2(data_file: Path) -> int:
         Path to the file containing pairs of integers.
     """
     textmap = aoc.Loader(data_file).as_textmap()
+    x_mas = ["M?S", "?A?", "M?S"]
 
-    count = 0
-    for x in range(textmap.width - 2):
-        for y in range(textmap.height - 2):
-            letters = "".join(
-                textmap.get_many([(x, y), (x, y + 2), (x + 1, y + 1), (x + 2, y), (x + 2, y + 2)])
-            )
-
-            if letters in ["MSAMS", "SMASM", "SSAMM", "MMASS"]:
-                count += 1
-
-    return count
+    return len(aoc.grid.match(textmap, x_mas, rotations=True))
 
 
 example_file: Path = aoc.DATA.example_files[(YEAR, DAY)]  # type: ignore
@@ -3,7 +3,7 @@
 from pathlib import Path
 
 import aoc  # AoC helpers
-from aoc.types import Direction, Coordinate
+from aoc.types import Direction, Coordinate, TextMap
 
 
 YEAR = 2024
@@ -15,7 +15,6 @@ def do_patrol(
     obstacles: set[Coordinate],
     width: int,
     height: int,
-    new_obstacle: Coordinate | None = None,
 ) -> set[Coordinate] | None:
     """
     Compute the path until going out of bounds or looping.
@@ -30,18 +29,12 @@ def do_patrol(
         Map width.
     height : int
         Map height.
-    new_obstacle : Coordinate or None, optional
-        An extra obstacle to add, by default None.
 
     Returns
     -------
     set[Coordinate] or None
         Visited coordinates or None if loop detected.
     """
-    obstacle_list = set(obstacles)
-    if new_obstacle:
-        obstacle_list.add(new_obstacle)
-
     x, y, direction = location
     locations = set()
 
@@ -50,10 +43,10 @@ def do_patrol(
             return None
 
         if (
-            (direction == Direction.UP and (x, y - 1) in obstacle_list)
-            or (direction == Direction.RIGHT and (x + 1, y) in obstacle_list)
-            or (direction == Direction.DOWN and (x, y + 1) in obstacle_list)
-            or (direction == Direction.LEFT and (x - 1, y) in obstacle_list)
+            (direction == Direction.UP and (x, y - 1) in obstacles)
+            or (direction == Direction.RIGHT and (x + 1, y) in obstacles)
+            or (direction == Direction.DOWN and (x, y + 1) in obstacles)
+            or (direction == Direction.LEFT and (x - 1, y) in obstacles)
         ):
             direction = direction.turn_right()
             continue
@@ -64,6 +57,38 @@ def do_patrol(
     return set([p[:2] for p in locations])
 
 
+def patrol_loops(textmap: TextMap, start: Coordinate) -> bool:
+    """
+    Check if the patrol loops, jumping from obstacle to obstacle.
+
+    Parameters
+    ----------
+    textmap : aoc.TextMap
+        The map, with obstacles marked as "#".
+    start : Coordinate
+        Starting position, facing up.
+
+    Returns
+    -------
+    bool
+        True if the patrol loops, False if it leaves the map.
+    """
+    x, y = start
+    direction = Direction.UP
+    turns = set()
+
+    while True:
+        obstacle = aoc.grid.next_blocker(textmap, (x, y), direction, "#")
+        if not textmap.within_bounds(obstacle):
+            return False
+
+        x, y = direction.before(*obstacle)
+        direction = direction.turn_right()
+        if (x, y, direction) in turns:
+            return True
+        turns.add((x, y, direction))
+
+
 def part1(file_path: Path) -> int:
     """
     Return the number of visited locations without adding new obstacles.
@@ -119,17 +144,11 @@ def part2(file_path: Path) -> int:
     for location in locations:
         if location in obstacles or location == (cx, cy):
             continue
-        if (
-            do_patrol(
-                location=(cx, cy, Direction.UP),
-                obstacles=obstacles,
-                width=textmap.width,
-                height=textmap.height,
-                new_obstacle=location,
-            )
-            is None
-        ):
+
+        textmap.set(location, "#")
+        if patrol_loops(textmap, (cx, cy)):
             creates_a_loop += 1
+        textmap.set(location, ".")
 
     return creates_a_loop
 
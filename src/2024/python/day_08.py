@@ -14,10 +14,8 @@ def part1(file_path: Path) -> int:
     """Soluiton day 9 part 1."""
     textmap = aoc.Loader(file_path).as_textmap()
 
-    antenna_types = set(textmap.as_string())
-    antenna_types.remove(".")
-
-    antennas = {antenna_type: textmap.find_all(antenna_type) for antenna_type in antenna_types}
+    antennas = textmap.find_all_many()
+    antennas.pop(".", None)
 
     antinodes = set()
     for _, locations in antennas.items():
@@ -39,12 +37,10 @@ def part2(file_path: Path) -> int:
     """Soluiton day 9 part 1."""
     textmap = aoc.Loader(file_path).as_textmap()
 
-    antenna_types = set(textmap.as_string())
-    antenna_types.remove(".")
-
     max_width = max(textmap.width, textmap.height)
 
-    antennas = {antenna_type: textmap.find_all(antenna_type) for antenna_type in antenna_types}
+    antennas = textmap.find_all_many()
+    antennas.pop(".", None)
 
     antinodes = set()
     for _, locations in antennas.items():
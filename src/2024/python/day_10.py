@@ -4,7 +4,7 @@ from pathlib import Path
 from collections import deque
 
 import aoc  # AoC helpers
-from aoc.types import TextMap
+from aoc.types import IntGrid, TextMap
 
 
 YEAR = 2024
@@ -24,7 +24,8 @@ def get_trails(textmap: TextMap) -> set[tuple[str]]:
     I was already a bit to throrough with part 1 :-D
     and puzzled why the answer was too high.
     """
-    start_locations = textmap.find_all("0")
+    heights = IntGrid.from_textmap(textmap)
+    start_locations = heights.find_all(0)
     trails = set()
 
     for start in start_locations:
@@ -34,14 +35,14 @@ def get_trails(textmap: TextMap) -> set[tuple[str]]:
         while queue:
             trail = queue.popleft()
             position = trail[-1]
-            current_height = textmap.get(position)
+            current_height = heights.get(position)
 
-            if current_height == "9":
+            if current_height == 9:
                 trails.add(tuple(trail))
                 continue
 
-            for surround in aoc.grid.surrounding(position, bounds=textmap.bounds):
-                if textmap.get(surround) == str(int(current_height) + 1):
+            for surround in aoc.grid.surrounding(position, bounds=heights.bounds):
+                if heights.get(surround) == current_height + 1:
                     queue.append(trail + [surround])
 
     return trails
@@ -13,15 +13,8 @@ DAY = 12
 def get_plant_groups(input_file: Path) -> list[set[Coordinate]]:
     """Get groups of connected plant cells."""
     tm = aoc.Loader(input_file).as_textmap()
-    plant_types = set(tm.as_string().replace("\n", ""))
 
-    plant_groups = [
-        group
-        for plant_type in plant_types
-        for group in aoc.grid.group_adjacent(tm.find_all(plant_type))
-    ]
-
-    return plant_groups
+    return aoc.grid.label_regions(tm).groups()
 
 
 def part1(input_file: Path) -> int:
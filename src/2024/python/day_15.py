@@ -53,11 +53,7 @@ def part1(input_file: Path) -> int:
 
 def reformat_map(warehouse_map_raw: list[str]) -> TextMap:
     """Reformat the warehouse map."""
-    reformatted_map = [
-        line.replace("O", "[]").replace("#", "##").replace(".", "..").replace("@", "@.")
-        for line in warehouse_map_raw
-    ]
-    return TextMap(reformatted_map)
+    return TextMap(warehouse_map_raw).expand({"O": "[]", "#": "##", ".": "..", "@": "@."})
 
 
 def get_move_list(
@@ -27,7 +27,7 @@ def part1(input_file: Path) -> int:
 
     start = maze.find("S")
     end = maze.find("E")
-    way_points = tuple(maze.find_all(".") + [start, end])
+    way_points = maze.mask(".SE")
 
     states = dijkstra_with_direction(way_points, start, scoring_function=corner_penalty_scoring)
     min_direction = min(states[end].values(), key=lambda d: d["score"])
@@ -42,7 +42,7 @@ def part2(input_file: Path) -> int:
 
     start = maze.find("S")
     end = maze.find("E")
-    way_points = tuple(maze.find_all(".") + [start, end])
+    way_points = maze.mask(".SE")
 
     states = dijkstra_with_direction(way_points, start, scoring_function=corner_penalty_scoring)
     min_direction = min(states[end].values(), key=lambda d: d["score"])
@@ -28,9 +28,7 @@ def part1(input_file: Path) -> int:
     for drop in coordinates[:drop_index]:
         tm.set(drop, "X")
 
-    waypoints = tm.find_all(".")
-
-    shortest_path = find_shortest_path(waypoints, start, end)
+    shortest_path = find_shortest_path(tm.to_graph("."), start, end)
 
     steps = len(shortest_path) - 1
 
@@ -56,8 +54,7 @@ def part2(input_file: Path) -> int:
     while True:
         drop = coordinates[drop_index]
         tm.set(drop, "X")
-        waypoints = tm.find_all(".")
-        if not find_shortest_path(waypoints, start, end):
+        if not find_shortest_path(tm.to_graph("."), start, end):
             break
 
         drop_index += 1
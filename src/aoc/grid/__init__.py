@@ -11,9 +11,15 @@ from .find_lines import find_lines
 from .get_coordinates_from_line import get_coordinates_from_line
 from .group_adjacent import group_adjacent
 from .is_adjacent import is_adjacent
+from .label_regions import label_regions
+from .match import match
+from .next_blocker import next_blocker
 from .outer_bounds import outer_bounds
 from .perimeter import perimeter
+from .step import step
 from .surrounding import surrounding
+from .tokens import tokens
+from .trace_beams import trace_beams
 from .within_bounds import within_bounds
 
 
@@ -29,8 +35,14 @@ __all__ = [
     "get_coordinates_from_line",
     "group_adjacent",
     "is_adjacent",
+    "label_regions",
+    "match",
+    "next_blocker",
     "outer_bounds",
     "perimeter",
+    "step",
     "surrounding",
+    "tokens",
+    "trace_beams",
     "within_bounds",
 ]
@@ -3,12 +3,12 @@
 from typing import Iterable
 
 
-from ..types import AdjacencyMap, Coordinate
+from ..types import AdjacencyMap, CellMask, Coordinate
 from ..constants import ADJACENCY_DELTAS, ADJACENCY_DELTAS_WITH_DIAGONALS
 
 
 def adjacency_map(
-    coordinates: Iterable[Coordinate],
+    coordinates: Iterable[Coordinate] | CellMask,
     diagonal_sides: bool = False,
 ) -> AdjacencyMap:
     """
@@ -16,8 +16,9 @@ def adjacency_map(
 
     Parameters
     ----------
-    coordinates : Iterable[Coordinate]
-        The list of coordinates to build the adjacency map for.
+    coordinates : Iterable[Coordinate] or CellMask
+        The list of coordinates to build the adjacency map for, or a mask of them from
+        `TextMap.mask`, whose neighbours are found on its graph.
     diagonal_sides : bool, optional
         Whether to include diagonal adjacency, by default False
 
@@ -26,6 +27,14 @@ def adjacency_map(
     AdjacencyMap
         A dictionary mapping each coordinate to its set of adjacent coordinates.
     """
+    if isinstance(coordinates, CellMask):
+        graph = coordinates.to_graph(diagonal_sides)
+        nodes, offsets, adjacency = graph.coordinates, graph.offsets, graph.adjacency
+        return {
+            coord: {nodes[n] for n in adjacency[offsets[node] : offsets[node + 1]]}
+            for node, coord in enumerate(nodes)
+        }
+
     coord_set = set(coordinates)
     deltas = ADJACENCY_DELTAS_WITH_DIAGONALS if diagonal_sides else ADJACENCY_DELTAS
     adjacency_map: AdjacencyMap = {coord: set() for coord in coord_set}
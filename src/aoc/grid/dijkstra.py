@@ -3,13 +3,13 @@
 import heapq
 from typing import Iterable
 
-from ..types import Coordinate, DijkstraScoringFunction, DijkstraPathTree
+from ..types import CellMask, Coordinate, DijkstraScoringFunction, DijkstraPathTree, GridGraph
 from ..constants import UNREACHABLE
 from .scoring_functions import manhatten_scoring
 
 
 def dijkstra(
-    coordinates: Iterable[Coordinate],
+    coordinates: Iterable[Coordinate] | GridGraph | CellMask,
     start: Coordinate,
     scoring_function: DijkstraScoringFunction = manhatten_scoring,
 ) -> DijkstraPathTree:
@@ -18,8 +18,9 @@ def dijkstra(
 
     Parameters
     ----------
-    coordinates : Iterable[Coordinate]
-        The coordinates to search.
+    coordinates : Iterable[Coordinate], GridGraph or CellMask
+        The coordinates to search, a graph of them built with `TextMap.to_graph`, or a mask of
+        them from `TextMap.mask`, which is searched as its graph.
     start : Coordinate
         The starting coordinate.
     scoring_function : DijkstraScoringFunction, optional
@@ -29,6 +30,11 @@ def dijkstra(
     -------
     dijkstra_path_tree : DijkstraPathTree
     """
+    if isinstance(coordinates, CellMask):
+        coordinates = coordinates.to_graph()
+    if isinstance(coordinates, GridGraph):
+        return _dijkstra_graph(coordinates, start, scoring_function)
+
     coords = set(coordinates)
     path_tree: DijkstraPathTree = {c: {"score": UNREACHABLE, "tiles": []} for c in coords}
     path_tree[start]["score"] = 0
@@ -61,3 +67,45 @@ def dijkstra(
             path_tree[c]["tiles"] = path
 
     return path_tree
+
+
+def _dijkstra_graph(
+    graph: GridGraph,
+    start: Coordinate,
+    scoring_function: DijkstraScoringFunction,
+) -> DijkstraPathTree:
+    """Dijkstra algorithm on the node ids of a graph, see `dijkstra`."""
+    nodes = graph.coordinates
+    offsets, adjacency = graph.offsets, graph.adjacency
+    scores = [UNREACHABLE] * len(nodes)
+    prev = [-1] * len(nodes)
+    source = graph.node(start)
+    scores[source] = 0
+
+    queue = [(0, source)]
+    while queue:
+        score, node = heapq.heappop(queue)
+        if score > scores[node]:
+            continue
+
+        location = nodes[node]
+        for neighbour in adjacency[offsets[node] : offsets[node + 1]]:
+            new_score = score + scoring_function(location, nodes[neighbour])
+            if new_score < scores[neighbour]:
+                scores[neighbour] = new_score
+                prev[neighbour] = node
+                heapq.heappush(queue, (new_score, neighbour))
+
+    # Reconstruct paths
+    path_tree: DijkstraPathTree = {}
+    for node, c in enumerate(nodes):
+        path = []
+        if scores[node] != UNREACHABLE:
+            curr = node
+            while curr != source:
+                path.append(nodes[curr])
+                curr = prev[curr]
+            path.reverse()
+        path_tree[c] = {"score": scores[node], "tiles": path}
+
+    return path_tree
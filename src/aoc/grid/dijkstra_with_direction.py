@@ -4,6 +4,7 @@ import heapq
 from typing import Iterable
 
 from ..types import (
+    CellMask,
     Coordinate,
     Direction,
     DijkstraDirectionScoringFunction,
@@ -15,7 +16,7 @@ from .scoring_functions import manhatten_scoring
 
 
 def dijkstra_with_direction(
-    coordinates: Iterable[Coordinate],
+    coordinates: Iterable[Coordinate] | CellMask,
     start: Coordinate,
     start_direction: Direction = Direction.EAST,
     scoring_function: DijkstraDirectionScoringFunction = manhatten_scoring,
@@ -25,8 +26,8 @@ def dijkstra_with_direction(
 
     Parameters
     ----------
-    coordinates : Iterable[Coordinate]
-        The coordinates to search.
+    coordinates : Iterable[Coordinate] or CellMask
+        The coordinates to search, or a mask of them from `TextMap.mask`.
     start : Coordinate
         The starting coordinate.
     start_direction : Direction, optional
@@ -38,6 +39,10 @@ def dijkstra_with_direction(
     -------
     dijkstra_path_tree : DijkstraDirectionPathTree
     """
+    adjacency_lookup_table = adjacency_map(coordinates)
+    if isinstance(coordinates, CellMask):
+        coordinates = adjacency_lookup_table
+
     seen_states: DijkstraDirectionPathTree = {
         coordinate: {
             direction: {"score": UNREACHABLE, "tiles": set(), "parent": None}
@@ -48,8 +53,6 @@ def dijkstra_with_direction(
     seen_states[start][start_direction]["score"] = 0
     queue = [(0, start, set(), start_direction)]
 
-    adjacency_lookup_table = adjacency_map(coordinates)
-
     while queue:
         score, location, tiles, direction = heapq.heappop(queue)
         adjacent = adjacency_lookup_table[location] - tiles
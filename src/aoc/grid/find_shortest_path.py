@@ -3,12 +3,12 @@
 from collections import deque
 from typing import Iterable
 
-from ..types import Coordinate
+from ..types import CellMask, Coordinate, GridGraph
 from ..constants import UNREACHABLE
 
 
 def find_shortest_path(
-    coordinates: Iterable[Coordinate],
+    coordinates: Iterable[Coordinate] | GridGraph | CellMask,
     start: Coordinate,
     end: Coordinate,
 ) -> list[Coordinate]:
@@ -17,8 +17,9 @@ def find_shortest_path(
 
     Parameters
     ----------
-    coordinates : Iterable[Coordinate]
-        The coordinates to search.
+    coordinates : Iterable[Coordinate], GridGraph or CellMask
+        The coordinates to search, a graph of them built with `TextMap.to_graph`, or a mask of
+        them from `TextMap.mask`, which is searched as its graph.
     start : Coordinate
         The starting coordinate.
     end : Coordinate
@@ -27,8 +28,20 @@ def find_shortest_path(
     Returns
     -------
     list[Coordinate]
-        The shortest path between the two coordinates.
+        The shortest path between the two coordinates, or an empty list if there is none.
+
+    Raises
+    ------
+    ValueError
+        If a graph or mask is searched and the start or end is not one of its cells. Markers
+        such as "S" and "E" have to be passable when building the graph, e.g.
+        `TextMap.to_graph(".SE")`.
     """
+    if isinstance(coordinates, CellMask):
+        coordinates = coordinates.to_graph()
+    if isinstance(coordinates, GridGraph):
+        return _find_shortest_path_graph(coordinates, start, end)
+
     coords_set = set(coordinates)
     prev = {}
     dist = {c: UNREACHABLE for c in coords_set}
@@ -54,3 +67,34 @@ def find_shortest_path(
                 queue.append((nx, ny))
 
     return []
+
+
+def _find_shortest_path_graph(
+    graph: GridGraph, start: Coordinate, end: Coordinate
+) -> list[Coordinate]:
+    """Breadth-first search on the node ids of a graph, see `find_shortest_path`."""
+    for name, coordinate in (("start", start), ("end", end)):
+        if coordinate not in graph:
+            raise ValueError(f"The {name} {tuple(coordinate)} is not a cell of the graph.")
+
+    offsets, adjacency = graph.offsets, graph.adjacency
+    source, target = graph.node(start), graph.node(end)
+    prev = [-1] * len(graph)
+    prev[source] = source
+
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        if node == target:
+            path = [graph.coordinate(node)]
+            while node != source:
+                node = prev[node]
+                path.append(graph.coordinate(node))
+            return path[::-1]
+
+        for neighbour in adjacency[offsets[node] : offsets[node + 1]]:
+            if prev[neighbour] < 0:
+                prev[neighbour] = node
+                queue.append(neighbour)
+
+    return []
@@ -2,12 +2,12 @@
 
 from typing import Iterable
 
-from ..types import Coordinate
+from ..types import CellMask, Coordinate, GridGraph
 from ..constants import ADJACENCY_DELTAS, ADJACENCY_DELTAS_ONLY_DIAGONALS
 
 
 def group_adjacent(
-    coordinates: Iterable[Coordinate],
+    coordinates: Iterable[Coordinate] | GridGraph | CellMask,
     cross_sides: bool = True,
     diagonal_sides: bool = False,
 ) -> set[frozenset[Coordinate]]:
@@ -16,8 +16,11 @@ def group_adjacent(
 
     Parameters
     ----------
-    coords : iterable of Coordinate
-        The coordinates to group.
+    coords : iterable of Coordinate, GridGraph or CellMask
+        The coordinates to group, a graph of them built with `TextMap.to_graph`, or a mask of
+        them from `TextMap.mask`. A graph is grouped by its own edges, and `cross_sides` and
+        `diagonal_sides` are ignored. A mask is grouped as its graph, unless only diagonal
+        sides are considered.
     cross_sides : bool, optional
         If True, consider horizontal and vertical adjacency (default True).
     diagonal_sides : bool, optional
@@ -28,6 +31,11 @@ def group_adjacent(
     set of frozenset[Coordinate]
         A set of frozensets, each containing connected coordinates.
     """
+    if isinstance(coordinates, CellMask) and cross_sides:
+        coordinates = coordinates.to_graph(diagonal_sides)
+    if isinstance(coordinates, GridGraph):
+        return _group_adjacent_graph(coordinates)
+
     coordinates = set(coordinates)
 
     deltas = ADJACENCY_DELTAS if cross_sides else set()
@@ -52,3 +60,24 @@ def group_adjacent(
                         stack.append(n)
             groups.add(frozenset(group))
     return groups
+
+
+def _group_adjacent_graph(graph: GridGraph) -> set[frozenset[Coordinate]]:
+    """Group the nodes of a graph into connected components, see `group_adjacent`."""
+    offsets, adjacency, nodes = graph.offsets, graph.adjacency, graph.coordinates
+    visited = bytearray(len(nodes))
+    groups = set()
+    for node in range(len(nodes)):
+        if not visited[node]:
+            visited[node] = 1
+            stack = [node]
+            group = []
+            while stack:
+                cur = stack.pop()
+                group.append(nodes[cur])
+                for n in adjacency[offsets[cur] : offsets[cur + 1]]:
+                    if not visited[n]:
+                        visited[n] = 1
+                        stack.append(n)
+            groups.add(frozenset(group))
+    return groups
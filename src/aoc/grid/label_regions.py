@@ -0,0 +1,90 @@
+"""Label the connected regions of equal characters in a map."""
+
+from array import array
+from typing import TYPE_CHECKING
+
+from ..types.regions import Regions
+
+if TYPE_CHECKING:
+    from ..types import TextMap
+
+
+def label_regions(textmap: "TextMap", diagonal_sides: bool = False) -> Regions:
+    """
+    Label the connected regions of equal characters in a map.
+
+    One scan over the cells joins every cell with its equal neighbours above and to the
+    left in a union-find forest, and a second scan numbers the regions and collects their
+    character, size and bounding box.
+
+    Parameters
+    ----------
+    textmap : TextMap
+        The map.
+    diagonal_sides : bool, optional
+        If True, diagonally adjacent cells are connected as well (default False).
+
+    Returns
+    -------
+    Regions
+        The label of every cell, and the regions in reading order of their first cell.
+    """
+    width, height = textmap.width, textmap.height
+    cells = textmap.codes()
+    n_cells = width * height
+    parent = list(range(n_cells))
+
+    def root(cell: int) -> int:
+        while parent[cell] != cell:
+            parent[cell] = cell = parent[parent[cell]]
+        return cell
+
+    def join(cell: int, other: int) -> None:
+        cell, other = root(cell), root(other)
+        if cell != other:
+            # Keep the smallest cell as root, so roots are the first cells in reading order
+            if cell < other:
+                parent[other] = cell
+            else:
+                parent[cell] = other
+
+    for cell in range(n_cells):
+        code = cells[cell]
+        x = cell % width
+        if x and cells[cell - 1] == code:
+            # Runs along a row share the root of their first cell
+            parent[cell] = parent[cell - 1]
+        if cell >= width:
+            above = cell - width
+            if cells[above] == code:
+                join(cell, above)
+            if diagonal_sides:
+                if x and cells[above - 1] == code:
+                    join(cell, above - 1)
+                if x < width - 1 and cells[above + 1] == code:
+                    join(cell, above + 1)
+
+    labels = array("i", bytes(4 * n_cells))
+    label_of_root: dict[int, int] = {}
+    characters: list[str] = []
+    sizes: list[int] = []
+    bounds: list[list[int]] = []
+    for cell in range(n_cells):
+        y, x = divmod(cell, width)
+        region = label_of_root.get(root(cell))
+        if region is None:
+            region = label_of_root[root(cell)] = len(characters)
+            characters.append(chr(cells[cell]))
+            sizes.append(1)
+            bounds.append([x, y, x, y])
+        else:
+            sizes[region] += 1
+            box = bounds[region]
+            if x < box[0]:
+                box[0] = x
+            elif x > box[2]:
+                box[2] = x
+            box[3] = y
+        labels[cell] = region
+
+    return Regions(labels, width, characters, sizes, [tuple(box) for box in bounds])
@@ -0,0 +1,120 @@
+"""Find where a small 2D template matches a map."""
+
+import re
+from typing import TYPE_CHECKING
+
+from ..types import Coordinate
+
+if TYPE_CHECKING:
+    from ..types import TextMap
+
+
+def match(
+    textmap: "TextMap",
+    pattern: list[str],
+    wildcard: str = "?",
+    rotations: bool = False,
+    reflections: bool = False,
+) -> list[Coordinate]:
+    """
+    Find all locations where a small 2D template matches a map.
+
+    Each template row is searched with a single regular expression pass over the map as one
+    string, after which the candidate anchors of all rows are intersected. This avoids
+    fetching the cells of the template for every location on the map.
+
+    Parameters
+    ----------
+    textmap : TextMap
+        The map to search.
+    pattern : list of str
+        Rows of the template, all of equal length.
+    wildcard : str, optional
+        Character in the template that matches any character (default "?").
+    rotations : bool, optional
+        Also match the template rotated by 90, 180 and 270 degrees (default False).
+    reflections : bool, optional
+        Also match the mirrored template (default False).
+
+    Returns
+    -------
+    list of Coordinate
+        Top-left coordinates of every match, in reading order. A location is listed once,
+        even if several orientations of the template match there.
+    """
+    if not pattern or not pattern[0] or any(len(row) != len(pattern[0]) for row in pattern):
+        raise ValueError("Pattern must consist of one or more rows of equal, non-zero length.")
+
+    templates = {tuple(pattern)}
+    if reflections:
+        templates.add(tuple(row[::-1] for row in pattern))
+    if rotations:
+        for template in list(templates):
+            for _ in range(3):
+                template = tuple(map("".join, zip(*reversed(template), strict=True)))
+                templates.add(template)
+
+    text = textmap.as_string()
+    anchors = set()
+    for template in templates:
+        anchors |= _match_template(text, textmap.width, textmap.height, template, wildcard)
+
+    return [Coordinate(x, y) for y, x in sorted(anchors)]
+
+
+def _match_template(
+    text: str, width: int, height: int, template: tuple[str, ...], wildcard: str
+) -> set[tuple[int, int]]:
+    """
+    Find the top-left corners where a single template matches.
+
+    Parameters
+    ----------
+    text : str
+        The cells of the map, row after row.
+    width : int
+        Width of the map.
+    height : int
+        Height of the map.
+    template : tuple of str
+        Rows of the template, all of equal length.
+    wildcard : str
+        Character in the template that matches any character.
+
+    Returns
+    -------
+    set of tuple of int
+        Top-left corners of all matches, as (y, x).
+    """
+    template_height, template_width = len(template), len(template[0])
+    if template_width > width or template_height > height:
+        return set()
+
+    max_x, max_y = width - template_width, height - template_height
+
+    anchors = None
+    for r, row in enumerate(template):
+        if all(c == wildcard for c in row):
+            continue
+
+        body = "".join("." if c == wildcard else re.escape(c) for c in row)
+        regex = re.compile(f"(?={body})", re.DOTALL)
+
+        row_start = r * width
+        row_stop = row_start + max_y * width + width
+        starts = {
+            (y, x)
+            for y, x in (
+                divmod(m.start() - row_start, width)
+                for m in regex.finditer(text, row_start, row_stop)
+            )
+            if x <= max_x
+        }
+        anchors = starts if anchors is None else anchors & starts
+        if not anchors:
+            return set()
+
+    if anchors is None:
+        anchors = {(y, x) for y in range(max_y + 1) for x in range(max_x + 1)}
+
+    return anchors
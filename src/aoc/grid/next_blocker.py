@@ -0,0 +1,52 @@
+"""Find the first blocker seen from a cell of a map."""
+
+from typing import TYPE_CHECKING, Iterable
+
+from ..types import Coordinate, Direction
+
+if TYPE_CHECKING:
+    from ..types import TextMap
+
+
+def next_blocker(
+    textmap: "TextMap",
+    coordinate: Coordinate,
+    direction: Direction,
+    blockers: str | Iterable[str] = "#",
+) -> Coordinate:
+    """
+    Find the first blocker seen from a cell, looking in a direction.
+
+    The first call for a set of blockers builds the jump tables of the map in one pass; every
+    call after that is O(1). The map patches its tables on writes, so walkers can move from
+    blocker to blocker while the map changes under them.
+
+    Parameters
+    ----------
+    textmap : TextMap
+        The map to look in.
+    coordinate : Coordinate
+        The cell to look from, which itself is skipped.
+    direction : Direction
+        The direction to look in.
+    blockers : str or iterable of str, optional
+        Characters that block the view (default "#").
+
+    Returns
+    -------
+    Coordinate
+        The first blocker, or the first coordinate outside the map if there is none.
+
+    Raises
+    ------
+    IndexError
+        If the coordinate is outside the map.
+    """
+    x, y = coordinate
+    width = textmap.width
+    if not (0 <= x < width and 0 <= y < textmap.height):
+        raise IndexError("Coordinates are out of bounds.")
+
+    dx, dy = direction.value
+    position = textmap.jump_table(blockers)[dx, dy][y * width + x]
+    return Coordinate(position, y) if dx else Coordinate(x, position)
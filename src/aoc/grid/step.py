@@ -0,0 +1,147 @@
+"""Run generations of a cellular automaton on a map."""
+
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from ..constants import ADJACENCY_DELTAS, ADJACENCY_DELTAS_WITH_DIAGONALS
+from ..types import CellMask
+
+if TYPE_CHECKING:
+    from ..types import TextMap
+
+
+def step(
+    textmap: "TextMap",
+    rule: Callable[[str, int], str],
+    counted: str | Iterable[str] = "#",
+    neighbourhood: str = "moore",
+    generations: int = 1,
+    stop_on_repeat: bool = False,
+) -> int:
+    """
+    Update every cell of a map from its neighbourhood, as a cellular automaton.
+
+    Every generation, the new character of each cell is `rule(character, count)`, where
+    `count` is the number of its neighbours holding one of the `counted` characters. Cells
+    outside the map are never counted. All cells are updated from the previous generation.
+
+    The generations run on one bitboard (see `CellMask`) per character: neighbour counts
+    are summed with bit-sliced additions of shifted boards, so a generation costs a few
+    dozen operations on integers of one bit per cell, independent of the number of cells
+    that change. The rule is only called once per character and count. The map is written
+    once, after the last generation, and only where cells changed.
+
+    Parameters
+    ----------
+    textmap : TextMap
+        The map, updated in place.
+    rule : callable of (str, int) to str
+        The new character of a cell, given its character and its count of neighbours.
+    counted : str or iterable of str, optional
+        Characters counted as neighbours (default "#").
+    neighbourhood : str, optional
+        "cross" for the 4 horizontal and vertical neighbours, or "moore" to include the
+        diagonal ones (default "moore").
+    generations : int, optional
+        Number of generations to run (default 1).
+    stop_on_repeat : bool, optional
+        If True, stop as soon as a generation repeats an earlier state of the map (default
+        False).
+
+    Returns
+    -------
+    int
+        Number of generations run. When stopped on a repeat, the map holds the first
+        repeated state.
+
+    Raises
+    ------
+    ValueError
+        If the neighbourhood is not "cross" or "moore".
+    """
+    if neighbourhood == "cross":
+        deltas = ADJACENCY_DELTAS
+    elif neighbourhood == "moore":
+        deltas = ADJACENCY_DELTAS_WITH_DIAGONALS
+    else:
+        raise ValueError("Neighbourhood must be 'cross' or 'moore'.")
+
+    width, height = textmap.width, textmap.height
+    counted = {ord(value) for value in counted}
+    full = (1 << width * height) - 1
+    initial = {code: textmap.mask(chr(code)).bits for code in set(textmap.codes())}
+
+    # Per character, the counts that change it, and what they change it into
+    transitions: dict[int, list[tuple[int, int]]] = {}
+    pending = list(initial)
+    while pending:
+        code = pending.pop()
+        transitions[code] = []
+        for count in range(len(deltas) + 1):
+            new_code = ord(rule(chr(code), count))
+            if new_code != code:
+                transitions[code].append((count, new_code))
+            if new_code not in transitions and new_code not in pending:
+                pending.append(new_code)
+
+    def advance(boards: dict[int, int]) -> dict[int, int]:
+        """Run one generation on the bitboard of every character."""
+        alive = 0
+        for code in counted & boards.keys():
+            alive |= boards[code]
+        alive = CellMask(width, height, alive)
+
+        # Bit-sliced sum of the shifted boards: bit i of every count is in planes[i]
+        planes: list[int] = []
+        for dx, dy in deltas:
+            carry = alive.shift(dx, dy).bits
+            for i, plane in enumerate(planes):
+                planes[i], carry = plane ^ carry, plane & carry
+                if not carry:
+                    break
+            else:
+                if carry:
+                    planes.append(carry)
+
+        equal: dict[int, int] = {}
+        new_bits: dict[int, int] = {}
+        for code, bits in boards.items():
+            remaining = bits
+            for count, new_code in transitions[code]:
+                if count not in equal:
+                    matching = full if count < 1 << len(planes) else 0
+                    for i, plane in enumerate(planes):
+                        matching &= plane if count >> i & 1 else ~plane
+                    equal[count] = matching
+                moved = remaining & equal[count]
+                if moved:
+                    new_bits[new_code] = new_bits.get(new_code, 0) | moved
+                    remaining ^= moved
+            new_bits[code] = new_bits.get(code, 0) | remaining
+        return {code: bits for code, bits in new_bits.items() if bits}
+
+    # To detect repeats, only the hash of every state is kept, and the generation it was
+    # first seen in. A hash seen before is confirmed by replaying up to that generation.
+    seen = {hash(frozenset(initial.items())): 0} if stop_on_repeat else None
+    boards = initial
+    generation = 0
+    while generation < generations:
+        previous, boards = boards, advance(boards)
+        generation += 1
+        if seen is not None:
+            if boards == previous:
+                break
+            key = hash(frozenset(boards.items()))
+            if key in seen:
+                replayed = initial
+                for _ in range(seen[key]):
+                    replayed = advance(replayed)
+                if replayed == boards:
+                    break
+            else:
+                seen[key] = generation
+
+    for code, bits in boards.items():
+        changed = CellMask(width, height, bits & ~initial.get(code, 0))
+        if changed:
+            textmap.set_cells(changed.cells(), chr(code))
+    return generation
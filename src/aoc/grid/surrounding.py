@@ -12,6 +12,7 @@ def surrounding(
     bounds: tuple[int, int, int, int] | None = None,
     cross_sides: bool = True,
     diagonal_sides: bool = False,
+    wrap: bool = False,
 ) -> set[tuple[int, int]]:
     """
     Retrieve surrounding coordinates for given coordinate(s) on the ASCII map.
@@ -30,31 +31,50 @@ def surrounding(
     diagonal_sides : bool, optional
         If True, include the four diagonal surrounding coordinates:
         top-left, top-right, bottom-left, and bottom-right. Default is False.
+    wrap : bool, optional
+        If True, coordinates that fall outside `bounds` wrap around to the opposite edge,
+        as on a torus, instead of being dropped. A cell is never its own neighbour, also not
+        when the bounds are only one cell wide or high. Default is False.
 
     Returns
     -------
     set of tuple of int
         A set containing all valid surrounding coordinates as tuples (x, y).
+
+    Raises
+    ------
+    ValueError
+        If `wrap` is set without `bounds`.
     """
+    if wrap and bounds is None:
+        raise ValueError("Wrapping around needs bounds to wrap around.")
     if isinstance(coordinates, tuple):
         coordinates = [coordinates]
 
     min_x, min_y, max_x, max_y = bounds if bounds is not None else (0, 0, 0, 0)
+    offsets = (_CROSS_OFFSETS if cross_sides else []) + (
+        _DIAGONAL_OFFSETS if diagonal_sides else []
+    )
     surrounding_coordinates = set()
 
-    for x, y in coordinates:
-        if cross_sides:
-            for dx, dy in _CROSS_OFFSETS:
-                new_x, new_y = x + dx, y + dy
-
-                if bounds is None or (min_x <= new_x <= max_x and min_y <= new_y <= max_y):
-                    surrounding_coordinates.add((new_x, new_y))
+    if wrap:
+        width, height = max_x - min_x + 1, max_y - min_y + 1
+        # Fold the offsets into the bounds once, so every neighbour is a single modulo away.
+        # Offsets that fold onto the cell itself are dropped, as in `GridGraph`.
+        offsets = [(dx % width, dy % height) for dx, dy in offsets]
+        offsets = [(dx, dy) for dx, dy in offsets if dx or dy]
+        for x, y in coordinates:
+            for dx, dy in offsets:
+                surrounding_coordinates.add(
+                    ((x - min_x + dx) % width + min_x, (y - min_y + dy) % height + min_y)
+                )
+        return surrounding_coordinates
 
-        if diagonal_sides:
-            for dx, dy in _DIAGONAL_OFFSETS:
-                new_x, new_y = x + dx, y + dy
+    for x, y in coordinates:
+        for dx, dy in offsets:
+            new_x, new_y = x + dx, y + dy
 
-                if bounds is None or (min_x <= new_x <= max_x and min_y <= new_y <= max_y):
-                    surrounding_coordinates.add((new_x, new_y))
+            if bounds is None or (min_x <= new_x <= max_x and min_y <= new_y <= max_y):
+                surrounding_coordinates.add((new_x, new_y))
 
     return surrounding_coordinates
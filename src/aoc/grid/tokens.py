@@ -0,0 +1,57 @@
+"""Find the tokens of a map, and label every cell with the token covering it."""
+
+import re
+from typing import TYPE_CHECKING
+
+from ..types.coordinate import Coordinate
+from ..types.token_index import TokenIndex
+
+if TYPE_CHECKING:
+    from ..types import TextMap
+
+
+def tokens(
+    textmap: "TextMap", pattern: str = r"\d+", direction: tuple[int, int] = (1, 0)
+) -> TokenIndex:
+    r"""
+    Find all tokens matching a pattern, and label every cell with the token covering it.
+
+    Rows read left to right are searched in one regular expression pass over the map as one
+    string, bounded to each row. Tokens never span more than one line.
+
+    Parameters
+    ----------
+    textmap : TextMap
+        The map to search.
+    pattern : str, optional
+        Regular expression of a token (default numbers, `\d+`).
+    direction : tuple of int, optional
+        Direction (dx, dy) the tokens are read in, as in `TextMap.lines` (default (1, 0), rows
+        read left to right).
+
+    Returns
+    -------
+    TokenIndex
+        The tokens in reading order of the lines, and the token id of every cell.
+    """
+    width, height = textmap.width, textmap.height
+    index = TokenIndex(width, height)
+    if not width or not height:
+        return index
+
+    compiled = re.compile(pattern)
+    if tuple(direction) == (1, 0):
+        text = textmap.as_string()
+        for y, row_start in enumerate(range(0, width * height, width)):
+            for match in compiled.finditer(text, row_start, row_start + width):
+                if match.end() > match.start():
+                    index._add(match.group(), Coordinate(match.start() - row_start, y), (1, 0))
+        return index
+
+    dx, dy = direction
+    for (x, y), line in textmap.lines(direction):
+        for match in compiled.finditer(line):
+            if match.end() > match.start():
+                i = match.start()
+                index._add(match.group(), Coordinate(x + i * dx, y + i * dy), direction)
+    return index
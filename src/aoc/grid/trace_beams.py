@@ -0,0 +1,155 @@
+"""Trace beams through a map of mirrors and splitters."""
+
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Iterable
+
+from ..types import CellMask, Coordinate, Direction
+
+if TYPE_CHECKING:
+    from ..types import TextMap
+
+
+def trace_beams(
+    textmap: "TextMap",
+    entries: Iterable[tuple[Coordinate, Direction]],
+    deflections: dict[str, dict[Direction, Iterable[Direction]]],
+) -> list[CellMask]:
+    """
+    Find the cells a beam passes through, for one or more entry points of the map.
+
+    A beam moves straight until it reaches a cell whose character deflects its direction, and
+    continues from there in every direction the deflection table gives, until it leaves the
+    map. Beams are followed as straight segments between deflecting cells, each segment
+    walked once per (cell, direction) it starts from. The segments form a graph in which the
+    strongly connected components are the loops of the beams; the cells reached from a
+    component are the union of its own segments and of the components it leads to, so every
+    component is resolved once, and all entries share the results.
+
+    Parameters
+    ----------
+    textmap : TextMap
+        The map.
+    entries : iterable of (Coordinate, Direction)
+        Cells where beams enter the map, and the direction they move in when entering.
+    deflections : dict of str to dict of Direction to iterable of Direction
+        Per character, the directions a beam continues in per direction it arrives from. An
+        empty iterable absorbs the beam; directions not in the table pass straight through.
+
+    Returns
+    -------
+    list of CellMask
+        The cells passed through by the beam of every entry, empty for entries outside the
+        map.
+    """
+    width, height = textmap.width, textmap.height
+
+    # Positions of the deflecting cells per direction, along every row or column
+    turns: dict[tuple[int, Direction], tuple[Direction, ...]] = {}
+    stops = {
+        direction: [[] for _ in range(height if direction.value[1] == 0 else width)]
+        for direction in Direction
+    }
+    for character, table in deflections.items():
+        for cell, x, y, _ in textmap.cells(character):
+            for direction, turned in table.items():
+                turns[cell, direction] = tuple(turned)
+                if direction.value[1] == 0:
+                    stops[direction][y].append(x)
+                else:
+                    stops[direction][x].append(y)
+    for lines in stops.values():
+        for line in lines:
+            line.sort()
+
+    column = int(("0" * (width - 1) + "1") * height, 2) if width else 0
+    segments: dict[tuple[int, Direction], tuple[int, list[tuple[int, Direction]]]] = {}
+
+    def segment(state: tuple[int, Direction]) -> tuple[int, list[tuple[int, Direction]]]:
+        """Cells of the straight run from a state, and the states after its deflecting cell."""
+        if state in segments:
+            return segments[state]
+
+        cell, direction = state
+        y, x = divmod(cell, width)
+        dx, dy = direction.value
+        if dy == 0:
+            line, position, edge = stops[direction][y], x, width
+        else:
+            line, position, edge = stops[direction][x], y, height
+        if dx + dy > 0:
+            i = bisect_left(line, position)
+            end = line[i] if i < len(line) else None
+            low, high = position, edge - 1 if end is None else end
+        else:
+            i = bisect_right(line, position) - 1
+            end = line[i] if i >= 0 else None
+            low, high = 0 if end is None else end, position
+
+        if dy == 0:
+            bits = ((1 << high - low + 1) - 1) << y * width + low
+        else:
+            bits = (column << x) & ((1 << (high + 1) * width) - (1 << low * width))
+
+        successors = []
+        if end is not None:
+            ex, ey = (end, y) if dy == 0 else (x, end)
+            for turned in turns[ey * width + ex, direction]:
+                nx, ny = ex + turned.value[0], ey + turned.value[1]
+                if 0 <= nx < width and 0 <= ny < height:
+                    successors.append((ny * width + nx, turned))
+
+        segments[state] = bits, successors
+        return bits, successors
+
+    # Tarjan's algorithm, resolving every component as soon as it is complete
+    order: dict[tuple[int, Direction], int] = {}
+    low_link: dict[tuple[int, Direction], int] = {}
+    component: dict[tuple[int, Direction], int] = {}
+    energized: list[int] = []
+    stack: list[tuple[int, Direction]] = []
+
+    def resolve(root: tuple[int, Direction]) -> None:
+        """Find and resolve the components reachable from a state."""
+        order[root] = low_link[root] = len(order)
+        stack.append(root)
+        work = [(root, iter(segment(root)[1]))]
+        while work:
+            state, successors = work[-1]
+            for successor in successors:
+                if successor not in order:
+                    order[successor] = low_link[successor] = len(order)
+                    stack.append(successor)
+                    work.append((successor, iter(segment(successor)[1])))
+                    break
+                if successor not in component:
+                    low_link[state] = min(low_link[state], order[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[state])
+                if low_link[state] == order[state]:
+                    members = []
+                    while not members or members[-1] != state:
+                        members.append(stack.pop())
+                    for member in members:
+                        component[member] = len(energized)
+                    bits = 0
+                    for member in members:
+                        own, successors_of_member = segment(member)
+                        bits |= own
+                        for successor in successors_of_member:
+                            if component[successor] != len(energized):
+                                bits |= energized[component[successor]]
+                    energized.append(bits)
+
+    masks = []
+    for (x, y), direction in entries:
+        if not (0 <= x < width and 0 <= y < height):
+            masks.append(CellMask(width, height))
+            continue
+        state = (y * width + x, direction)
+        if state not in component:
+            resolve(state)
+        masks.append(CellMask(width, height, energized[component[state]]))
+    return masks
@@ -50,6 +50,13 @@ class Loader:
         """Load data as a tuple of tuples of integers."""
         return tuple(tuple(map(int, REGEX_ALL_NUMBERS.findall(line))) for line in self.as_lines())
 
-    def as_textmap(self) -> TextMap:
-        """Load data as TextMap object."""
+    def as_textmap(self, memory_map: bool = False) -> TextMap:
+        """
+        Load data as TextMap object.
+
+        With `memory_map`, the file is mapped into memory instead of read, see
+        `TextMap.from_file`.
+        """
+        if memory_map:
+            return TextMap.from_file(self.path)
         return TextMap(self.as_lines())  # type: ignore
@@ -1,5 +1,6 @@
 """Types used in in AoC."""
 
+from .cell_mask import CellMask
 from .coordinate import Coordinate
 from .direction import Direction
 from .general_types import (
@@ -9,16 +10,29 @@ from .general_types import (
     DijkstraDirectionScoringFunction,
     DijkstraDirectionPathTree,
 )
+from .grid_graph import GridGraph
 from .textmap import TextMap
+from .textmap_view import TextMapView
+from .int_grid import IntGrid
+from .regions import Regions
+from .sparse_textmap import SparseTextMap
+from .token_index import TokenIndex
 
 
 __all__ = [
     "AdjacencyMap",
+    "CellMask",
     "Coordinate",
     "DijkstraPathTree",
     "DijkstraScoringFunction",
     "DijkstraDirectionPathTree",
     "DijkstraDirectionScoringFunction",
     "Direction",
+    "GridGraph",
+    "IntGrid",
+    "Regions",
+    "SparseTextMap",
     "TextMap",
+    "TextMapView",
+    "TokenIndex",
 ]
@@ -0,0 +1,248 @@
+"""Sets of cells of a map, stored as the bits of one integer."""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+from .coordinate import Coordinate
+from .grid_graph import GridGraph
+
+
+class CellMask:
+    """
+    A set of cells of a map, stored as a bitboard.
+
+    Cell (x, y) is bit `y * width + x` of `bits`, so union, intersection and difference of two
+    masks are single integer operations, and the mask takes one bit per cell instead of one
+    Coordinate per member. A mask iterates over its coordinates in reading order and supports
+    `in`. The `aoc.grid` helpers accept a mask in place of an iterable of coordinates, and
+    compile it straight from its bits into a `GridGraph` with `to_graph`, without hashing a
+    Coordinate per cell.
+
+    Attributes
+    ----------
+    bits : int
+        The cells in the mask, as the bits of an integer.
+    """
+
+    def __init__(self, width: int, height: int, bits: int = 0) -> None:
+        """
+        Initialize a mask.
+
+        Parameters
+        ----------
+        width : int
+            Width of the map.
+        height : int
+            Height of the map.
+        bits : int, optional
+            The cells in the mask (default 0, no cells).
+        """
+        self.bits = bits
+        self._width = width
+        self._height = height
+
+    @classmethod
+    def from_coordinates(
+        cls, coordinates: Iterable[Coordinate], width: int, height: int
+    ) -> "CellMask":
+        """
+        Create a mask holding the given cells.
+
+        Parameters
+        ----------
+        coordinates : iterable of Coordinate
+            The cells in the mask.
+        width : int
+            Width of the map.
+        height : int
+            Height of the map.
+
+        Returns
+        -------
+        CellMask
+            A new mask.
+
+        Raises
+        ------
+        IndexError
+            If any of the coordinates is outside the map.
+        """
+        flags = bytearray(b"0") * (width * height)
+        for x, y in coordinates:
+            if not (0 <= x < width and 0 <= y < height):
+                raise IndexError("Coordinates are out of bounds.")
+            flags[y * width + x] = ord("1")
+        return cls(width, height, int(flags[::-1], 2) if flags else 0)
+
+    @property
+    def width(self) -> int:
+        """Width of the map."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Height of the map."""
+        return self._height
+
+    def _check(self, other: "CellMask") -> None:
+        """Raise a ValueError if another mask belongs to a map of another size."""
+        if (self._width, self._height) != (other._width, other._height):
+            raise ValueError("Masks of maps of different sizes can not be combined.")
+
+    def __contains__(self, coordinate: Coordinate) -> bool:
+        """Check if a cell is in the mask."""
+        x, y = coordinate
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return bool(self.bits >> (y * self._width + x) & 1)
+        return False
+
+    def __len__(self) -> int:
+        """Return the number of cells in the mask."""
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        """Check if the mask holds any cell."""
+        return bool(self.bits)
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        """Iterate over the cells in the mask, in reading order."""
+        width = self._width
+        for cell in self.cells():
+            yield Coordinate(cell % width, cell // width)
+
+    def cells(self) -> Iterator[int]:
+        """
+        Iterate over the indices `y * width + x` of the cells in the mask, in reading order.
+
+        Returns
+        -------
+        iterator of int
+            The cell indices.
+        """
+        for match in re.finditer("1", bin(self.bits)[:1:-1]):
+            yield match.start()
+
+    def to_graph(self, diagonal_sides: bool = False) -> GridGraph:
+        """
+        Compile the cells of the mask into a graph of adjacent cells.
+
+        Parameters
+        ----------
+        diagonal_sides : bool, optional
+            Whether diagonally adjacent cells are connected (default False).
+
+        Returns
+        -------
+        GridGraph
+            The graph of the cells, with node ids in reading order.
+        """
+        return GridGraph.from_cells(
+            self.cells(), self._width, self._height, diagonal_sides=diagonal_sides
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Check if two masks hold the same cells of maps of the same size."""
+        if not isinstance(other, CellMask):
+            return NotImplemented
+        return (self.bits, self._width, self._height) == (other.bits, other._width, other._height)
+
+    def __or__(self, other: "CellMask") -> "CellMask":
+        """Return the union of two masks."""
+        self._check(other)
+        return CellMask(self._width, self._height, self.bits | other.bits)
+
+    def __and__(self, other: "CellMask") -> "CellMask":
+        """Return the intersection of two masks."""
+        self._check(other)
+        return CellMask(self._width, self._height, self.bits & other.bits)
+
+    def __sub__(self, other: "CellMask") -> "CellMask":
+        """Return the cells of this mask that are not in the other mask."""
+        self._check(other)
+        return CellMask(self._width, self._height, self.bits & ~other.bits)
+
+    def __xor__(self, other: "CellMask") -> "CellMask":
+        """Return the cells that are in exactly one of the masks."""
+        self._check(other)
+        return CellMask(self._width, self._height, self.bits ^ other.bits)
+
+    def __invert__(self) -> "CellMask":
+        """Return the cells of the map that are not in the mask."""
+        full = (1 << (self._width * self._height)) - 1
+        return CellMask(self._width, self._height, self.bits ^ full)
+
+    def __repr__(self) -> str:
+        """Return a short description of the mask."""
+        return f"CellMask({self._width}x{self._height}, {len(self)} cells)"
+
+    def shift(self, dx: int, dy: int) -> "CellMask":
+        """
+        Move every cell of the mask by an offset, dropping the cells moved off the map.
+
+        Parameters
+        ----------
+        dx : int
+            Offset along the x-axis, positive to the right.
+        dy : int
+            Offset along the y-axis, positive downwards.
+
+        Returns
+        -------
+        CellMask
+            A new mask with cell (x + dx, y + dy) for every cell (x, y) that stays on the map.
+        """
+        width, height = self._width, self._height
+        if abs(dx) >= width or abs(dy) >= height:
+            return CellMask(width, height)
+
+        bits = self.bits
+        if dx > 0:
+            bits = (bits & _columns(width, height, 0, width - dx)) << dx
+        elif dx < 0:
+            bits = (bits & _columns(width, height, -dx, width)) >> -dx
+        if dy > 0:
+            bits = (bits << dy * width) & ((1 << width * height) - 1)
+        elif dy < 0:
+            bits >>= -dy * width
+        return CellMask(width, height, bits)
+
+    def add(self, coordinate: Coordinate) -> None:
+        """
+        Add a cell to the mask.
+
+        Parameters
+        ----------
+        coordinate : Coordinate
+            The cell to add.
+
+        Raises
+        ------
+        IndexError
+            If the cell is outside the map.
+        """
+        x, y = coordinate
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise IndexError("Coordinates are out of bounds.")
+        self.bits |= 1 << (y * self._width + x)
+
+    def discard(self, coordinate: Coordinate) -> None:
+        """
+        Remove a cell from the mask, if it is in it.
+
+        Parameters
+        ----------
+        coordinate : Coordinate
+            The cell to remove.
+        """
+        if coordinate in self:
+            x, y = coordinate
+            self.bits &= ~(1 << (y * self._width + x))
+
+
+@lru_cache(maxsize=64)
+def _columns(width: int, height: int, start: int, stop: int) -> int:
+    """Bits of the cells in columns `start` up to `stop` (exclusive) of every row."""
+    row = (1 << stop) - (1 << start)
+    rows = int(("0" * (width - 1) + "1") * height, 2)
+    return row * rows
@@ -0,0 +1,229 @@
+"""Compact graph of grid cells in compressed sparse row (CSR) form."""
+
+from array import array
+from typing import Iterable
+
+from .coordinate import Coordinate
+
+
+_CROSS_DELTAS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIAGONAL_DELTAS = ((1, 1), (-1, 1), (1, -1), (-1, -1))
+
+
+class GridGraph:
+    """
+    Graph of grid cells, connected to their adjacent cells, in compressed sparse row form.
+
+    Every cell is a node with an integer id, numbered in reading order. The neighbours of node
+    `n` are `adjacency[offsets[n]:offsets[n + 1]]`, so searches on the graph only touch flat
+    integer arrays instead of hashing coordinate tuples.
+
+    Attributes
+    ----------
+    offsets : array of int
+        Start of the neighbours of every node in `adjacency`, with one extra trailing entry.
+    adjacency : array of int
+        Node ids of the neighbours of all nodes, back to back.
+    diagonal_sides : bool
+        Whether diagonally adjacent cells are connected.
+    wrap : bool
+        Whether cells on opposite edges of the grid are connected.
+    """
+
+    def __init__(self, coordinates: Iterable[Coordinate], diagonal_sides: bool = False) -> None:
+        """
+        Build the graph of a set of coordinates.
+
+        Parameters
+        ----------
+        coordinates : Iterable[Coordinate]
+            The cells of the graph.
+        diagonal_sides : bool, optional
+            Whether diagonally adjacent cells are connected (default False).
+        """
+        coordinates = set(coordinates)
+        if coordinates:
+            min_x = min(x for x, _ in coordinates)
+            min_y = min(y for _, y in coordinates)
+            width = max(x for x, _ in coordinates) - min_x + 1
+            height = max(y for _, y in coordinates) - min_y + 1
+            cells = sorted((y - min_y) * width + x - min_x for x, y in coordinates)
+        else:
+            min_x = min_y = width = height = 0
+            cells = []
+
+        self._build(cells, width, height, (min_x, min_y), diagonal_sides, False)
+
+    @classmethod
+    def from_cells(
+        cls,
+        cells: Iterable[int],
+        width: int,
+        height: int,
+        origin: Coordinate = (0, 0),
+        diagonal_sides: bool = False,
+        wrap: bool = False,
+    ) -> "GridGraph":
+        """
+        Build the graph of cells given as flat indices into a rectangular grid.
+
+        Parameters
+        ----------
+        cells : Iterable[int]
+            Flat indices `y * width + x` of the cells, in ascending order.
+        width : int
+            Width of the grid.
+        height : int
+            Height of the grid.
+        origin : Coordinate, optional
+            Coordinate of the top-left corner of the grid (default (0, 0)).
+        diagonal_sides : bool, optional
+            Whether diagonally adjacent cells are connected (default False).
+        wrap : bool, optional
+            Whether cells on opposite edges of the grid are connected, as on a torus
+            (default False).
+
+        Returns
+        -------
+        GridGraph
+            The graph of the cells.
+        """
+        graph = cls.__new__(cls)
+        graph._build(cells, width, height, origin, diagonal_sides, wrap)
+        return graph
+
+    def _build(
+        self,
+        cells: Iterable[int],
+        width: int,
+        height: int,
+        origin: Coordinate,
+        diagonal_sides: bool,
+        wrap: bool,
+    ) -> None:
+        """Fill the node and edge arrays of the graph."""
+        cells = list(cells)
+        min_x, min_y = origin
+        deltas = _CROSS_DELTAS + _DIAGONAL_DELTAS if diagonal_sides else _CROSS_DELTAS
+
+        node_of_cell = array("q", [-1]) * (width * height)
+        for node, cell in enumerate(cells):
+            node_of_cell[cell] = node
+
+        # Look up neighbours in a copy with a border around it, so that a neighbour is a fixed
+        # offset away and no bounds checks are needed. The border holds non-nodes, or when
+        # wrapping, the nodes of the opposite edge.
+        padded_width = width + 2
+        padded = array("q", [-1]) * (padded_width * (height + 2))
+        for y in range(height):
+            start = (y + 1) * padded_width + 1
+            padded[start : start + width] = node_of_cell[y * width : (y + 1) * width]
+            if wrap:
+                padded[start - 1] = node_of_cell[(y + 1) * width - 1]
+                padded[start + width] = node_of_cell[y * width]
+        if wrap and height:
+            last_row = height * padded_width
+            padded[:padded_width] = padded[last_row : last_row + padded_width]
+            padded[last_row + padded_width :] = padded[padded_width : 2 * padded_width]
+        shifts = [dy * padded_width + dx for dx, dy in deltas]
+
+        offsets = [0]
+        adjacency = []
+        for ix in [cell + (cell // width) * 2 + padded_width + 1 for cell in cells]:
+            neighbours = [n for n in [padded[ix + shift] for shift in shifts] if n >= 0]
+            if wrap:
+                # On narrow grids, wrapping can reach the same cell from several sides
+                node = padded[ix]
+                neighbours = [n for n in dict.fromkeys(neighbours) if n != node]
+            adjacency.extend(neighbours)
+            offsets.append(len(adjacency))
+
+        self.offsets = array("q", offsets)
+        self.adjacency = array("q", adjacency)
+        self.diagonal_sides = diagonal_sides
+        self.wrap = wrap
+        self._cells = cells
+        self._node_of_cell = node_of_cell
+        self._grid = (min_x, min_y, width, height)
+        self._coordinates: list[Coordinate] | None = None
+
+    @property
+    def coordinates(self) -> list[Coordinate]:
+        """Coordinate of every node, indexed by node id."""
+        if self._coordinates is None:
+            self._coordinates = [self.coordinate(node) for node in range(len(self._cells))]
+        return self._coordinates
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self._cells)
+
+    def __contains__(self, coordinate: Coordinate) -> bool:
+        """Check if a coordinate is a node of the graph."""
+        return self._node(coordinate) >= 0
+
+    def _node(self, coordinate: Coordinate) -> int:
+        """Return the node id of a coordinate, or -1 if it is not a node."""
+        min_x, min_y, width, height = self._grid
+        x, y = coordinate[0] - min_x, coordinate[1] - min_y
+        if 0 <= x < width and 0 <= y < height:
+            return self._node_of_cell[y * width + x]
+        return -1
+
+    def node(self, coordinate: Coordinate) -> int:
+        """
+        Get the node id of a coordinate.
+
+        Parameters
+        ----------
+        coordinate : Coordinate
+            Coordinate of the node.
+
+        Returns
+        -------
+        int
+            The node id.
+
+        Raises
+        ------
+        KeyError
+            If the coordinate is not a node of the graph.
+        """
+        node = self._node(coordinate)
+        if node < 0:
+            raise KeyError(coordinate)
+        return node
+
+    def coordinate(self, node: int) -> Coordinate:
+        """
+        Get the coordinate of a node.
+
+        Parameters
+        ----------
+        node : int
+            The node id.
+
+        Returns
+        -------
+        Coordinate
+            Coordinate of the node.
+        """
+        min_x, min_y, width, _ = self._grid
+        y, x = divmod(self._cells[node], width)
+        return Coordinate(x + min_x, y + min_y)
+
+    def neighbours(self, node: int) -> array:
+        """
+        Get the node ids of the neighbours of a node.
+
+        Parameters
+        ----------
+        node : int
+            The node id.
+
+        Returns
+        -------
+        array of int
+            Node ids of the neighbours.
+        """
+        return self.adjacency[self.offsets[node] : self.offsets[node + 1]]
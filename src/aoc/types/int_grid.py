@@ -0,0 +1,341 @@
+"""Module for working with grids of small integers."""
+
+from array import array
+from typing import TYPE_CHECKING, Iterable
+
+from .coordinate import Coordinate
+from .general_types import Bounds
+from .textmap import TextMap
+from ..grid.within_bounds import within_bounds
+
+if TYPE_CHECKING:
+    import numpy
+
+
+_TYPECODES = ("b", "h", "i")
+_DIGITS = b"0123456789"
+
+
+class IntGrid:
+    """
+    Holds and manipulates a grid of small integers, such as heights, costs or risk levels.
+
+    The grid is stored row after row in a flat `array`, with one signed integer of 1 ('b'),
+    2 ('h') or 4 ('i') bytes per cell, so reading a cell never parses a string.
+    """
+
+    def __init__(self, width: int, height: int, fill: int = 0, typecode: str = "b") -> None:
+        """
+        Initialize a grid with every cell set to the same value.
+
+        Parameters
+        ----------
+        width : int
+            Width of the grid.
+        height : int
+            Height of the grid.
+        fill : int, optional
+            Value of every cell (default 0).
+        typecode : str, optional
+            Array typecode of the cells: "b", "h" or "i" (default "b", -128 to 127).
+
+        Raises
+        ------
+        ValueError
+            If the typecode is not supported.
+        """
+        if typecode not in _TYPECODES:
+            raise ValueError(f"Typecode must be one of {', '.join(_TYPECODES)}.")
+
+        self._data = array(typecode, [fill]) * (width * height)
+        self._n_columns = width
+        self._n_rows = height
+
+    @classmethod
+    def from_textmap(cls, textmap: TextMap, non_digit: int = -1, typecode: str = "b") -> "IntGrid":
+        """
+        Create a grid from a map of digits.
+
+        Parameters
+        ----------
+        textmap : TextMap
+            Map with one digit per cell.
+        non_digit : int, optional
+            Value of cells that do not hold a digit (default -1).
+        typecode : str, optional
+            Array typecode of the cells: "b", "h" or "i" (default "b").
+
+        Returns
+        -------
+        IntGrid
+            A new grid with the value of every digit.
+
+        Raises
+        ------
+        ValueError
+            If the typecode is not supported, or the non digit value does not fit it.
+        """
+        grid = cls(0, 0, typecode=typecode)
+        bits = 8 * grid._data.itemsize
+        if not -(1 << bits - 1) <= non_digit < 1 << bits - 1:
+            raise ValueError(f"Non digit value {non_digit} does not fit typecode {typecode!r}.")
+
+        cells = textmap.codes()
+        if typecode == "b" and isinstance(cells, bytearray):
+            # Translate the characters to the bytes of their values in one pass
+            values = bytearray((non_digit & 0xFF,)) * 256
+            values[_DIGITS[0] : _DIGITS[-1] + 1] = range(10)
+            grid._data.frombytes(cells.translate(values))
+        else:
+            digits = {code: value for value, code in enumerate(_DIGITS)}
+            grid._data.extend(digits.get(code, non_digit) for code in cells)
+
+        grid._n_columns, grid._n_rows = textmap.width, textmap.height
+        return grid
+
+    @property
+    def width(self) -> int:
+        """Width of the grid."""
+        return self._n_columns
+
+    @property
+    def height(self) -> int:
+        """Height of the grid."""
+        return self._n_rows
+
+    @property
+    def bounds(self) -> Bounds:
+        """Bounds of the grid as (min_x, min_y, max_x, max_y)."""
+        return 0, 0, self._n_columns - 1, self._n_rows - 1
+
+    def get(
+        self, x: int | Coordinate, y: int | None = None, out_of_bounds_value: int | None = None
+    ) -> int:
+        """
+        Get the value at the given coordinates.
+
+        Parameters
+        ----------
+        x : int | Coordinate
+            X-coordinate (column) as an integer or a tuple containing (x, y).
+        y : int, optional
+            Y-coordinate (row). Required if `x` is an integer.
+        out_of_bounds_value : int, optional
+            Value to return if coordinates are out of bounds.
+
+        Returns
+        -------
+        int
+            Value at the specified coordinates.
+
+        Raises
+        ------
+        ValueError
+            If the coordinates are out of bounds and no `out_of_bounds_value` is provided.
+        """
+        if isinstance(x, tuple):
+            x, y = x
+
+        if not (0 <= x < self._n_columns and 0 <= y < self._n_rows):
+            if out_of_bounds_value is not None:
+                return out_of_bounds_value
+            raise ValueError(f"Coordinates ({x}, {y}) are out of bounds.")
+
+        return self._data[y * self._n_columns + x]
+
+    def get_many(
+        self, coordinates: Iterable[Coordinate], out_of_bounds_value: int | None = None
+    ) -> tuple[int, ...]:
+        """
+        Get values at the given coordinates.
+
+        Parameters
+        ----------
+        coordinates : list of (x, y)
+            Coordinates to fetch.
+        out_of_bounds_value : int, optional
+            Value to return for coordinates that are out of bounds.
+
+        Returns
+        -------
+        tuple of int
+            Values at the given coordinates.
+        """
+        return tuple(self.get(x, y, out_of_bounds_value) for x, y in coordinates)
+
+    def set(self, x: int | Coordinate, y: int | None = None, value: int = ...) -> None:
+        """
+        Set the value at the given coordinates.
+
+        Parameters
+        ----------
+        x : int or Coordinate
+            X-coordinate (column) or a tuple of (x, y) coordinates.
+        y : int, optional
+            Y-coordinate (row). Required if `x` is an integer.
+        value : int
+            Value to place at the specified coordinates.
+
+        Raises
+        ------
+        TypeError
+            If arguments do not match expected types.
+        IndexError
+            If the coordinates are out of bounds.
+        OverflowError
+            If the value does not fit the typecode of the grid.
+        """
+        if isinstance(x, tuple):
+            if value is not ...:
+                raise TypeError("When providing a tuple for coordinates, do not provide 'y'.")
+            (x, y), value = x, y
+        elif not (isinstance(x, int) and isinstance(y, int)):
+            raise TypeError("set() expects either two integers (x, y) or a single tuple (x, y).")
+
+        if not (0 <= x < self._n_columns and 0 <= y < self._n_rows):
+            raise IndexError("Coordinates are out of bounds.")
+
+        self._data[y * self._n_columns + x] = value
+
+    def set_many(self, coordinates: Iterable[Coordinate], value: int) -> None:
+        """
+        Set the value at the given coordinates.
+
+        Parameters
+        ----------
+        coordinates : list of (x, y)
+            Coordinates to set.
+        value : int
+            Value to place at the coordinates.
+
+        Raises
+        ------
+        IndexError
+            If any of the coordinates is out of bounds.
+        """
+        data, width, height = self._data, self._n_columns, self._n_rows
+        for x, y in coordinates:
+            if not (0 <= x < width and 0 <= y < height):
+                raise IndexError("Coordinates are out of bounds.")
+            data[y * width + x] = value
+
+    def find(self, value: int) -> Coordinate:
+        """
+        Find the first occurrence of a value.
+
+        Parameters
+        ----------
+        value : int
+            Value to find.
+
+        Returns
+        -------
+        Coordinate
+            Coordinates (x, y) of the value.
+
+        Raises
+        ------
+        ValueError
+            If the value is not in the grid.
+        """
+        try:
+            cell = self._data.index(value)
+        except ValueError:
+            raise ValueError(f"{value} not found in grid.") from None
+
+        y, x = divmod(cell, self._n_columns)
+        return Coordinate(x, y)
+
+    def find_all(self, value: int) -> list[Coordinate]:
+        """
+        Find all occurrences of a value.
+
+        Parameters
+        ----------
+        value : int
+            Value to find.
+
+        Returns
+        -------
+        list of Coordinate
+            All coordinates (x, y) of the value, in reading order.
+        """
+        width = self._n_columns
+        if self._data.itemsize == 1:
+            if not -128 <= value <= 127:
+                return []
+            cells, code, cell = self._data.tobytes(), value & 0xFF, -1
+            positions = []
+            while (cell := cells.find(code, cell + 1)) >= 0:
+                positions.append(cell)
+        else:
+            positions = [cell for cell, cell_value in enumerate(self._data) if cell_value == value]
+
+        return [Coordinate(cell % width, cell // width) for cell in positions]
+
+    def within_bounds(self, coordinates: Coordinate | Iterable[Coordinate]) -> bool:
+        """
+        Check if the coordinates are inside the grid.
+
+        Parameters
+        ----------
+        coordinates : Coordinate or iterable of Coordinate
+            Coordinates to check.
+
+        Returns
+        -------
+        bool
+            True if all coordinates are inside the grid, False otherwise.
+        """
+        return within_bounds(coordinates, self.bounds)
+
+    def copy(self) -> "IntGrid":
+        """
+        Create a copy of the grid.
+
+        Returns
+        -------
+        IntGrid
+            A new grid with the same values.
+        """
+        grid = IntGrid(0, 0, typecode=self._data.typecode)
+        grid._data = self._data[:]
+        grid._n_columns, grid._n_rows = self._n_columns, self._n_rows
+        return grid
+
+    def as_lines(self) -> list[str]:
+        """
+        Return the grid as lines of values separated by spaces.
+
+        Returns
+        -------
+        list of str
+            The rows of the grid.
+        """
+        width = self._n_columns
+        return [
+            " ".join(map(str, self._data[row : row + width]))
+            for row in range(0, width * self._n_rows, width)
+        ]
+
+    def to_array(self) -> "numpy.ndarray":
+        """
+        Expose the grid as a 2D NumPy array, without copying.
+
+        Returns
+        -------
+        numpy.ndarray
+            View on the grid of shape (height, width), sharing its memory.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("NumPy is required to convert an IntGrid to an array.") from e
+
+        dtype = {1: np.int8, 2: np.int16, 4: np.int32}[self._data.itemsize]
+        return np.frombuffer(self._data, dtype=dtype).reshape(self._n_rows, self._n_columns)
@@ -0,0 +1,119 @@
+"""Connected regions of equal characters in a map, with a cell to region label grid."""
+
+from array import array
+
+from .coordinate import Coordinate
+from .general_types import Bounds
+
+
+class Regions:
+    """
+    Connected regions of equal characters in a map, and which region every cell belongs to.
+
+    Regions are numbered in reading order of their top-left-most cell. Every cell of the map is
+    labelled with the id of its region.
+
+    Attributes
+    ----------
+    labels : array of int
+        Region id of cell (x, y) at `y * width + x`.
+    characters : list of str
+        Character of every region, indexed by region id.
+    sizes : list of int
+        Number of cells of every region.
+    bounds : list of Bounds
+        Bounding box (min_x, min_y, max_x, max_y) of every region.
+    """
+
+    def __init__(
+        self,
+        labels: array,
+        width: int,
+        characters: list[str],
+        sizes: list[int],
+        bounds: list[Bounds],
+    ) -> None:
+        """
+        Initialize the regions of a map.
+
+        Parameters
+        ----------
+        labels : array of int
+            Region id of every cell, row after row.
+        width : int
+            Width of the map.
+        characters : list of str
+            Character of every region.
+        sizes : list of int
+            Number of cells of every region.
+        bounds : list of Bounds
+            Bounding box of every region.
+        """
+        self.labels = labels
+        self.characters = characters
+        self.sizes = sizes
+        self.bounds = bounds
+        self._width = width
+        self._height = len(labels) // width if width else 0
+
+    def __len__(self) -> int:
+        """Return the number of regions."""
+        return len(self.characters)
+
+    def label(self, coordinate: Coordinate) -> int:
+        """
+        Get the id of the region of a cell.
+
+        Parameters
+        ----------
+        coordinate : Coordinate
+            Coordinate of the cell.
+
+        Returns
+        -------
+        int
+            The region id, or -1 if the cell is outside the map.
+        """
+        x, y = coordinate
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return self.labels[y * self._width + x]
+        return -1
+
+    def coordinates(self, region: int) -> list[Coordinate]:
+        """
+        Get the cells of a region, scanning only its bounding box.
+
+        Parameters
+        ----------
+        region : int
+            The region id.
+
+        Returns
+        -------
+        list of Coordinate
+            Coordinates of the cells of the region, in reading order.
+        """
+        min_x, min_y, max_x, max_y = self.bounds[region]
+        labels, width = self.labels, self._width
+        return [
+            Coordinate(x, y)
+            for y in range(min_y, max_y + 1)
+            for x, label in enumerate(labels[y * width + min_x : y * width + max_x + 1], min_x)
+            if label == region
+        ]
+
+    def groups(self) -> list[set[Coordinate]]:
+        """
+        Get the cells of every region, in one pass over the labels.
+
+        Returns
+        -------
+        list of set of Coordinate
+            Coordinates of the cells per region, indexed by region id.
+        """
+        groups: list[set[Coordinate]] = [set() for _ in self.characters]
+        width = self._width
+        for cell, label in enumerate(self.labels):
+            y, x = divmod(cell, width)
+            groups[label].add(Coordinate(x, y))
+        return groups
@@ -0,0 +1,439 @@
+"""Module for working with sparse, unbounded ASCII maps."""
+
+from array import array
+from typing import Iterable
+
+from .coordinate import Coordinate
+from .general_types import Bounds
+from .textmap import TextMap
+
+
+# Chunks of maps that only hold Latin-1 characters are stored as one byte per cell. As soon as a
+# wider character is written, every chunk is widened to one 32-bit code point per cell.
+_WIDE_TYPECODE = "I"
+_MAX_NARROW_CODE = 0xFF
+
+
+class SparseTextMap:
+    """
+    Holds and manipulates a sparse ASCII map of unbounded size.
+
+    The map is split into square chunks of `chunk_size` by `chunk_size` cells, which are only
+    allocated once a cell in them is set to something other than the fill character, and are
+    dropped again when they only hold the fill character. Coordinates can be negative, and the
+    map grows in any direction when cells are set.
+    """
+
+    def __init__(self, fill: str = " ", chunk_size: int = 64) -> None:
+        """
+        Initialize an empty map.
+
+        Parameters
+        ----------
+        fill : str, optional
+            Character of every cell that was never set (default is space).
+        chunk_size : int, optional
+            Width and height of a chunk, must be a power of two (default 64).
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is not a power of two.
+        """
+        if chunk_size < 1 or chunk_size & (chunk_size - 1):
+            raise ValueError("chunk_size must be a power of two.")
+
+        self._fill = ord(fill)
+        self._chunk_size = chunk_size
+        self._shift = chunk_size.bit_length() - 1
+        self._mask = chunk_size - 1
+        self._wide = self._fill > _MAX_NARROW_CODE
+        # Chunks keyed by (chunk_x, chunk_y), with the number of cells that are not fill.
+        self._chunks: dict[tuple[int, int], bytearray | array] = {}
+        self._counts: dict[tuple[int, int], int] = {}
+        # Bounds of the cells that are not fill, kept until a write can shrink them.
+        self._bounds: Bounds | None = None
+
+    @classmethod
+    def from_textmap(
+        cls, textmap: TextMap, fill: str = " ", chunk_size: int = 64
+    ) -> "SparseTextMap":
+        """
+        Create a sparse map holding the cells of a TextMap.
+
+        Parameters
+        ----------
+        textmap : TextMap
+            The map to copy, with its top-left cell at (0, 0).
+        fill : str, optional
+            Character that is not stored (default is space).
+        chunk_size : int, optional
+            Width and height of a chunk, must be a power of two (default 64).
+
+        Returns
+        -------
+        SparseTextMap
+            A new sparse map.
+        """
+        sparse = cls(fill, chunk_size)
+        for value, coordinates in textmap.find_all_many().items():
+            if value != fill:
+                sparse.set_many(coordinates, value)
+        return sparse
+
+    def _new_chunk(self) -> bytearray | array:
+        """Return a chunk holding only the fill character."""
+        cells = self._chunk_size * self._chunk_size
+        if self._wide:
+            return array(_WIDE_TYPECODE, [self._fill]) * cells
+        return bytearray([self._fill]) * cells
+
+    def _widen(self) -> None:
+        """Convert all chunks to code point chunks, to hold non Latin-1 characters."""
+        if not self._wide:
+            self._wide = True
+            for key, chunk in self._chunks.items():
+                self._chunks[key] = array(_WIDE_TYPECODE, iter(chunk))
+
+    def _write(self, x: int, y: int, code: int) -> None:
+        """Write a character code to a cell, allocating or dropping its chunk as needed."""
+        key = (x >> self._shift, y >> self._shift)
+        ix = ((y & self._mask) << self._shift) | (x & self._mask)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            if code == self._fill:
+                return
+            chunk = self._chunks[key] = self._new_chunk()
+            self._counts[key] = 0
+
+        previous = chunk[ix]
+        if previous == code:
+            return
+
+        chunk[ix] = code
+        bounds = self._bounds
+        if bounds is not None:
+            min_x, min_y, max_x, max_y = bounds
+            if code != self._fill:
+                if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                    self._bounds = (min(min_x, x), min(min_y, y), max(max_x, x), max(max_y, y))
+            elif x == min_x or x == max_x or y == min_y or y == max_y:
+                self._bounds = None
+
+        if previous == self._fill:
+            self._counts[key] += 1
+        elif code == self._fill:
+            self._counts[key] -= 1
+            if not self._counts[key]:
+                del self._chunks[key], self._counts[key]
+
+    def _cells(self, chunk_key: tuple[int, int], code: int) -> Iterable[Coordinate]:
+        """Yield the coordinates of the cells in a chunk holding a character code."""
+        chunk = self._chunks[chunk_key]
+        base_x, base_y = chunk_key[0] << self._shift, chunk_key[1] << self._shift
+        if self._wide:
+            positions = (ix for ix, c in enumerate(chunk) if c == code)
+        else:
+            positions = _find_byte(chunk, code)
+        for ix in positions:
+            yield Coordinate(base_x + (ix & self._mask), base_y + (ix >> self._shift))
+
+    @property
+    def fill(self) -> str:
+        """Character of every cell that was never set."""
+        return chr(self._fill)
+
+    @property
+    def bounds(self) -> Bounds:
+        """
+        Bounds of the cells that are not fill, as (min_x, min_y, max_x, max_y).
+
+        The bounds are computed once and then kept up to date by writes; only clearing a cell on
+        the edge of the bounds makes the next call scan the chunks again.
+
+        Raises
+        ------
+        ValueError
+            If every cell of the map is fill.
+        """
+        if not self._chunks:
+            raise ValueError("The map holds only fill characters.")
+        if self._bounds is not None:
+            return self._bounds
+
+        min_x = min_y = float("inf")
+        max_x = max_y = -float("inf")
+        for key, chunk in self._chunks.items():
+            base_x, base_y = key[0] << self._shift, key[1] << self._shift
+            if (
+                base_x >= min_x
+                and base_y >= min_y
+                and base_x + self._mask <= max_x
+                and base_y + self._mask <= max_y
+            ):
+                continue
+            for ix, code in enumerate(chunk):
+                if code != self._fill:
+                    x, y = base_x + (ix & self._mask), base_y + (ix >> self._shift)
+                    min_x, max_x = min(min_x, x), max(max_x, x)
+                    min_y, max_y = min(min_y, y), max(max_y, y)
+        self._bounds = (min_x, min_y, max_x, max_y)
+        return self._bounds
+
+    @property
+    def width(self) -> int:
+        """Width of the bounds of the map, 0 if the map holds only fill characters."""
+        if not self._chunks:
+            return 0
+        min_x, _, max_x, _ = self.bounds
+        return max_x - min_x + 1
+
+    @property
+    def height(self) -> int:
+        """Height of the bounds of the map, 0 if the map holds only fill characters."""
+        if not self._chunks:
+            return 0
+        _, min_y, _, max_y = self.bounds
+        return max_y - min_y + 1
+
+    def get(self, x: int | Coordinate, y: int | None = None) -> str:
+        """
+        Get the character at the given coordinates.
+
+        Parameters
+        ----------
+        x : int | Coordinate
+            X-coordinate (column) as an integer or a tuple containing (x, y).
+        y : int, optional
+            Y-coordinate (row). Required if `x` is an integer.
+
+        Returns
+        -------
+        str
+            Character at the specified coordinates, the fill character if it was never set.
+        """
+        if isinstance(x, tuple):
+            x, y = x
+
+        chunk = self._chunks.get((x >> self._shift, y >> self._shift))
+        if chunk is None:
+            return chr(self._fill)
+        return chr(chunk[((y & self._mask) << self._shift) | (x & self._mask)])
+
+    def get_many(self, coordinates: Iterable[Coordinate]) -> tuple[str, ...]:
+        """
+        Get characters at the given coordinates.
+
+        Parameters
+        ----------
+        coordinates : list of (x, y)
+            Coordinates to fetch.
+
+        Returns
+        -------
+        tuple of str
+            Characters at the given coordinates.
+        """
+        return tuple(self.get(x, y) for x, y in coordinates)
+
+    def set(self, x: int | Coordinate, y: int | str | None = None, value: str = ...) -> None:
+        """
+        Set the character at the given coordinates.
+
+        Parameters
+        ----------
+        x : int or Coordinate
+            X-coordinate (column) or a tuple of (x, y) coordinates.
+        y : int, optional
+            Y-coordinate (row). Required if `x` is an integer.
+        value : str
+            Character to place at the specified coordinates.
+
+        Raises
+        ------
+        TypeError
+            If arguments do not match expected types.
+        """
+        if isinstance(x, tuple):
+            if not isinstance(y, str):
+                raise TypeError("When providing a tuple for coordinates, do not provide 'y'.")
+            (x, y), value = x, y
+        elif not (isinstance(x, int) and isinstance(y, int)):
+            raise TypeError("set() expects either two integers (x, y) or a single tuple (x, y).")
+
+        code = ord(value)
+        if code > _MAX_NARROW_CODE:
+            self._widen()
+        self._write(x, y, code)
+
+    def set_many(self, coordinates: Iterable[Coordinate], value: str) -> None:
+        """
+        Set the character at the given coordinates.
+
+        Parameters
+        ----------
+        coordinates : list of (x, y)
+            Coordinates to set.
+        value : str
+            Character to place at the coordinates.
+        """
+        code = ord(value)
+        if code > _MAX_NARROW_CODE:
+            self._widen()
+
+        write = self._write
+        for x, y in coordinates:
+            write(x, y, code)
+
+    def find(self, value: str) -> Coordinate:
+        """
+        Find the first occurrence of a character, in reading order.
+
+        Parameters
+        ----------
+        value : str
+            Character to find.
+
+        Returns
+        -------
+        Coordinate
+            Coordinates (x, y) of the character.
+
+        Raises
+        ------
+        ValueError
+            If the character is not found, or is the fill character.
+        """
+        code = ord(value)
+        if code == self._fill:
+            raise ValueError("The fill character occurs everywhere outside the set cells.")
+
+        chunk_rows: dict[int, list[tuple[int, int]]] = {}
+        for key in self._chunks:
+            chunk_rows.setdefault(key[1], []).append(key)
+
+        for chunk_y in sorted(chunk_rows):
+            coordinates = [c for key in chunk_rows[chunk_y] for c in self._cells(key, code)]
+            if coordinates:
+                return min(coordinates, key=lambda c: (c[1], c[0]))
+
+        raise ValueError(f"'{value}' not found in map.")
+
+    def find_all(self, value: str) -> list[Coordinate]:
+        """
+        Find all occurrences of a character.
+
+        Parameters
+        ----------
+        value : str
+            Character to find.
+
+        Returns
+        -------
+        list of Coordinate
+            All coordinates (x, y) of the character, in reading order.
+
+        Raises
+        ------
+        ValueError
+            If `value` is the fill character, which occurs an unbounded number of times.
+        """
+        if len(value) != 1:
+            return []
+        code = ord(value)
+        if code == self._fill:
+            raise ValueError("The fill character occurs everywhere outside the set cells.")
+
+        coordinates = [c for key in self._chunks for c in self._cells(key, code)]
+        coordinates.sort(key=lambda c: (c[1], c[0]))
+        return coordinates
+
+    def find_all_many(self, values: Iterable[str] | None = None) -> dict[str, list[Coordinate]]:
+        """
+        Find all occurrences of several characters.
+
+        Parameters
+        ----------
+        values : iterable of str, optional
+            Characters to find. If None, all characters that are not fill are returned.
+
+        Returns
+        -------
+        dict of str to list of Coordinate
+            All coordinates (x, y) per character, in reading order.
+        """
+        if values is None:
+            codes = set()
+            for chunk in self._chunks.values():
+                codes.update(chunk)
+            codes.discard(self._fill)
+            values = [chr(code) for code in sorted(codes)]
+        return {value: self.find_all(value) for value in values}
+
+    def to_textmap(self) -> TextMap:
+        """
+        Convert the bounds of the map into a TextMap.
+
+        Returns
+        -------
+        TextMap
+            A dense map of the cells within `bounds`, with `(min_x, min_y)` moved to (0, 0).
+        """
+        if not self._chunks:
+            return TextMap([])
+
+        min_x, min_y, max_x, max_y = self.bounds
+        textmap = TextMap.new(max_x - min_x + 1, max_y - min_y + 1, chr(self._fill))
+        for value, coordinates in self.find_all_many().items():
+            textmap.set_many(((x - min_x, y - min_y) for x, y in coordinates), value)
+        return textmap
+
+    def as_lines(self) -> list[str]:
+        """
+        Return the cells within `bounds` as a list of strings.
+
+        Returns
+        -------
+        list of str
+            The rows of the map.
+        """
+        return self.to_textmap().as_lines()
+
+    def as_string(self) -> str:
+        """
+        Return the cells within `bounds` as one string, without line breaks.
+
+        Returns
+        -------
+        str
+            The map as a single string.
+        """
+        return self.to_textmap().as_string()
+
+    def show(self) -> None:
+        """Print the cells within `bounds` to stdout."""
+        self.to_textmap().show()
+
+    def copy(self) -> "SparseTextMap":
+        """
+        Create a copy of the map.
+
+        Returns
+        -------
+        SparseTextMap
+            A new map object with the same cells.
+        """
+        sparse = SparseTextMap(chr(self._fill), self._chunk_size)
+        sparse._wide = self._wide
+        sparse._chunks = {key: chunk[:] for key, chunk in self._chunks.items()}
+        sparse._counts = dict(self._counts)
+        sparse._bounds = self._bounds
+        return sparse
+
+
+def _find_byte(chunk: bytearray, code: int) -> Iterable[int]:
+    """Yield the positions of a byte in a chunk."""
+    ix = chunk.find(code)
+    while ix >= 0:
+        yield ix
+        ix = chunk.find(code, ix + 1)
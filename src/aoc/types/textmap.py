@@ -1,15 +1,53 @@
 """Module for working with ASCII maps."""
 
+from array import array
+from functools import lru_cache
+from itertools import accumulate, repeat
+from operator import add
+import mmap
+import os
+from pathlib import Path
 import re
-from typing import Iterable
+import sys
+import weakref
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
+from .cell_mask import CellMask
 from .coordinate import Coordinate
 from .general_types import Bounds
+from .grid_graph import GridGraph
+from .textmap_view import TextMapView
+from ..constants import ADJACENCY_DELTAS, ADJACENCY_DELTAS_WITH_DIAGONALS
+from ..grid.tokens import tokens as find_tokens
 from ..grid.within_bounds import within_bounds
 
+if TYPE_CHECKING:
+    import numpy
+
+
+# Maps that only hold Latin-1 characters are stored as one byte per cell. As soon as a wider
+# character is written, the buffer is widened to one 32-bit code point per cell.
+_NARROW_CODEC = "latin-1"
+_WIDE_CODEC = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+_WIDE_TYPECODE = "I"
+_MAX_NARROW_CODE = 0xFF
+
+_MASK_64 = 0xFFFF_FFFF_FFFF_FFFF
+
+# Bytes of a file that a memory-mapped map would keep as cells, but that reading the file as
+# stripped lines of text would not: anything outside printable ASCII, a carriage return that
+# does not end a line, or a space at either end of a line.
+_UNMAPPABLE = re.compile(rb"[^ -~\r\n]|\r(?!\n)|(?:\A|\n) | (?=\r?\n|\Z)")
+
 
 class TextMap:
-    """Holds and manipulates an ASCII map."""
+    """
+    Holds and manipulates an ASCII map.
+
+    The map is stored row after row in a flat, mutable buffer, so writing a single cell is O(1).
+    Cell (x, y) lives at position `offset + y * stride + x` of the buffer, which allows the
+    buffer to hold more than just the cells, e.g. the line breaks of a memory-mapped file.
+    """
 
     def __init__(self, map_as_lines: list[str], padding_char: str = " ") -> None:
         """
@@ -31,11 +69,342 @@ class TextMap:
 
             # Pad each line to the maximum length with the padding character
             padded_lines = [line.ljust(self._n_columns, padding_char) for line in map_as_lines]
-            self._map_string = "".join(padded_lines)
+            self._data = _encode("".join(padded_lines))
         else:
             self._n_rows = 0
             self._n_columns = 0
-            self._map_string = ""
+            self._data = bytearray()
+
+        self._offset = 0
+        self._stride = self._n_columns
+        self._index: dict[int, set[int]] | None = None
+        self._journal: list[tuple[int, int]] | None = None
+        self._snapshots: dict[int, int] = {}
+        self._next_snapshot = 0
+        self._fingerprint: int | None = None
+        self._tables: dict[frozenset[int], list[array]] = {}
+        self._jumps: dict[frozenset[int], dict[tuple[int, int], array]] = {}
+        self._wrap = False
+        self._border = 0
+        self._owner: TextMap | None = None
+        self._views: list[weakref.ref] = []
+
+    @classmethod
+    def _from_buffer(
+        cls,
+        data: bytearray | memoryview | mmap.mmap | array,
+        width: int,
+        height: int,
+        offset: int = 0,
+        stride: int | None = None,
+    ) -> "TextMap":
+        """
+        Create a TextMap directly from a flat cell buffer, without copying.
+
+        Cell (x, y) is stored at `offset + y * stride + x`. Anything in between the rows, such
+        as line breaks, is ignored.
+
+        Parameters
+        ----------
+        data : bytearray, memoryview, mmap or array
+            Flat buffer holding the cells, row after row.
+        width : int
+            Width of the map.
+        height : int
+            Height of the map.
+        offset : int, optional
+            Position of the top-left cell in the buffer (default 0).
+        stride : int, optional
+            Distance between the starts of two consecutive rows (default `width`).
+
+        Returns
+        -------
+        TextMap
+            A new map object that owns `data`.
+        """
+        textmap = cls.__new__(cls)
+        textmap._data = data
+        textmap._n_columns = width
+        textmap._n_rows = height
+        textmap._offset = offset
+        textmap._stride = width if stride is None else stride
+        textmap._index = None
+        textmap._journal = None
+        textmap._snapshots = {}
+        textmap._next_snapshot = 0
+        textmap._fingerprint = None
+        textmap._tables = {}
+        textmap._jumps = {}
+        textmap._wrap = False
+        textmap._border = 0
+        textmap._owner = None
+        textmap._views = []
+        return textmap
+
+    def _view(self, width: int, height: int, offset: int) -> "TextMap":
+        """
+        Create a map on the buffer of this map, that writes through the map owning the buffer.
+
+        Writes through the view go through `_write` of the owner, so its index, snapshots,
+        fingerprint and cached tables stay current. The view itself keeps no bookkeeping, and
+        follows the owner when its buffer is widened.
+        """
+        owner = self if self._owner is None else self._owner
+        view = TextMap._from_buffer(self._data, width, height, offset, self._stride)
+        view._owner = owner
+        owner._views = [ref for ref in owner._views if ref() is not None]
+        owner._views.append(weakref.ref(view))
+        return view
+
+    def _check_owner(self, action: str) -> None:
+        """Raise a ValueError if this map is a view, which can not keep bookkeeping."""
+        if self._owner is not None:
+            raise ValueError(f"Views keep no bookkeeping; {action} on the map that owns them.")
+
+    @property
+    def _compact(self) -> bool:
+        """Whether the rows are stored back to back, without anything in between."""
+        return self._stride == self._n_columns
+
+    @property
+    def _exact(self) -> bool:
+        """Whether the buffer holds exactly the cells of the map and nothing else."""
+        return self._offset == 0 and self._compact and len(self._data) == self._span[1]
+
+    @property
+    def _span(self) -> tuple[int, int]:
+        """Range (start, stop) of the buffer that holds the cells of the map."""
+        if not self._n_rows:
+            return self._offset, self._offset
+        return self._offset, self._offset + (self._n_rows - 1) * self._stride + self._n_columns
+
+    def _coordinate(self, ix: int) -> Coordinate:
+        """Convert a position in the buffer to the coordinate of its cell."""
+        y, x = divmod(ix - self._offset, self._stride)
+        return Coordinate(x, y)
+
+    def _is_cell(self, ix: int) -> bool:
+        """Whether a position in the buffer holds a cell, rather than space in between rows."""
+        start, stop = self._span
+        return start <= ix < stop and (ix - start) % self._stride < self._n_columns
+
+    @property
+    def _wide(self) -> bool:
+        """Whether the map is stored as 32-bit code points instead of bytes."""
+        return isinstance(self._data, array)
+
+    def _widen(self) -> None:
+        """
+        Convert the byte buffer into a code point buffer, to hold non Latin-1 characters.
+
+        The whole buffer is converted, including anything in between the rows, so every cell
+        keeps its position and the bookkeeping that refers to positions stays valid.
+        """
+        if self._owner is not None:
+            self._owner._widen()
+        elif not self._wide:
+            self._data = _encode_wide(str(bytes(self._data), _NARROW_CODEC))
+            for ref in self._views:
+                view = ref()
+                if view is not None:
+                    view._data = self._data
+
+    def _copy_buffer(self) -> bytearray | array:
+        """Return an owned, compact copy of the cells of the map."""
+        start, stop = self._span
+        if self._wide:
+            if self._compact:
+                return self._data[start:stop]
+            cells = array(_WIDE_TYPECODE)
+            for row_start in range(start, stop, self._stride):
+                cells.extend(self._data[row_start : row_start + self._n_columns])
+            return cells
+
+        view = memoryview(self._data)
+        if self._compact:
+            return bytearray(view[start:stop])
+        return bytearray().join(
+            view[row_start : row_start + self._n_columns]
+            for row_start in range(start, stop, self._stride)
+        )
+
+    @property
+    def _tracked(self) -> bool:
+        """Whether writes have to keep an index, snapshot, fingerprint or cached table current."""
+        if self._owner is not None:
+            return self._owner._tracked
+        return (
+            self._index is not None
+            or self._journal is not None
+            or self._fingerprint is not None
+            or bool(self._tables)
+            or bool(self._jumps)
+        )
+
+    def _writer(self) -> Callable[[int, int], None]:
+        """Return the function to write a character code, skipping bookkeeping if there is none."""
+        if self._owner is not None:
+            return self._owner._writer()
+        return self._write if self._tracked else self._data.__setitem__
+
+    def _write(self, ix: int, code: int) -> None:
+        """
+        Write a character code at a position in the buffer, keeping the bookkeeping up to date.
+
+        The character index, the fingerprint and the jump tables are updated, summed-area
+        tables that count either character are dropped, and the previous character is recorded
+        in the undo journal while a snapshot is kept.
+
+        Parameters
+        ----------
+        ix : int
+            Position in the buffer of the cell.
+        code : int
+            Character code to write; the buffer must already be wide enough to hold it.
+        """
+        if self._owner is not None:
+            self._owner._write(ix, code)
+            return
+
+        previous = self._data[ix]
+        if previous == code:
+            return
+
+        if self._journal is not None:
+            self._journal.append((ix, previous))
+
+        if self._index is not None:
+            positions = self._index.get(previous)
+            if positions is not None:
+                positions.discard(ix)
+                if not positions:
+                    del self._index[previous]
+            self._index.setdefault(code, set()).add(ix)
+
+        if self._fingerprint is not None:
+            if self._compact:
+                cell = ix - self._offset
+            else:
+                y, x = divmod(ix - self._offset, self._stride)
+                cell = y * self._n_columns + x
+            self._fingerprint ^= _zobrist_key(cell, previous) ^ _zobrist_key(cell, code)
+
+        if self._tables:
+            for codes in [codes for codes in self._tables if previous in codes or code in codes]:
+                del self._tables[codes]
+
+        if self._jumps:
+            for codes, jumps in self._jumps.items():
+                if (previous in codes) != (code in codes):
+                    x, y = self._coordinate(ix)
+                    _patch_jumps(jumps, x, y, self._n_columns, self._n_rows, code in codes)
+
+        self._data[ix] = code
+
+    def _scan(self, values: Iterable[str] | None = None) -> dict[int, list[int]]:
+        """
+        Collect the positions of every character (or of the given characters) in one pass.
+
+        Parameters
+        ----------
+        values : iterable of str, optional
+            Characters to collect. If None, all characters in the map are collected.
+
+        Returns
+        -------
+        dict of int to list of int
+            Positions in the buffer in ascending order, keyed by character code.
+        """
+        positions: dict[int, list[int]] = {}
+        data = self._data
+        start, stop = self._span
+        if self._compact:
+            rows = [(start, stop)]
+        else:
+            rows = [(ix, ix + self._n_columns) for ix in range(start, stop, self._stride)]
+
+        if values is None:
+            for row_start, row_stop in rows:
+                for ix, code in enumerate(data[row_start:row_stop], row_start):
+                    positions.setdefault(code, []).append(ix)
+            return positions
+
+        codes = {ord(value) for value in values}
+        for code in codes:
+            positions[code] = []
+
+        if self._wide:
+            for row_start, row_stop in rows:
+                for ix, code in enumerate(data[row_start:row_stop], row_start):
+                    if code in codes:
+                        positions[code].append(ix)
+            return positions
+
+        narrow_codes = bytes(sorted(code for code in codes if code <= _MAX_NARROW_CODE))
+        if narrow_codes:
+            pattern = _character_class_pattern(narrow_codes)
+            for row_start, row_stop in rows:
+                for match in pattern.finditer(data, row_start, row_stop):
+                    ix = match.start()
+                    positions[data[ix]].append(ix)
+
+        return positions
+
+    def _find(self, value: str, start: int | None = None) -> int:
+        """
+        Find the position of `value` in the buffer, or -1 if it is not present.
+
+        Parameters
+        ----------
+        value : str
+            Character to find. Strings of several characters are searched for in the map read
+            as a single string, and are not supported together with `start`.
+        start : int, optional
+            Position in the buffer to start searching from (default the first cell).
+
+        Returns
+        -------
+        int
+            Position in the buffer of the first occurrence, or -1 if not found.
+        """
+        span_start, span_stop = self._span
+        start = span_start if start is None else max(start, span_start)
+
+        if len(value) != 1:
+            ix = self.as_string().find(value)
+            if ix < 0:
+                return -1
+            y, x = divmod(ix, self._n_columns)
+            return self._offset + y * self._stride + x
+
+        if self._index is not None:
+            return min(
+                (ix for ix in self._index.get(ord(value), ()) if ix >= start),
+                default=-1,
+            )
+
+        while start < span_stop:
+            if self._wide:
+                try:
+                    ix = self._data.index(ord(value), start, span_stop)
+                except ValueError:
+                    return -1
+            else:
+                try:
+                    match = _literal_pattern(value.encode(_NARROW_CODEC)).search(
+                        self._data, start, span_stop
+                    )
+                except UnicodeEncodeError:
+                    return -1
+                if match is None:
+                    return -1
+                ix = match.start()
+
+            if self._compact or self._is_cell(ix):
+                return ix
+            start = ix + 1
+
+        return -1
 
     @classmethod
     def from_string(cls, map_string: str) -> "TextMap":
@@ -54,6 +423,42 @@ class TextMap:
         """
         return cls(map_string.splitlines())
 
+    @classmethod
+    def from_file(cls, path: Path | str) -> "TextMap":
+        """
+        Create a TextMap on top of a memory-mapped file.
+
+        The file is not read into memory: cells are read from the mapped pages, with a row stride
+        of the width plus the line break. Writes are copy-on-write, so they only affect the map
+        and never the file. Only files of printable ASCII lines of equal length, without blank
+        lines or whitespace at either end of a line, can be mapped this way; any other file is
+        read as text, stripped and padded as usual, so the map is always the same as the one
+        built from `Loader.as_lines`.
+
+        Parameters
+        ----------
+        path : Path or str
+            Path to the file with the ASCII map.
+
+        Returns
+        -------
+        TextMap
+            A new map object backed by the file.
+        """
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return cls([])
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        layout = _grid_layout(data)
+        if layout is not None:
+            width, height, stride = layout
+            return cls._from_buffer(data, width, height, stride=stride)
+
+        data.close()
+        with open(path, "r") as file:
+            return cls([line.strip() for line in file.readlines() if line.strip()])
+
     @classmethod
     def new(cls, width: int, height: int, fill: str = " ") -> "TextMap":
         """
@@ -137,41 +542,213 @@ class TextMap:
         if isinstance(x, tuple):
             x, y = x
 
-        if not self.within_bounds((x, y)):
+        if self._wrap:
+            x, y = x % self._n_columns, y % self._n_rows
+        elif not self.within_bounds((x, y)):
             if out_of_bounds_character:
                 return out_of_bounds_character
             raise ValueError(f"Coordinates ({x}, {y}) are out of bounds.")
 
-        return self._map_string[y * self._n_columns + x]
+        return chr(self._data[self._offset + y * self._stride + x])
+
+    def get_unchecked(self, x: int, y: int) -> str:
+        """
+        Get the character at the given coordinates, without any checks.
+
+        Meant for inner loops on a map with a border, see `bordered`: coordinates up to the
+        border size outside the map read the sentinel. Other coordinates outside the map read
+        an arbitrary cell or raise an IndexError.
+
+        Parameters
+        ----------
+        x : int
+            X-coordinate (column).
+        y : int
+            Y-coordinate (row).
+
+        Returns
+        -------
+        str
+            Character at the specified coordinates.
+        """
+        return chr(self._data[self._offset + y * self._stride + x])
+
+    def neighbors(
+        self, coordinate: Coordinate, diagonal_sides: bool = False
+    ) -> list[tuple[Coordinate, str]]:
+        """
+        Get the neighbours of a cell with their characters, without bounds checks.
+
+        Neighbours outside the map are part of the border and hold the sentinel, so a flood fill
+        that does not enter the sentinel stops at the edge of the map by itself.
+
+        Parameters
+        ----------
+        coordinate : Coordinate
+            The cell, inside the map.
+        diagonal_sides : bool, optional
+            If True, include the diagonal neighbours (default False).
+
+        Returns
+        -------
+        list of (Coordinate, str)
+            Every neighbour and its character.
+
+        Raises
+        ------
+        ValueError
+            If the map has no border, see `bordered`.
+        """
+        if not self._border:
+            raise ValueError("neighbors() requires a map with a border, see bordered().")
+
+        x, y = coordinate
+        data = self._data
+        ix = self._offset + y * self._stride + x
+        return [
+            (Coordinate(x + dx, y + dy), chr(data[ix + step]))
+            for dx, dy, step in _neighbour_steps(self._stride, diagonal_sides)
+        ]
 
     def get_many(
         self, coordinates: Iterable[Coordinate], out_of_bounds_character: str = ""
     ) -> tuple[str, ...]:
         """
-        Get characters at the given coordinates.
+        Get characters at the given coordinates, in one pass.
 
         Parameters
         ----------
-        coordinates : list of (x, y)
-            Coordinates to fetch.
+        coordinates : list of (x, y) or numpy.ndarray
+            Coordinates to fetch. A NumPy array of shape (n, 2) is bounds checked and read as a
+            whole, without a Python loop over the coordinates.
+        out_of_bounds_character : str, optional
+            Character to return for coordinates that are out of bounds. Defaults to "".
 
         Returns
         -------
         tuple of str
             Characters at the given coordinates.
+
+        Raises
+        ------
+        ValueError
+            If any of the coordinates is out of bounds and no `out_of_bounds_character` is
+            provided.
         """
-        return tuple(
-            self.get(x, y, out_of_bounds_character=out_of_bounds_character) for x, y in coordinates
+        if _is_ndarray(coordinates):
+            return self._gather(coordinates[:, 0], coordinates[:, 1], out_of_bounds_character)
+
+        data, width, height = self._data, self._n_columns, self._n_rows
+        offset, stride = self._offset, self._stride
+        if self._wrap:
+            return tuple(
+                chr(data[offset + y % height * stride + x % width]) for x, y in coordinates
+            )
+
+        characters = []
+        for x, y in coordinates:
+            if 0 <= x < width and 0 <= y < height:
+                characters.append(chr(data[offset + y * stride + x]))
+            elif out_of_bounds_character:
+                characters.append(out_of_bounds_character)
+            else:
+                raise ValueError(f"Coordinates ({x}, {y}) are out of bounds.")
+        return tuple(characters)
+
+    def get_cells(self, cells: Iterable[int], out_of_bounds_character: str = "") -> tuple[str, ...]:
+        """
+        Get characters at the given cell indices, in one pass.
+
+        The index of cell (x, y) is `y * width + x`, the numbering also used by `Regions` and
+        `TokenIndex` labels.
+
+        Parameters
+        ----------
+        cells : iterable of int or numpy.ndarray
+            Indices of the cells to fetch. A NumPy array is bounds checked and read as a whole.
+        out_of_bounds_character : str, optional
+            Character to return for indices outside the map. Defaults to "".
+
+        Returns
+        -------
+        tuple of str
+            Characters of the given cells.
+
+        Raises
+        ------
+        ValueError
+            If any of the indices is outside the map and no `out_of_bounds_character` is
+            provided.
+        """
+        width = self._n_columns
+        if _is_ndarray(cells):
+            if not width:
+                return self._gather(cells, cells, out_of_bounds_character)
+            return self._gather(cells % width, cells // width, out_of_bounds_character)
+
+        if self._wrap:
+            size = width * self._n_rows
+            cells = (cell % size for cell in cells)
+        return self.get_many(
+            ((cell % width, cell // width) if width else (-1, -1) for cell in cells),
+            out_of_bounds_character,
         )
 
+    def _gather(
+        self, xs: "numpy.ndarray", ys: "numpy.ndarray", out_of_bounds_character: str
+    ) -> tuple[str, ...]:
+        """Read the cells at arrays of x and y coordinates, with one bounds mask."""
+        np = _import_numpy()
+        positions, inside = self._array_positions(np, xs, ys)
+        if inside is not None and not out_of_bounds_character:
+            raise ValueError("Coordinates are out of bounds.")
+
+        codes = self._array_view(np)
+        if inside is None:
+            return tuple(map(chr, codes[positions].tolist()))
+
+        characters = [out_of_bounds_character] * len(inside)
+        for ix, code in zip(
+            np.flatnonzero(inside).tolist(), codes[positions].tolist(), strict=True
+        ):
+            characters[ix] = chr(code)
+        return tuple(characters)
+
+    def _array_positions(
+        self, np, xs: "numpy.ndarray", ys: "numpy.ndarray"
+    ) -> tuple["numpy.ndarray", "numpy.ndarray | None"]:
+        """
+        Positions in the buffer of arrays of coordinates, and the mask of the ones inside.
+
+        The mask is None if every coordinate is inside the map (or folded onto it when the map
+        wraps); otherwise only the positions of the coordinates inside are returned.
+        """
+        width, height = self._n_columns, self._n_rows
+        xs, ys = np.asarray(xs, dtype=np.intp), np.asarray(ys, dtype=np.intp)
+        if self._wrap:
+            xs, ys, inside = xs % width, ys % height, None
+        else:
+            inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+            if inside.all():
+                inside = None
+            else:
+                xs, ys = xs[inside], ys[inside]
+        return self._offset + ys * self._stride + xs, inside
+
+    def _array_view(self, np) -> "numpy.ndarray":
+        """Flat NumPy view on the whole buffer, one element per position."""
+        return np.frombuffer(self._data, dtype=np.uint32 if self._wide else np.uint8)
+
     def __eq__(self, other: "TextMap") -> bool:
-        """Check if two TextMap objects are equal based on _map_string."""
+        """Check if two TextMap objects are equal based on their string representation."""
         if not isinstance(other, TextMap):
             raise NotImplementedError
-        return self._map_string == other._map_string
+        if self._wide == other._wide and self._exact and other._exact:
+            return self._data == other._data
+        return self.as_string() == other.as_string()
 
     def __ne__(self, other: "TextMap") -> bool:
-        """Check if two TextMap objects are not equal based on _map_string."""
+        """Check if two TextMap objects are not equal based on their string representation."""
         return not self.__eq__(other)
 
     def set(self, x: int | Coordinate, y: int | None = None, value: str = ...) -> None:
@@ -190,7 +767,7 @@ class TextMap:
         Raises
         ------
         TypeError
-            If arguments do not match expected types.
+            If arguments do not match expected types, or if `value` is not a single character.
         ValueError
             If y is not provided when x is an integer or if the tuple does not have exactly two elements.
         IndexError
@@ -208,26 +785,108 @@ class TextMap:
         else:
             raise TypeError("set() expects either two integers (x, y) or a single tuple (x, y).")
 
-        if not (0 <= current_x < self._n_columns) or not (0 <= current_y < self._n_rows):
+        if self._wrap:
+            current_x, current_y = current_x % self._n_columns, current_y % self._n_rows
+        elif not (0 <= current_x < self._n_columns) or not (0 <= current_y < self._n_rows):
             raise IndexError("Coordinates are out of bounds.")
 
-        ix = current_y * self._n_columns + current_x
+        code = ord(value)
+        if code > _MAX_NARROW_CODE:
+            self._widen()
 
-        self._map_string = self._map_string[:ix] + value + self._map_string[ix + 1 :]
+        self._write(self._offset + current_y * self._stride + current_x, code)
 
     def set_many(self, coordinates: Iterable[Coordinate], value: str) -> None:
         """
         Set the character at the given coordinates.
 
+        All coordinates are checked before the first write, so the map is left unchanged if any
+        of them is out of bounds.
+
         Parameters
         ----------
-        coordinates : list of (x, y)
-            Coordinates to set.
+        coordinates : list of (x, y) or numpy.ndarray
+            Coordinates to set. A NumPy array of shape (n, 2) is bounds checked as a whole, and
+            written in one scatter if the map keeps no index, snapshot or other bookkeeping.
         value : str
             Character to place at the coordinates.
+
+        Raises
+        ------
+        IndexError
+            If any of the coordinates is out of bounds.
         """
-        for x, y in coordinates:
-            self.set(x, y, value)
+        if _is_ndarray(coordinates):
+            self._scatter(coordinates[:, 0], coordinates[:, 1], value)
+            return
+
+        width, height, offset, stride = self._n_columns, self._n_rows, self._offset, self._stride
+        if self._wrap:
+            positions = [offset + y % height * stride + x % width for x, y in coordinates]
+        else:
+            positions = []
+            for x, y in coordinates:
+                if not (0 <= x < width) or not (0 <= y < height):
+                    raise IndexError("Coordinates are out of bounds.")
+                positions.append(offset + y * stride + x)
+
+        code = ord(value)
+        if code > _MAX_NARROW_CODE:
+            self._widen()
+        write = self._writer()
+        for ix in positions:
+            write(ix, code)
+
+    def set_cells(self, cells: Iterable[int], value: str) -> None:
+        """
+        Set the character at the given cell indices.
+
+        The index of cell (x, y) is `y * width + x`. All indices are checked before the first
+        write.
+
+        Parameters
+        ----------
+        cells : iterable of int or numpy.ndarray
+            Indices of the cells to set. A NumPy array is bounds checked as a whole.
+        value : str
+            Character to place in the cells.
+
+        Raises
+        ------
+        IndexError
+            If any of the indices is outside the map.
+        """
+        width = self._n_columns
+        if _is_ndarray(cells):
+            if not width:
+                self._scatter(cells, cells, value)
+            else:
+                self._scatter(cells % width, cells // width, value)
+            return
+
+        if self._wrap:
+            size = width * self._n_rows
+            cells = (cell % size for cell in cells)
+        self.set_many(
+            ((cell % width, cell // width) if width else (-1, -1) for cell in cells), value
+        )
+
+    def _scatter(self, xs: "numpy.ndarray", ys: "numpy.ndarray", value: str) -> None:
+        """Write a character at arrays of x and y coordinates, with one bounds mask."""
+        np = _import_numpy()
+        positions, inside = self._array_positions(np, xs, ys)
+        if inside is not None:
+            raise IndexError("Coordinates are out of bounds.")
+
+        code = ord(value)
+        if code > _MAX_NARROW_CODE:
+            self._widen()
+        if not self._tracked:
+            self._array_view(np)[positions] = code
+        else:
+            write = self._write
+            for ix in positions.tolist():
+                write(ix, code)
 
     def find(self, value: str) -> Coordinate:
         """
@@ -243,8 +902,10 @@ class TextMap:
         tuple of int
             Coordinates (x, y) of the character.
         """
-        i = self._map_string.index(value)
-        return Coordinate(i % self._n_columns, i // self._n_columns)
+        i = self._find(value)
+        if i < 0:
+            raise ValueError(f"'{value}' not found in map.")
+        return self._coordinate(i)
 
     def find_all(self, value: str) -> list[Coordinate]:
         """
@@ -260,11 +921,656 @@ class TextMap:
         list of tuple of int
             All coordinates (x, y) of the character.
         """
-        return [
-            Coordinate(ix % self._n_columns, ix // self._n_columns)
-            for ix, c in enumerate(self._map_string)
-            if c == value
-        ]
+        if len(value) != 1:
+            return []
+
+        if self._index is not None:
+            return [self._coordinate(ix) for ix in sorted(self._index.get(ord(value), ()))]
+
+        if not self._wide:
+            try:
+                pattern = _literal_pattern(value.encode(_NARROW_CODEC))
+            except UnicodeEncodeError:
+                return []
+            start, stop = self._span
+            positions = (match.start() for match in pattern.finditer(self._data, start, stop))
+            if self._compact:
+                return [self._coordinate(ix) for ix in positions]
+            return [self._coordinate(ix) for ix in positions if self._is_cell(ix)]
+
+        coordinates = []
+        ix = self._find(value)
+        while ix >= 0:
+            coordinates.append(self._coordinate(ix))
+            ix = self._find(value, ix + 1)
+
+        return coordinates
+
+    def find_all_many(self, values: Iterable[str] | None = None) -> dict[str, list[Coordinate]]:
+        """
+        Find all occurrences of several characters in a single pass over the map.
+
+        Parameters
+        ----------
+        values : iterable of str, optional
+            Characters to find. If None, all characters present in the map are returned.
+
+        Returns
+        -------
+        dict of str to list of Coordinate
+            All coordinates (x, y) per character, in reading order. When `values` is given,
+            every requested character is present, possibly with an empty list.
+        """
+        if self._index is not None:
+            codes = self._index if values is None else {ord(value) for value in values}
+            positions = {code: sorted(self._index.get(code, ())) for code in codes}
+        else:
+            positions = self._scan(values)
+
+        coordinate = self._coordinate
+        return {
+            chr(code): [coordinate(ix) for ix in indices] for code, indices in positions.items()
+        }
+
+    def to_graph(
+        self, passable: str | Iterable[str] = ".", diagonal_sides: bool = False
+    ) -> GridGraph:
+        """
+        Compile the passable cells of the map into a graph.
+
+        On a wrapping map, cells on opposite edges are connected. The graph is a snapshot:
+        later writes to the map are not reflected in it. Build it once
+        and hand it to `aoc.grid.dijkstra`, `aoc.grid.find_shortest_path` or
+        `aoc.grid.group_adjacent` to search without hashing coordinates.
+
+        Parameters
+        ----------
+        passable : str or iterable of str, optional
+            Characters of the cells that can be entered (default "."). Include the markers of
+            cells to search from or to, e.g. ".SE".
+        diagonal_sides : bool, optional
+            Whether diagonally adjacent cells are connected (default False).
+
+        Returns
+        -------
+        GridGraph
+            The graph of the passable cells, numbered in reading order.
+        """
+        offset, stride, width = self._offset, self._stride, self._n_columns
+        positions = self._scan(passable).values()
+        if self._compact:
+            cells = [ix - offset for indices in positions for ix in indices]
+        else:
+            cells = [
+                (ix - offset) // stride * width + (ix - offset) % stride
+                for indices in positions
+                for ix in indices
+            ]
+        cells.sort()
+        return GridGraph.from_cells(
+            cells, width, self._n_rows, diagonal_sides=diagonal_sides, wrap=self._wrap
+        )
+
+    def _summed_area_table(self, codes: frozenset[int]) -> list[array]:
+        """
+        Get the summed-area table of a set of characters, building it if needed.
+
+        Entry [y][x] of the table is the number of cells holding one of the characters in the
+        rectangle of the map above and to the left of cell (x, y), exclusive.
+
+        Parameters
+        ----------
+        codes : frozenset of int
+            Character codes to count.
+
+        Returns
+        -------
+        list of array of int
+            The table, of height + 1 rows of width + 1 counts.
+        """
+        table = self._tables.get(codes)
+        if table is not None:
+            return table
+
+        width = self._n_columns
+        previous = array("i", [0]) * (width + 1)
+        table = [previous]
+        for y in range(self._n_rows):
+            row = self._flags(codes, y, 0, width)
+            previous = array("i", map(add, previous, accumulate(row, initial=0)))
+            table.append(previous)
+
+        if self._owner is None:
+            self._tables[codes] = table
+        return table
+
+    def _flags(self, codes: frozenset[int], y: int, x: int, length: int) -> Iterable[int]:
+        """Flag per cell of part of a row, 1 if it holds one of the characters, else 0."""
+        row_start = self._offset + y * self._stride + x
+        cells = self._data[row_start : row_start + length]
+        if self._wide:
+            return [code in codes for code in cells]
+        return bytes(cells).translate(_flag_table(codes))
+
+    def count(self, values: str | Iterable[str], bounds: Bounds | None = None) -> int:
+        """
+        Count the cells holding any of the given characters, in the map or in a rectangle.
+
+        The first count of a set of characters builds its summed-area table in one pass over
+        the map; every count after that is O(1). Writing one of the characters to the map, or
+        overwriting one, drops the table. While there is no table, rectangles of at most an
+        eighth of the map are counted directly, so counting between writes costs the size of
+        the rectangle rather than a rebuild of the table.
+
+        Parameters
+        ----------
+        values : str or iterable of str
+            Characters to count, e.g. "#" or "#O".
+        bounds : Bounds, optional
+            Rectangle (min_x, min_y, max_x, max_y) to count in, inclusive, clipped to the map.
+            If None, the whole map is counted.
+
+        Returns
+        -------
+        int
+            Number of cells holding one of the characters.
+        """
+        codes = frozenset(ord(value) for value in values)
+        if bounds is None:
+            return self._summed_area_table(codes)[-1][-1]
+
+        min_x, min_y, max_x, max_y = bounds
+        min_x, min_y = max(min_x, 0), max(min_y, 0)
+        max_x, max_y = min(max_x, self._n_columns - 1), min(max_y, self._n_rows - 1)
+        if min_x > max_x or min_y > max_y:
+            return 0
+
+        length = max_x - min_x + 1
+        if (
+            codes not in self._tables
+            and 8 * length * (max_y - min_y + 1) <= self._n_columns * self._n_rows
+        ):
+            return sum(sum(self._flags(codes, y, min_x, length)) for y in range(min_y, max_y + 1))
+
+        table = self._summed_area_table(codes)
+        return (
+            table[max_y + 1][max_x + 1]
+            - table[min_y][max_x + 1]
+            - table[max_y + 1][min_x]
+            + table[min_y][min_x]
+        )
+
+    def mask(self, values: str | Iterable[str]) -> CellMask:
+        """
+        Get the cells holding any of the given characters, as a bitmask.
+
+        The mask is built in one translate pass over the buffer, without creating a Coordinate
+        per cell. It is a snapshot: later writes to the map do not change it.
+
+        Parameters
+        ----------
+        values : str or iterable of str
+            Characters to select, e.g. "." or ".SE".
+
+        Returns
+        -------
+        CellMask
+            Mask with bit `y * width + x` set for every selected cell (x, y).
+        """
+        codes = {ord(value) for value in values}
+        cells = self._copy_buffer()
+        if self._wide:
+            flags = bytes(48 + (code in codes) for code in cells)
+        else:
+            flags = cells.translate(
+                bytes(48 + (code in codes) for code in range(_MAX_NARROW_CODE + 1))
+            )
+        bits = int(flags[::-1], 2) if flags else 0
+        return CellMask(self._n_columns, self._n_rows, bits)
+
+    def cells(
+        self, values: str | Iterable[str] | CellMask | None = None
+    ) -> Iterator[tuple[int, int, int, str]]:
+        """
+        Iterate over the cells of the map, in reading order, straight from the buffer.
+
+        Every row is read with one slice and its tuples are built by `zip`, so a full scan
+        costs no method call per cell. Filtering first builds a mask, and then only visits the
+        selected cells.
+
+        Parameters
+        ----------
+        values : str, iterable of str or CellMask, optional
+            Only visit the cells holding one of these characters, or the cells in this mask.
+            If None, every cell is visited.
+
+        Returns
+        -------
+        iterator of (int, int, int, str)
+            Cell index `y * width + x`, x, y and character of every visited cell.
+
+        Raises
+        ------
+        ValueError
+            If the mask belongs to a map of another size.
+        """
+        width, offset, stride = self._n_columns, self._offset, self._stride
+        if values is None:
+            for y in range(self._n_rows):
+                row = self._slice(offset + y * stride, width, 1) if width else ""
+                yield from zip(range(y * width, (y + 1) * width), range(width), repeat(y), row)
+            return
+
+        if isinstance(values, CellMask):
+            if (values.width, values.height) != (width, self._n_rows):
+                raise ValueError("The mask belongs to a map of another size.")
+            mask = values
+        else:
+            mask = self.mask(values)
+
+        data = self._data
+        for cell in mask.cells():
+            y, x = divmod(cell, width)
+            yield cell, x, y, chr(data[offset + y * stride + x])
+
+    def jump_table(self, blockers: str | Iterable[str] = "#") -> dict[tuple[int, int], array]:
+        """
+        Get the jump tables of a set of blocker characters, building them if needed.
+
+        For every direction, entry `y * width + x` holds the x (for left and right) or y (for up
+        and down) of the next blocker seen from cell (x, y), or the first position outside the
+        map if there is none. The tables are built in one pass over the map and kept with it;
+        writes that add or remove a blocker patch them along the row and column of the cell
+        only. Views build fresh tables on every call.
+
+        Parameters
+        ----------
+        blockers : str or iterable of str, optional
+            Characters that block the view (default "#").
+
+        Returns
+        -------
+        dict of (dx, dy) to array of int
+            The table of every direction. The tables belong to the map and must not be
+            modified.
+        """
+        codes = frozenset(ord(value) for value in blockers)
+        jumps = self._jumps.get(codes)
+        if jumps is not None:
+            return jumps
+
+        width, height = self._n_columns, self._n_rows
+        cells = self._copy_buffer()
+        blocked = [code in codes for code in cells]
+        right, left, down, up = (array("i", bytes(4 * width * height)) for _ in range(4))
+
+        for y in range(height):
+            row = y * width
+            blocker = width
+            for x in range(width - 1, -1, -1):
+                right[row + x] = blocker
+                if blocked[row + x]:
+                    blocker = x
+            blocker = -1
+            for x in range(width):
+                left[row + x] = blocker
+                if blocked[row + x]:
+                    blocker = x
+
+        for x in range(width):
+            blocker = height
+            for y in range(height - 1, -1, -1):
+                down[y * width + x] = blocker
+                if blocked[y * width + x]:
+                    blocker = y
+            blocker = -1
+            for y in range(height):
+                up[y * width + x] = blocker
+                if blocked[y * width + x]:
+                    blocker = y
+
+        jumps = {(1, 0): right, (-1, 0): left, (0, 1): down, (0, -1): up}
+        if self._owner is None:
+            self._jumps[codes] = jumps
+        return jumps
+
+    @property
+    def indexed(self) -> bool:
+        """Whether a character index is maintained for this map."""
+        return self._index is not None
+
+    def enable_index(self) -> None:
+        """
+        Build a persistent character to positions index.
+
+        While enabled, `set`, `set_many` and `switch_tiles` keep the index up to date, and
+        `find`, `find_all` and `find_all_many` are answered from it without scanning the map.
+        Writes that bypass the map, such as through an array from `to_array`, are not tracked.
+
+        Raises
+        ------
+        ValueError
+            If the map is a view on another map.
+        """
+        self._check_owner("enable the index")
+        if self._index is None:
+            self._index = {code: set(indices) for code, indices in self._scan().items()}
+
+    def disable_index(self) -> None:
+        """Drop the character index, so writes no longer pay for maintaining it."""
+        self._index = None
+
+    @property
+    def wrapping(self) -> bool:
+        """Whether coordinates wrap around the edges of the map, as on a torus."""
+        return self._wrap
+
+    def wrapped(self) -> "TextMap":
+        """
+        Get a view on the map in which coordinates wrap around the edges, as on a torus.
+
+        Coordinate (x, y) of the view is cell (x % width, y % height) of the map, so `get`,
+        `set`, `set_many` and `switch_tiles` accept any coordinate, `within_bounds` is always
+        True, and `to_graph` connects the cells on opposite edges. The view shares its cells
+        with the map, and its writes go through the map, so its index, snapshots, fingerprint
+        and cached tables stay current.
+
+        Returns
+        -------
+        TextMap
+            A wrapping view on the map.
+
+        Raises
+        ------
+        ValueError
+            If the map is empty.
+        """
+        if not self._n_rows or not self._n_columns:
+            raise ValueError("An empty map can not wrap.")
+
+        view = self._view(self._n_columns, self._n_rows, self._offset)
+        view._wrap = True
+        return view
+
+    def window(self, min_x: int, min_y: int, max_x: int, max_y: int) -> "TextMap":
+        """
+        Get a view on a rectangle of the map, that shares its cells with the map.
+
+        The view is a TextMap of its own, with cell (min_x, min_y) of the map at (0, 0), reading
+        the buffer of the map through an offset and the stride of the map, so creating it copies
+        nothing. Writes through the view go through the map, so its index, snapshots,
+        fingerprint and cached tables stay current. The view itself can not keep an index or
+        snapshots.
+
+        Parameters
+        ----------
+        min_x : int
+            Left column of the rectangle.
+        min_y : int
+            Top row of the rectangle.
+        max_x : int
+            Right column of the rectangle, inclusive.
+        max_y : int
+            Bottom row of the rectangle, inclusive.
+
+        Returns
+        -------
+        TextMap
+            A view on the rectangle.
+
+        Raises
+        ------
+        ValueError
+            If the rectangle is empty or not inside the map.
+        """
+        if not (0 <= min_x <= max_x < self._n_columns and 0 <= min_y <= max_y < self._n_rows):
+            raise ValueError(f"Window ({min_x}, {min_y}, {max_x}, {max_y}) is not inside the map.")
+
+        return self._view(
+            max_x - min_x + 1, max_y - min_y + 1, self._offset + min_y * self._stride + min_x
+        )
+
+    @property
+    def fingerprint(self) -> int:
+        """
+        64-bit Zobrist fingerprint of the cells of the map.
+
+        The fingerprint is the XOR of a pseudo-random key per (cell, character) pair. It is
+        computed once, on first access, and from then on updated in O(1) by every write through
+        the map, so it can key a dict of visited states without copying the map. Maps with the
+        same dimensions and cells have the same fingerprint. Writes that bypass the map, such as
+        through an array from `to_array`, are not tracked. Views, such as a `window`, compute
+        their fingerprint on every access.
+        """
+        if self._fingerprint is None:
+            width, fingerprint = self._n_columns, 0
+            for code, indices in self._scan().items():
+                for ix in indices:
+                    x, y = self._coordinate(ix)
+                    fingerprint ^= _zobrist_key(y * width + x, code)
+            if self._owner is not None:
+                return fingerprint
+            self._fingerprint = fingerprint
+        return self._fingerprint
+
+    def snapshot(self) -> int:
+        """
+        Take a snapshot of the map, to return to later with `restore`.
+
+        Nothing is copied: from the first snapshot on, every write through the map records the
+        character it overwrites in an undo journal. Restoring undoes the writes made since the
+        snapshot, so trying out a change costs as much as the change itself. Snapshots can be
+        nested, and a snapshot can be restored any number of times.
+
+        Returns
+        -------
+        int
+            Identifier of the snapshot.
+
+        Raises
+        ------
+        ValueError
+            If the map is a view on another map.
+        """
+        self._check_owner("take snapshots")
+        if self._journal is None:
+            self._journal = []
+        snapshot, self._next_snapshot = self._next_snapshot, self._next_snapshot + 1
+        self._snapshots[snapshot] = len(self._journal)
+        return snapshot
+
+    def restore(self, snapshot: int) -> None:
+        """
+        Undo all writes made since a snapshot was taken.
+
+        Snapshots taken after this one are no longer valid afterwards.
+
+        Parameters
+        ----------
+        snapshot : int
+            Identifier of the snapshot, as returned by `snapshot`.
+
+        Raises
+        ------
+        ValueError
+            If the snapshot is unknown, released, or no longer valid because an earlier snapshot
+            was restored.
+        """
+        journal = self._journal
+        if journal is None or snapshot not in self._snapshots:
+            raise ValueError(f"Unknown snapshot {snapshot}.")
+
+        position = self._snapshots[snapshot]
+        self._snapshots = {key: value for key, value in self._snapshots.items() if key <= snapshot}
+        undo = journal[position:]
+        del journal[position:]
+
+        self._journal = None
+        write = self._writer()
+        for ix, code in reversed(undo):
+            write(ix, code)
+        self._journal = journal
+
+    def release_snapshots(self) -> None:
+        """Forget all snapshots and stop recording the undo journal."""
+        self._journal = None
+        self._snapshots = {}
+
+    def _slice(self, start: int, length: int, step: int) -> str:
+        """
+        Read `length` cells from the buffer, starting at position `start`, `step` cells apart.
+
+        Parameters
+        ----------
+        start : int
+            Position in the buffer of the first cell.
+        length : int
+            Number of cells to read.
+        step : int
+            Distance between two consecutive cells in the flat buffer.
+
+        Returns
+        -------
+        str
+            The cells as a string, taken with a single strided slice.
+        """
+        if length == 1:
+            cells = self._data[start : start + 1]
+        else:
+            cells = self._data[start : start + (length - 1) * step + 1 : step]
+
+        if self._wide:
+            return cells.tobytes().decode(_WIDE_CODEC)
+        if isinstance(cells, memoryview):
+            cells = cells.tobytes()
+        return str(cells, _NARROW_CODEC)
+
+    def row(self, y: int) -> str:
+        """
+        Get a single row of the map.
+
+        Parameters
+        ----------
+        y : int
+            Y-coordinate (row).
+
+        Returns
+        -------
+        str
+            The characters of the row, from left to right.
+        """
+        if not 0 <= y < self._n_rows:
+            raise IndexError(f"Row {y} is out of bounds.")
+        return self._slice(self._offset + y * self._stride, self._n_columns, 1)
+
+    def column(self, x: int) -> str:
+        """
+        Get a single column of the map.
+
+        Parameters
+        ----------
+        x : int
+            X-coordinate (column).
+
+        Returns
+        -------
+        str
+            The characters of the column, from top to bottom.
+        """
+        if not 0 <= x < self._n_columns:
+            raise IndexError(f"Column {x} is out of bounds.")
+        return self._slice(self._offset + x, self._n_rows, self._stride)
+
+    def lines(self, direction: tuple[int, int]) -> Iterator[tuple[Coordinate, str]]:
+        """
+        Iterate over all lines of the map that run in the given direction.
+
+        Rows, columns, diagonals and anti-diagonals are each read with one strided slice of the
+        flat buffer, so they can be searched with native string methods. A character at index
+        `i` of a line is located at `start + i * direction`.
+
+        Parameters
+        ----------
+        direction : tuple of int
+            Direction (dx, dy) the lines run in, with dx and dy in -1, 0 or 1, e.g. (1, 0) for
+            rows read left to right or (-1, 1) for anti-diagonals read top-right to bottom-left.
+
+        Yields
+        ------
+        tuple of (Coordinate, str)
+            Coordinate of the first character of the line, and the line itself.
+        """
+        dx, dy = direction
+        if dx not in (-1, 0, 1) or dy not in (-1, 0, 1) or (dx, dy) == (0, 0):
+            raise ValueError(f"Invalid line direction {direction}.")
+
+        width, height = self._n_columns, self._n_rows
+        if not width or not height:
+            return
+
+        # Lines are read top to bottom (or left to right), and reversed afterwards if needed
+        reverse = dy < 0 or (dy == 0 and dx < 0)
+        if reverse:
+            dx, dy = -dx, -dy
+
+        if dy == 0:
+            starts = [(0, y) for y in range(height)]
+        elif dx == 0:
+            starts = [(x, 0) for x in range(width)]
+        elif dx == 1:
+            starts = [(0, y) for y in range(height - 1, 0, -1)] + [(x, 0) for x in range(width)]
+        else:
+            starts = [(x, 0) for x in range(width)] + [(width - 1, y) for y in range(1, height)]
+
+        offset, stride = self._offset, self._stride
+        step = dy * stride + dx
+        for x, y in starts:
+            length = min(
+                width - x if dx == 1 else x + 1 if dx == -1 else height,
+                height - y if dy == 1 else width,
+            )
+            line = self._slice(offset + y * stride + x, length, step)
+            if reverse:
+                yield Coordinate(x + (length - 1) * dx, y + (length - 1) * dy), line[::-1]
+            else:
+                yield Coordinate(x, y), line
+
+    def find_word(
+        self,
+        word: str,
+        directions: Iterable[tuple[int, int]] = ADJACENCY_DELTAS_WITH_DIAGONALS,
+    ) -> list[tuple[Coordinate, tuple[int, int]]]:
+        """
+        Find all occurrences of a word, as in a word search puzzle.
+
+        Every line is searched with `str.find`, so the cost is a few native searches per row,
+        column and diagonal instead of one lookup per character.
+
+        Parameters
+        ----------
+        word : str
+            Word to find.
+        directions : iterable of tuple of int, optional
+            Directions (dx, dy) the word can be written in (default all eight directions).
+
+        Returns
+        -------
+        list of tuple of (Coordinate, tuple of int)
+            Coordinate of the first letter and the direction of every occurrence.
+        """
+        if not word:
+            return []
+
+        found = []
+        for direction in directions:
+            dx, dy = direction
+            for (x, y), line in self.lines(direction):
+                ix = line.find(word)
+                while ix >= 0:
+                    found.append((Coordinate(x + ix * dx, y + ix * dy), direction))
+                    ix = line.find(word, ix + 1)
+
+        return found
 
     def as_lines(self) -> list[str]:
         """
@@ -275,12 +1581,12 @@ class TextMap:
         list of str
             Each line of the ASCII map.
         """
-        if not self._map_string:
+        map_string = self.as_string()
+        if not map_string:
             return []
 
         return [
-            self._map_string[i : i + self._n_columns]
-            for i in range(0, len(self._map_string), self._n_columns)
+            map_string[i : i + self._n_columns] for i in range(0, len(map_string), self._n_columns)
         ]
 
     def show(self) -> None:
@@ -297,7 +1603,53 @@ class TextMap:
         TextMap
             A new map with the same content.
         """
-        return TextMap(self.as_lines())
+        if self._border:
+            textmap = TextMap._from_buffer(
+                self._data[:], self._n_columns, self._n_rows, self._offset, self._stride
+            )
+            textmap._border = self._border
+        else:
+            textmap = TextMap._from_buffer(self._copy_buffer(), self._n_columns, self._n_rows)
+        textmap._wrap = self._wrap
+        textmap._fingerprint = self._fingerprint
+        if self._index is not None:
+            textmap.enable_index()
+        return textmap
+
+    def bordered(self, sentinel: str, size: int = 1) -> "TextMap":
+        """
+        Create a copy of the map whose buffer has a border of sentinel characters around it.
+
+        The map itself keeps its size and coordinates: the border is only part of the layout
+        of the buffer, so `get` and `set` still treat it as out of bounds, while
+        `get_unchecked` and `neighbors` can read it without checks.
+
+        Parameters
+        ----------
+        sentinel : str
+            Character of the border cells.
+        size : int, optional
+            Width of the border (default 1).
+
+        Returns
+        -------
+        TextMap
+            A new map with the same cells and a bordered layout.
+        """
+        stride = self._n_columns + 2 * size
+        side = sentinel * size
+        buffer = _encode(
+            "".join(
+                [sentinel * stride * size]
+                + [side + line + side for line in self.as_lines()]
+                + [sentinel * stride * size]
+            )
+        )
+        textmap = TextMap._from_buffer(
+            buffer, self._n_columns, self._n_rows, size * stride + size, stride
+        )
+        textmap._border = size
+        return textmap
 
     def pad(self, pading_size: int | tuple[int, int, int, int], fill: str = " ") -> "TextMap":
         """
@@ -336,9 +1688,258 @@ class TextMap:
 
         return TextMap(lines)
 
+    def translate(self, table: dict[str, str]) -> "TextMap":
+        """
+        Create a copy of the map with characters replaced through a mapping table.
+
+        Maps holding only Latin-1 characters are translated in one `bytes.translate` pass over
+        the buffer.
+
+        Parameters
+        ----------
+        table : dict of str to str
+            New character per character; characters not in the table are kept.
+
+        Returns
+        -------
+        TextMap
+            A new map of the same size with the translated cells.
+
+        Raises
+        ------
+        ValueError
+            If any character or replacement in the table is not a single character.
+        """
+        if any(len(key) != 1 or len(value) != 1 for key, value in table.items()):
+            raise ValueError("Translation tables must map single characters to single characters.")
+
+        cells = self._copy_buffer()
+        if not self._wide and all(ord(value) <= _MAX_NARROW_CODE for value in table.values()):
+            codes = bytearray(range(_MAX_NARROW_CODE + 1))
+            for character, value in table.items():
+                if ord(character) <= _MAX_NARROW_CODE:
+                    codes[ord(character)] = ord(value)
+            return TextMap._from_buffer(cells.translate(codes), self._n_columns, self._n_rows)
+
+        text = self.as_string().translate({ord(key): value for key, value in table.items()})
+        return TextMap._from_buffer(_encode(text), self._n_columns, self._n_rows)
+
+    def expand(self, tiles: dict[str, str | list[str]]) -> "TextMap":
+        """
+        Create a map in which every cell is expanded into a tile of cells.
+
+        All tiles have the same size, of `k` rows of `m` characters; cell (x, y) becomes the
+        tile with its top-left cell at (x * m, y * k). Characters without a tile are repeated
+        to fill one. Every row and column within a tile is built in one translate pass over
+        the buffer.
+
+        Parameters
+        ----------
+        tiles : dict of str to str or list of str
+            Tile per character, as the rows of the tile, or as one string for a tile of one row.
+            E.g. {"O": "[]", "@": "@."} doubles the width of the map.
+
+        Returns
+        -------
+        TextMap
+            A new map, `m` times as wide and `k` times as high.
+
+        Raises
+        ------
+        ValueError
+            If a key is not a single character, if there are no tiles, or if they are not
+            rectangles of the same size.
+        """
+        if any(len(key) != 1 for key in tiles):
+            raise ValueError("Tiles must be keyed by single characters.")
+        tiles = {
+            key: [tile] if isinstance(tile, str) else list(tile) for key, tile in tiles.items()
+        }
+        shapes = {(len(tile), len(row)) for tile in tiles.values() for row in tile}
+        if len(shapes) != 1 or 0 in next(iter(shapes)):
+            raise ValueError("Tiles must be non-empty rectangles of the same size.")
+        tile_height, tile_width = next(iter(shapes))
+
+        width, height = self._n_columns * tile_width, self._n_rows * tile_height
+        narrow = not self._wide and all(
+            ord(c) <= _MAX_NARROW_CODE for tile in tiles.values() for row in tile for c in row
+        )
+        if not narrow:
+            repeated = {ord(c): c * tile_width for c in set(self.as_string())}
+            tables = [
+                repeated | {ord(key): tile[r] for key, tile in tiles.items()}
+                for r in range(tile_height)
+            ]
+            rows = [line.translate(table) for line in self.as_lines() for table in tables]
+            return TextMap._from_buffer(_encode("".join(rows)), width, height)
+
+        # One byte plane per position (r, c) in the tile, interleaved into the expanded rows
+        cells = bytes(self._copy_buffer())
+        expanded = bytearray(width * height)
+        for r in range(tile_height):
+            band = bytearray(len(cells) * tile_width)
+            for c in range(tile_width):
+                codes = bytearray(range(_MAX_NARROW_CODE + 1))
+                for key, tile in tiles.items():
+                    if ord(key) <= _MAX_NARROW_CODE:
+                        codes[ord(key)] = ord(tile[r][c])
+                band[c::tile_width] = cells.translate(codes)
+            for y in range(self._n_rows):
+                row = (y * tile_height + r) * width
+                expanded[row : row + width] = band[y * width : (y + 1) * width]
+        return TextMap._from_buffer(expanded, width, height)
+
+    def transpose(self) -> TextMapView:
+        """
+        Get a view on the map with rows and columns swapped, mirrored along the main diagonal.
+
+        The view remaps indices into this map instead of copying it; call `materialize` on it
+        for a new TextMap.
+
+        Returns
+        -------
+        TextMapView
+            The transposed view.
+        """
+        return TextMapView(self, self._n_columns, self._n_rows).transpose()
+
+    def flip_horizontal(self) -> TextMapView:
+        """
+        Get a view on the map mirrored left to right, see `transpose`.
+
+        Returns
+        -------
+        TextMapView
+            The mirrored view.
+        """
+        return TextMapView(self, self._n_columns, self._n_rows).flip_horizontal()
+
+    def flip_vertical(self) -> TextMapView:
+        """
+        Get a view on the map mirrored top to bottom, see `transpose`.
+
+        Returns
+        -------
+        TextMapView
+            The mirrored view.
+        """
+        return TextMapView(self, self._n_columns, self._n_rows).flip_vertical()
+
+    def rotate(self, turns: int = 1) -> TextMapView:
+        """
+        Get a view on the map rotated clockwise by a quarter turn, a number of times.
+
+        See `transpose`.
+
+        Parameters
+        ----------
+        turns : int, optional
+            Number of clockwise quarter turns, negative for counterclockwise (default 1).
+
+        Returns
+        -------
+        TextMapView
+            The rotated view.
+        """
+        return TextMapView(self, self._n_columns, self._n_rows).rotate(turns)
+
     def as_string(self) -> str:
         """Return the map as a string."""
-        return self._map_string
+        if self._exact:
+            if self._wide:
+                return self._data.tobytes().decode(_WIDE_CODEC)
+            return str(self._data, _NARROW_CODEC)
+
+        start, stop = self._span
+        if self._compact:
+            return self._slice(start, stop - start, 1)
+        return "".join(
+            self._slice(row_start, self._n_columns, 1)
+            for row_start in range(start, stop, self._stride)
+        )
+
+    def codes(self) -> bytearray | array:
+        """
+        Copy the character codes of all cells, row after row.
+
+        Returns
+        -------
+        bytearray or array of int
+            One code per cell: a bytearray if the map holds only Latin-1 characters, otherwise
+            an `array` of 32-bit code points.
+        """
+        return self._copy_buffer()
+
+    def to_array(self) -> "numpy.ndarray":
+        """
+        Expose the map as a 2D NumPy array of character codes, without copying.
+
+        The array has shape (height, width), dtype uint8 and shares its memory with the map, so
+        writes through either one are visible in both. Writing a non Latin-1 character into the
+        map detaches it from arrays returned earlier.
+
+        Returns
+        -------
+        numpy.ndarray
+            View on the map with one character code per cell.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        ValueError
+            If the map holds characters outside of Latin-1.
+        """
+        np = _import_numpy()
+        if self._wide:
+            raise ValueError("Only maps with Latin-1 characters can be viewed as a uint8 array.")
+
+        return np.ndarray(
+            (self._n_rows, self._n_columns),
+            dtype=np.uint8,
+            buffer=self._data,
+            offset=self._offset,
+            strides=(self._stride, 1),
+        )
+
+    @classmethod
+    def from_array(cls, character_codes: "numpy.ndarray") -> "TextMap":
+        """
+        Create a TextMap on top of a 2D uint8 NumPy array, without copying.
+
+        The map shares its memory with the array. Only arrays that are not C-contiguous or are
+        read-only are copied first.
+
+        Parameters
+        ----------
+        character_codes : numpy.ndarray
+            Array of shape (height, width) holding one Latin-1 character code per cell.
+
+        Returns
+        -------
+        TextMap
+            A new map object backed by the array.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        ValueError
+            If the array is not two-dimensional or not of dtype uint8.
+        """
+        np = _import_numpy()
+        character_codes = np.asarray(character_codes)
+        if character_codes.ndim != 2 or character_codes.dtype != np.uint8:
+            raise ValueError("Expected a 2D array of dtype uint8.")
+
+        if not character_codes.flags.c_contiguous or not character_codes.flags.writeable:
+            character_codes = np.array(character_codes, order="C")
+
+        height, width = character_codes.shape
+        if width == 0 or height == 0:
+            return cls([])
+
+        return cls._from_buffer(memoryview(character_codes).cast("B"), width, height)
 
     def within_bounds(self, coordinates: Coordinate | Iterable[Coordinate]) -> bool:
         """
@@ -354,8 +1955,11 @@ class TextMap:
         Returns
         -------
         bool
-            True if the coordinates are outside the map, False otherwise.
+            True if the coordinates are outside the map, False otherwise. Always True for a
+            wrapping map.
         """
+        if self._wrap:
+            return True
         return within_bounds(coordinates, self.bounds)
 
     def find_horizontal_numbers(self) -> list[tuple[int, Coordinate, Coordinate]]:
@@ -370,24 +1974,11 @@ class TextMap:
                 - 'start' (tuple of int): The starting position as (row, column).
                 - 'end' (tuple of int): The ending position as (row, column).
         """
-        horizontal_numbers = []
-        lines = self.as_lines()
-
-        for row_idx, line in enumerate(lines):
-            for match in re.finditer(r"\d+", line):
-                number_str = match.group()
-                start_col = match.start()
-                end_col = match.end() - 1  # inclusive end index
-                number = int(number_str)
-                horizontal_numbers.append(
-                    (
-                        number,
-                        (start_col, row_idx),
-                        (end_col, row_idx),
-                    )
-                )
-
-        return horizontal_numbers
+        tokens = find_tokens(self, r"\d+")
+        return [
+            (int(token), start, end)
+            for token, start, end in zip(tokens.tokens, tokens.starts, tokens.ends, strict=True)
+        ]
 
     def switch_tiles(
         self,
@@ -401,9 +1992,194 @@ class TextMap:
         coordinate_pairs : list of tuple of tuple of int
             List of coordinate pairs to switch.
         """
+        data, width, height = self._data, self._n_columns, self._n_rows
+        offset, stride = self._offset, self._stride
+        write = self._writer()
+        if self._wrap:
+            coordinate_pairs = (
+                ((x1 % width, y1 % height), (x2 % width, y2 % height))
+                for (x1, y1), (x2, y2) in coordinate_pairs
+            )
         for (x1, y1), (x2, y2) in coordinate_pairs:
-            if self.within_bounds((x1, y1)) and self.within_bounds((x2, y2)):
-                tile1 = self.get(x1, y1)
-                tile2 = self.get(x2, y2)
-                self.set(x1, y1, tile2)
-                self.set(x2, y2, tile1)
+            if 0 <= x1 < width and 0 <= y1 < height and 0 <= x2 < width and 0 <= y2 < height:
+                ix1 = offset + y1 * stride + x1
+                ix2 = offset + y2 * stride + x2
+                code1, code2 = data[ix1], data[ix2]
+                write(ix1, code2)
+                write(ix2, code1)
+
+
+def _encode(map_string: str) -> bytearray | array:
+    """
+    Encode a map string into a mutable cell buffer.
+
+    Parameters
+    ----------
+    map_string : str
+        The map as a single string without line breaks.
+
+    Returns
+    -------
+    bytearray or array
+        One byte per cell if all characters fit in Latin-1, else one 32-bit code point per cell.
+    """
+    try:
+        return bytearray(map_string.encode(_NARROW_CODEC))
+    except UnicodeEncodeError:
+        return _encode_wide(map_string)
+
+
+def _grid_layout(data: mmap.mmap) -> tuple[int, int, int] | None:
+    """
+    Determine the layout of a rectangular grid of lines in a buffer.
+
+    Parameters
+    ----------
+    data : mmap
+        Buffer holding lines separated by line feeds, optionally preceded by carriage returns.
+
+    Returns
+    -------
+    tuple of int or None
+        (width, height, stride) of the grid, or None if the lines are not of equal length, or
+        would not read back as the same cells when loaded as stripped lines of text.
+    """
+    stop = len(data)
+    while stop and data[stop - 1] in b"\r\n":
+        stop -= 1
+    if not stop or _UNMAPPABLE.search(data, 0, stop):
+        return None
+
+    width = data.find(b"\n", 0, stop)
+    if width < 0:
+        return stop, 1, stop
+
+    newline = b"\n"
+    if width and data[width - 1] == ord("\r"):
+        width, newline = width - 1, b"\r\n"
+    stride = width + len(newline)
+
+    height, remainder = divmod(stop + len(newline), stride)
+    if remainder or not width:
+        return None
+
+    # Every line feed must sit exactly at the end of a row, and nowhere else
+    for y in range(height):
+        line_feed = (y + 1) * stride - 1 if y < height - 1 else -1
+        if data.find(b"\n", y * stride, stop) != line_feed:
+            return None
+        if line_feed > 0 and data[line_feed - len(newline) + 1] != newline[0]:
+            return None
+
+    return width, height, stride
+
+
+@lru_cache(maxsize=64)
+def _flag_table(codes: frozenset[int]) -> bytes:
+    """Translate table mapping the Latin-1 codes in `codes` to 1 and all others to 0."""
+    return bytes(code in codes for code in range(_MAX_NARROW_CODE + 1))
+
+
+@lru_cache(maxsize=None)
+def _literal_pattern(value: bytes) -> re.Pattern:
+    """Compile a pattern matching `value` literally, usable on any byte buffer."""
+    return re.compile(re.escape(value))
+
+
+@lru_cache(maxsize=None)
+def _character_class_pattern(codes: bytes) -> re.Pattern:
+    """Compile a pattern matching any single byte in `codes`, usable on any byte buffer."""
+    return re.compile(b"[" + b"".join(re.escape(bytes((code,))) for code in codes) + b"]")
+
+
+def _patch_jumps(
+    jumps: dict[tuple[int, int], array], x: int, y: int, width: int, height: int, blocked: bool
+) -> None:
+    """
+    Patch the jump tables after a cell became a blocker, or stopped being one.
+
+    Only the cells between the neighbouring blockers in the row and column of the cell see a
+    different blocker, so only those entries are rewritten.
+
+    Parameters
+    ----------
+    jumps : dict of (dx, dy) to array of int
+        The jump table of every direction.
+    x : int
+        X-coordinate of the cell.
+    y : int
+        Y-coordinate of the cell.
+    width : int
+        Width of the map.
+    height : int
+        Height of the map.
+    blocked : bool
+        Whether the cell is a blocker now.
+    """
+    right, left, down, up = jumps[1, 0], jumps[-1, 0], jumps[0, 1], jumps[0, -1]
+    cell = y * width + x
+
+    # Cells from the previous blocker up to this cell now look at this cell, or past it
+    previous, following = left[cell], right[cell]
+    for column in range(max(previous, 0), x):
+        right[y * width + column] = x if blocked else following
+    for column in range(x + 1, min(following, width - 1) + 1):
+        left[y * width + column] = x if blocked else previous
+
+    previous, following = up[cell], down[cell]
+    for row in range(max(previous, 0), y):
+        down[row * width + x] = y if blocked else following
+    for row in range(y + 1, min(following, height - 1) + 1):
+        up[row * width + x] = y if blocked else previous
+
+
+@lru_cache(maxsize=None)
+def _neighbour_steps(stride: int, diagonal_sides: bool) -> tuple[tuple[int, int, int], ...]:
+    """Offsets (dx, dy, step in the buffer) of the neighbours of a cell, for a row stride."""
+    deltas = ADJACENCY_DELTAS_WITH_DIAGONALS if diagonal_sides else ADJACENCY_DELTAS
+    deltas = sorted(deltas, key=lambda delta: (delta[1], delta[0]))
+    return tuple((dx, dy, dy * stride + dx) for dx, dy in deltas)
+
+
+def _zobrist_key(cell: int, code: int) -> int:
+    """
+    Pseudo-random 64-bit key of a character in a cell, for Zobrist hashing.
+
+    Parameters
+    ----------
+    cell : int
+        Index `y * width + x` of the cell.
+    code : int
+        Code point of the character.
+
+    Returns
+    -------
+    int
+        The key, mixed with the SplitMix64 finalizer.
+    """
+    z = (((cell << 21) | code) + 0x9E37_79B9_7F4A_7C15) & _MASK_64
+    z = ((z ^ (z >> 30)) * 0xBF58_476D_1CE4_E5B9) & _MASK_64
+    z = ((z ^ (z >> 27)) * 0x94D0_49BB_1331_11EB) & _MASK_64
+    return z ^ (z >> 31)
+
+
+def _is_ndarray(values: object) -> bool:
+    """Check if values is a NumPy array, without importing NumPy."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def _import_numpy():
+    """Import NumPy, which is only required for array interop."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("NumPy is required for array interop with TextMap.") from e
+    return numpy
+
+
+def _encode_wide(map_string: str) -> array:
+    """Encode a map string as one 32-bit code point per cell."""
+    data = array(_WIDE_TYPECODE)
+    data.frombytes(map_string.encode(_WIDE_CODEC))
+    return data
@@ -0,0 +1,328 @@
+"""Lazy rotated, transposed or mirrored views on a TextMap."""
+
+from array import array
+from typing import TYPE_CHECKING
+
+from .coordinate import Coordinate
+from .general_types import Bounds
+
+if TYPE_CHECKING:
+    from .textmap import TextMap
+
+
+# Writing a character above Latin-1 widens the buffer of the map first, as `TextMap.set` does.
+_MAX_NARROW_CODE = 0xFF
+
+
+class TextMapView:
+    """
+    A rotated, transposed or mirrored view on a TextMap, that does not copy any cells.
+
+    Cell (x, y) of the view is cell `origin + x * x_axis + y * y_axis` of the map, so reading a
+    cell only costs the index remapping, and transforms of a view compose into a new mapping.
+    `materialize` copies the view into a new TextMap, row by row with one strided slice each.
+    Writes go through to the cell of the map, with the bookkeeping of the map kept up to date.
+    """
+
+    def __init__(
+        self,
+        textmap: "TextMap",
+        width: int,
+        height: int,
+        origin: Coordinate = (0, 0),
+        x_axis: Coordinate = (1, 0),
+        y_axis: Coordinate = (0, 1),
+    ) -> None:
+        """
+        Initialize a view on a map.
+
+        Parameters
+        ----------
+        textmap : TextMap
+            The map to view.
+        width : int
+            Width of the view.
+        height : int
+            Height of the view.
+        origin : Coordinate, optional
+            Coordinate in the map of cell (0, 0) of the view (default (0, 0)).
+        x_axis : Coordinate, optional
+            Step in the map when moving one cell right in the view (default (1, 0)).
+        y_axis : Coordinate, optional
+            Step in the map when moving one cell down in the view (default (0, 1)).
+        """
+        self._textmap = textmap
+        self._n_columns = width
+        self._n_rows = height
+        self._origin = tuple(origin)
+        self._x_axis = tuple(x_axis)
+        self._y_axis = tuple(y_axis)
+
+    def _remap(
+        self,
+        width: int,
+        height: int,
+        origin: Coordinate,
+        x_axis: Coordinate,
+        y_axis: Coordinate,
+    ) -> "TextMapView":
+        """Compose a transform, given in coordinates of this view, into a new view on the map."""
+        (ox, oy), (ax, ay), (bx, by) = self._origin, self._x_axis, self._y_axis
+        return TextMapView(
+            self._textmap,
+            width,
+            height,
+            (ox + origin[0] * ax + origin[1] * bx, oy + origin[0] * ay + origin[1] * by),
+            (x_axis[0] * ax + x_axis[1] * bx, x_axis[0] * ay + x_axis[1] * by),
+            (y_axis[0] * ax + y_axis[1] * bx, y_axis[0] * ay + y_axis[1] * by),
+        )
+
+    def _position(self, x: int, y: int) -> int:
+        """Position in the buffer of the map of cell (x, y) of the view."""
+        textmap = self._textmap
+        (ox, oy), (ax, ay), (bx, by) = self._origin, self._x_axis, self._y_axis
+        return textmap._offset + (oy + x * ay + y * by) * textmap._stride + ox + x * ax + y * bx
+
+    def _cells(self, y: int) -> bytes | memoryview | array:
+        """Read row `y` of the view from the buffer of the map, as one strided slice."""
+        data, stride = self._textmap._data, self._textmap._stride
+        (ax, ay), length = self._x_axis, self._n_columns
+        step = ay * stride + ax
+        start = self._position(0, y)
+        if step > 0:
+            return data[start : start + (length - 1) * step + 1 : step]
+        return data[start + (length - 1) * step : start + 1 : -step][::-1]
+
+    def _row(self, y: int) -> str:
+        """Read row `y` of the view as a string."""
+        textmap = self._textmap
+        (ax, ay), length = self._x_axis, self._n_columns
+        step = ay * textmap._stride + ax
+        start = self._position(0, y)
+        if step > 0:
+            return textmap._slice(start, length, step)
+        return textmap._slice(start + (length - 1) * step, length, -step)[::-1]
+
+    @property
+    def width(self) -> int:
+        """Width of the view."""
+        return self._n_columns
+
+    @property
+    def height(self) -> int:
+        """Height of the view."""
+        return self._n_rows
+
+    @property
+    def bounds(self) -> Bounds:
+        """Bounds of the view as (min_x, min_y, max_x, max_y)."""
+        return 0, 0, self._n_columns - 1, self._n_rows - 1
+
+    def get(self, x: int | Coordinate, y: int = None, out_of_bounds_character: str = "") -> str:
+        """
+        Get the character at the given coordinates of the view.
+
+        Parameters
+        ----------
+        x : int | Coordinate
+            X-coordinate (column) as an integer or a tuple containing (x, y).
+        y : int, optional
+            Y-coordinate (row). Required if `x` is an integer.
+        out_of_bounds_character : str, optional
+            Character to return if coordinates are out of bounds. Defaults to "".
+
+        Returns
+        -------
+        str
+            Character at the specified coordinates.
+
+        Raises
+        ------
+        ValueError
+            If the coordinates are out of bounds and no `out_of_bounds_character` is provided.
+        """
+        if isinstance(x, tuple):
+            x, y = x
+
+        if not (0 <= x < self._n_columns and 0 <= y < self._n_rows):
+            if out_of_bounds_character:
+                return out_of_bounds_character
+            raise ValueError(f"Coordinates ({x}, {y}) are out of bounds.")
+
+        return chr(self._textmap._data[self._position(x, y)])
+
+    def set(self, x: int | Coordinate, y: int | str | None = None, value: str = ...) -> None:
+        """
+        Set the character at the given coordinates of the view, in the cell of the map.
+
+        Parameters
+        ----------
+        x : int or Coordinate
+            X-coordinate (column) or a tuple of (x, y) coordinates.
+        y : int, optional
+            Y-coordinate (row). Required if `x` is an integer.
+        value : str
+            Character to place at the specified coordinates.
+
+        Raises
+        ------
+        TypeError
+            If arguments do not match expected types.
+        IndexError
+            If the coordinates are out of bounds.
+        """
+        if isinstance(x, tuple):
+            if not isinstance(y, str):
+                raise TypeError("When providing a tuple for coordinates, do not provide 'y'.")
+            (x, y), value = x, y
+        elif not (isinstance(x, int) and isinstance(y, int)):
+            raise TypeError("set() expects either two integers (x, y) or a single tuple (x, y).")
+
+        if not (0 <= x < self._n_columns and 0 <= y < self._n_rows):
+            raise IndexError("Coordinates are out of bounds.")
+
+        code = ord(value)
+        if code > _MAX_NARROW_CODE:
+            self._textmap._widen()
+        self._textmap._write(self._position(x, y), code)
+
+    def row(self, y: int) -> str:
+        """
+        Get a row of the view as a string.
+
+        Parameters
+        ----------
+        y : int
+            Index of the row.
+
+        Returns
+        -------
+        str
+            The row, read left to right.
+        """
+        if not 0 <= y < self._n_rows:
+            raise IndexError(f"Row {y} is out of bounds.")
+        return self._row(y)
+
+    def column(self, x: int) -> str:
+        """
+        Get a column of the view as a string.
+
+        Parameters
+        ----------
+        x : int
+            Index of the column.
+
+        Returns
+        -------
+        str
+            The column, read top to bottom.
+        """
+        if not 0 <= x < self._n_columns:
+            raise IndexError(f"Column {x} is out of bounds.")
+        return self.transpose()._row(x)
+
+    def as_lines(self) -> list[str]:
+        """
+        Return the view as a list of strings.
+
+        Returns
+        -------
+        list of str
+            The rows of the view.
+        """
+        return [self._row(y) for y in range(self._n_rows)]
+
+    def as_string(self) -> str:
+        """
+        Return the view as one string, without line breaks.
+
+        Returns
+        -------
+        str
+            The rows of the view joined together.
+        """
+        return "".join(self.as_lines())
+
+    def show(self) -> None:
+        """Print the view to stdout."""
+        print("\n".join(self.as_lines()))
+
+    def materialize(self) -> "TextMap":
+        """
+        Copy the cells of the view into a new TextMap.
+
+        Returns
+        -------
+        TextMap
+            A new map with the cells as seen through the view.
+        """
+        textmap = self._textmap
+        width, height = self._n_columns, self._n_rows
+        if not width or not height:
+            return type(textmap)([])
+
+        if isinstance(textmap._data, array):
+            cells = array(textmap._data.typecode)
+            for y in range(height):
+                cells.extend(self._cells(y))
+        else:
+            cells = bytearray().join(self._cells(y) for y in range(height))
+        return type(textmap)._from_buffer(cells, width, height)
+
+    def transpose(self) -> "TextMapView":
+        """
+        Get a view with rows and columns swapped, mirrored along the main diagonal.
+
+        Returns
+        -------
+        TextMapView
+            The transposed view.
+        """
+        return self._remap(self._n_rows, self._n_columns, (0, 0), (0, 1), (1, 0))
+
+    def flip_horizontal(self) -> "TextMapView":
+        """
+        Get a view mirrored left to right.
+
+        Returns
+        -------
+        TextMapView
+            The mirrored view.
+        """
+        return self._remap(self._n_columns, self._n_rows, (self._n_columns - 1, 0), (-1, 0), (0, 1))
+
+    def flip_vertical(self) -> "TextMapView":
+        """
+        Get a view mirrored top to bottom.
+
+        Returns
+        -------
+        TextMapView
+            The mirrored view.
+        """
+        return self._remap(self._n_columns, self._n_rows, (0, self._n_rows - 1), (1, 0), (0, -1))
+
+    def rotate(self, turns: int = 1) -> "TextMapView":
+        """
+        Get a view rotated clockwise by a quarter turn, a number of times.
+
+        Parameters
+        ----------
+        turns : int, optional
+            Number of clockwise quarter turns, negative for counterclockwise (default 1).
+
+        Returns
+        -------
+        TextMapView
+            The rotated view.
+        """
+        width, height = self._n_columns, self._n_rows
+        turns %= 4
+        if turns == 1:
+            return self._remap(height, width, (0, height - 1), (0, -1), (1, 0))
+        if turns == 2:
+            return self._remap(width, height, (width - 1, height - 1), (-1, 0), (0, -1))
+        if turns == 3:
+            return self._remap(height, width, (width - 1, 0), (0, 1), (-1, 0))
+        return self._remap(width, height, (0, 0), (1, 0), (0, 1))
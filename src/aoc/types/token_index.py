@@ -0,0 +1,127 @@
+"""Index of the tokens (e.g. numbers) in a map, with a cell to token label grid."""
+
+from array import array
+from typing import Iterable
+
+from .coordinate import Coordinate
+from ..constants import ADJACENCY_DELTAS, ADJACENCY_DELTAS_WITH_DIAGONALS
+
+
+class TokenIndex:
+    """
+    Tokens found in a map, and which token every cell belongs to.
+
+    Tokens are numbered in the order they were found. Every cell of the map is labelled with
+    the id of the token covering it, or -1, so finding the tokens around a cell only looks at
+    its neighbours.
+
+    Attributes
+    ----------
+    tokens : list of str
+        Text of every token, indexed by token id.
+    starts : list of Coordinate
+        Coordinate of the first cell of every token.
+    ends : list of Coordinate
+        Coordinate of the last cell of every token.
+    labels : array of int
+        Token id of cell (x, y) at `y * width + x`, or -1 if no token covers the cell.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Initialize an empty index for a map.
+
+        Parameters
+        ----------
+        width : int
+            Width of the map.
+        height : int
+            Height of the map.
+        """
+        self.tokens: list[str] = []
+        self.starts: list[Coordinate] = []
+        self.ends: list[Coordinate] = []
+        self.labels = array("i", [-1]) * (width * height)
+        self._width = width
+        self._height = height
+
+    def _add(self, token: str, start: Coordinate, direction: tuple[int, int]) -> None:
+        """Add a token, labelling the cells it covers."""
+        token_id = len(self.tokens)
+        (x, y), (dx, dy) = start, direction
+        if dy == 0 and dx == 1:
+            cell = y * self._width + x
+            self.labels[cell : cell + len(token)] = array("i", [token_id]) * len(token)
+        else:
+            for step in range(len(token)):
+                self.labels[(y + step * dy) * self._width + x + step * dx] = token_id
+
+        last = len(token) - 1
+        self.tokens.append(token)
+        self.starts.append(start)
+        self.ends.append(Coordinate(x + last * dx, y + last * dy))
+
+    def __len__(self) -> int:
+        """Return the number of tokens."""
+        return len(self.tokens)
+
+    def __getitem__(self, token_id: int) -> str:
+        """Return the text of a token."""
+        return self.tokens[token_id]
+
+    def label(self, coordinate: Coordinate) -> int:
+        """
+        Get the id of the token covering a cell.
+
+        Parameters
+        ----------
+        coordinate : Coordinate
+            Coordinate of the cell.
+
+        Returns
+        -------
+        int
+            The token id, or -1 if no token covers the cell or it is outside the map.
+        """
+        x, y = coordinate
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return self.labels[y * self._width + x]
+        return -1
+
+    def touching(
+        self,
+        coordinates: Coordinate | Iterable[Coordinate],
+        diagonal_sides: bool = True,
+    ) -> list[int]:
+        """
+        Get the tokens covering or adjacent to one or more cells.
+
+        Parameters
+        ----------
+        coordinates : Coordinate or iterable of Coordinate
+            The cell or cells to look around.
+        diagonal_sides : bool, optional
+            If True, diagonally adjacent tokens are included (default True).
+
+        Returns
+        -------
+        list of int
+            Ids of the tokens, in ascending order. Empty if no cells are given.
+        """
+        if (
+            isinstance(coordinates, tuple)
+            and len(coordinates) == 2
+            and isinstance(coordinates[0], int)
+        ):
+            coordinates = [coordinates]
+
+        deltas = ADJACENCY_DELTAS_WITH_DIAGONALS if diagonal_sides else ADJACENCY_DELTAS
+        labels, width, height = self.labels, self._width, self._height
+        token_ids = set()
+        for x, y in coordinates:
+            for dx, dy in ((0, 0), *deltas):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    token_ids.add(labels[ny * width + nx])
+        token_ids.discard(-1)
+        return sorted(token_ids)
@@ -0,0 +1,57 @@
+"""Tests for the label_regions function and the Regions it returns."""
+
+import pytest
+
+from aoc.grid import group_adjacent, label_regions
+from aoc.types import TextMap
+
+
+GARDEN = ["RRRRIICCFF", "RRRRIICCCF", "VVRRRCCFFF", "VVRCCCJFFF", "VVVVCJJCFE"]
+
+
+def test_label_regions():
+    """Test labels, characters, sizes and bounds of the regions."""
+    regions = label_regions(TextMap(["AAB", "ABB", "CBA"]))
+
+    assert len(regions) == 4
+    assert regions.characters == ["A", "B", "C", "A"]
+    assert regions.sizes == [3, 4, 1, 1]
+    assert regions.bounds == [(0, 0, 1, 1), (1, 0, 2, 2), (0, 2, 0, 2), (2, 2, 2, 2)]
+    assert list(regions.labels) == [0, 0, 1, 0, 1, 1, 2, 1, 3]
+    assert regions.label((2, 1)) == 1
+    assert regions.label((3, 0)) == -1
+    assert regions.coordinates(1) == [(2, 0), (1, 1), (2, 1), (1, 2)]
+
+
+def test_label_regions_diagonal():
+    """Test that diagonal neighbours join regions when requested."""
+    tm = TextMap(["A.A", ".A.", "A.."])
+
+    assert len(label_regions(tm)) == 7
+    regions = label_regions(tm, diagonal_sides=True)
+    assert regions.characters == ["A", "."]
+    assert regions.sizes == [4, 5]
+
+
+def test_label_regions_joins_late():
+    """Test regions whose branches only meet further down the map."""
+    regions = label_regions(TextMap(["A.A.A", "A.A.A", "AAAAA"]))
+
+    assert regions.characters == ["A", ".", "."]
+    assert regions.sizes == [11, 2, 2]
+    assert regions.bounds[0] == (0, 0, 4, 2)
+
+
+@pytest.mark.parametrize("diagonal_sides", [False, True])
+def test_groups_match_group_adjacent(diagonal_sides):
+    """Test that the regions are the groups of adjacent coordinates of every character."""
+    tm = TextMap(GARDEN)
+    expected = {
+        group
+        for coordinates in tm.find_all_many().values()
+        for group in group_adjacent(coordinates, diagonal_sides=diagonal_sides)
+    }
+
+    groups = label_regions(tm, diagonal_sides=diagonal_sides).groups()
+    assert {frozenset(group) for group in groups} == expected
+    assert label_regions(TextMap([])).groups() == []
@@ -0,0 +1,52 @@
+"""Tests for the match function."""
+
+import pytest
+
+from aoc.grid import match
+from aoc.types import TextMap
+
+
+def test_match():
+    """Test matching a template with wildcards."""
+    tm = TextMap(["M.S.M", ".A.A.", "M.S.M", "....."])
+
+    assert match(tm, ["M?S", "?A?", "M?S"]) == [(0, 0)]
+    assert match(tm, ["M?S", "?A?", "M?S"], reflections=True) == [(0, 0), (2, 0)]
+    assert match(tm, ["S?M", "?A?", "S?M"]) == [(2, 0)]
+    assert match(tm, ["A"]) == [(1, 1), (3, 1)]
+    assert match(tm, ["??", "??"], wildcard="?") == [(x, y) for y in range(3) for x in range(4)]
+    assert match(tm, ["MM"]) == []
+    assert match(tm, ["??????"]) == []
+
+
+def test_match_rotations():
+    """Test matching all rotations of a template."""
+    tm = TextMap(["M.M.S.S", ".A...A.", "S.S.M.M"])
+
+    assert match(tm, ["M?S", "?A?", "M?S"]) == []
+    assert match(tm, ["M?S", "?A?", "M?S"], rotations=True) == [(0, 0), (4, 0)]
+
+
+def test_match_does_not_wrap_rows():
+    """Test that template rows never match across the edge of the map."""
+    tm = TextMap(["..A", "B..", "..A", "B.."])
+    assert match(tm, ["AB"]) == []
+    assert match(tm, ["A", "?", "A"]) == [(2, 0)]
+
+
+def test_match_invalid_pattern():
+    """Test that templates must be rectangular."""
+    tm = TextMap(["ABC", "DEF"])
+    with pytest.raises(ValueError):
+        match(tm, ["AB", "C"])
+    with pytest.raises(ValueError):
+        match(tm, [])
+
+
+def test_match_wide_map():
+    """Test matching on a map holding characters outside Latin-1."""
+    tm = TextMap(["€.€", ".€.", "€.x"])
+    assert match(tm, ["€?", "?€"]) == [(0, 0)]
+    assert match(tm, ["?€", "€?"]) == [(1, 0), (0, 1)]
+    assert match(tm, ["x"]) == [(2, 2)]
+    assert match(tm, ["😊"]) == []
@@ -0,0 +1,46 @@
+"""Tests for the next_blocker function."""
+
+import pytest
+
+from aoc.grid import next_blocker
+from aoc.types import Direction, TextMap
+
+
+@pytest.mark.parametrize(
+    "coordinate,direction,expected",
+    [
+        ((0, 1), Direction.RIGHT, (3, 1)),
+        ((3, 1), Direction.RIGHT, (5, 1)),
+        ((4, 1), Direction.LEFT, (3, 1)),
+        ((2, 1), Direction.LEFT, (-1, 1)),
+        ((3, 3), Direction.UP, (3, 1)),
+        ((3, 0), Direction.DOWN, (3, 1)),
+        ((0, 0), Direction.DOWN, (0, 4)),
+        ((4, 0), Direction.UP, (4, -1)),
+    ],
+)
+def test_next_blocker(coordinate, direction, expected):
+    """Test looking for the next blocker in every direction."""
+    tm = TextMap(["....", "...#.", ".....", "....O"])
+    assert next_blocker(tm, coordinate, direction, "#O") == expected
+
+
+def test_next_blocker_patched_by_writes():
+    """Test that adding and removing blockers patches the jump table."""
+    tm = TextMap(["#....", ".....", "....#"])
+    assert next_blocker(tm, (0, 1), Direction.RIGHT) == (5, 1)
+
+    tm.set(2, 1, "#")
+    assert next_blocker(tm, (0, 1), Direction.RIGHT) == (2, 1)
+    assert next_blocker(tm, (4, 1), Direction.LEFT) == (2, 1)
+    assert next_blocker(tm, (2, 0), Direction.DOWN) == (2, 1)
+    assert next_blocker(tm, (2, 2), Direction.UP) == (2, 1)
+    assert next_blocker(tm, (2, 1), Direction.RIGHT) == (5, 1)
+
+    tm.switch_tiles([((2, 1), (2, 2))])
+    assert next_blocker(tm, (0, 1), Direction.RIGHT) == (5, 1)
+    assert next_blocker(tm, (0, 2), Direction.RIGHT) == (2, 2)
+    assert next_blocker(tm, (2, 0), Direction.DOWN) == (2, 2)
+
+    with pytest.raises(IndexError):
+        next_blocker(tm, (5, 0), Direction.LEFT)
@@ -0,0 +1,43 @@
+"""Tests for the step function."""
+
+import pytest
+
+from aoc.grid import step
+from aoc.types import TextMap
+
+
+def _life(character, count):
+    """Rule of Conway's game of life."""
+    return "#" if count == 3 or (character == "#" and count == 2) else "."
+
+
+def test_step_life():
+    """Test generations of the game of life, and stopping on a repeated state."""
+    tm = TextMap([".....", "..#..", "..#..", "..#..", "....."])
+
+    assert step(tm, _life) == 1
+    assert tm.as_lines() == [".....", ".....", ".###.", ".....", "....."]
+    assert step(tm, _life, generations=100, stop_on_repeat=True) == 2
+    assert tm.as_lines() == [".....", ".....", ".###.", ".....", "....."]
+
+    glider = TextMap([".#....", "..#...", "###...", "......", "......", "......"])
+    glider.enable_index()
+    assert step(glider, _life, generations=4) == 4
+    assert glider.find_all("#") == [(2, 1), (3, 2), (1, 3), (2, 3), (3, 3)]
+
+    block = TextMap(["....", ".##.", ".##.", "...."])
+    assert step(block, _life, generations=1000, stop_on_repeat=True) == 1
+    assert block.count("#") == 4
+
+
+def test_step_cross_and_new_characters():
+    """Test the cross neighbourhood, with a rule that writes characters not yet in the map."""
+    tm = TextMap(["...", ".#.", "..."])
+
+    step(tm, lambda character, count: "€" if count == 1 else character, neighbourhood="cross")
+    assert tm.as_lines() == [".€.", "€#€", ".€."]
+    step(tm, lambda character, count: "o" if character == "€" else character, counted="€")
+    assert tm.as_lines() == [".o.", "o#o", ".o."]
+
+    with pytest.raises(ValueError):
+        step(tm, _life, neighbourhood="hex")
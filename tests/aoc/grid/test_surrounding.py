@@ -1,5 +1,7 @@
 """Tests for the surrounding module."""
 
+import pytest
+
 from aoc.grid import surrounding
 
 
@@ -145,3 +147,31 @@ def test_multiple_coordinates_outside_bounds():
     # However, (9,10), (11,10), (10,9), (10,11) are outside bounds (0,0,5,5), so only from (1,1):
     expected = {(0, 1), (2, 1), (1, 0), (1, 2)}
     assert result == expected
+
+
+def test_wrap_around_bounds():
+    """Test that neighbours outside the bounds wrap to the opposite edge."""
+    result = surrounding((0, 0), bounds=(0, 0, 4, 2), diagonal_sides=True, wrap=True)
+    expected = {(1, 0), (4, 0), (0, 1), (0, 2), (1, 1), (4, 1), (1, 2), (4, 2)}
+    assert result == expected
+
+
+def test_wrap_with_offset_bounds():
+    """Test wrapping in bounds that do not start at the origin."""
+    result = surrounding((5, -1), bounds=(2, -3, 5, -1), wrap=True)
+    assert result == {(4, -1), (2, -1), (5, -2), (5, -3)}
+
+
+def test_wrap_narrow_bounds_excludes_the_cell():
+    """Test that wrapping in bounds one cell wide never yields the cell itself."""
+    assert surrounding((0, 0), bounds=(0, 0, 0, 2), wrap=True) == {(0, 1), (0, 2)}
+    assert surrounding((0, 1), bounds=(0, 0, 0, 2), diagonal_sides=True, wrap=True) == {
+        (0, 0),
+        (0, 2),
+    }
+
+
+def test_wrap_without_bounds():
+    """Test that wrapping without bounds is rejected."""
+    with pytest.raises(ValueError):
+        surrounding((0, 0), wrap=True)
@@ -0,0 +1,44 @@
+"""Tests for the tokens function."""
+
+import pytest
+
+from aoc.grid import tokens
+from aoc.types import TextMap
+
+
+SCHEMATIC = ["467..114..", "...*......", "..35..633.", "......#...", "617*......"]
+
+
+def test_tokens_do_not_span_rows():
+    """Test that a token at the end of a row does not continue on the next row."""
+    numbers = tokens(TextMap(["..12", "34.."]))
+    assert numbers.tokens == ["12", "34"]
+
+
+@pytest.mark.parametrize(
+    "direction,expected",
+    [
+        ((0, 1), ["1", "42", "3"]),
+        ((-1, 0), ["4", "1", "2", "3"]),
+    ],
+)
+def test_tokens_in_other_directions(direction, expected):
+    """Test reading tokens along columns and right to left."""
+    tm = TextMap(["1.4", "..2", "3.."])
+    numbers = tokens(tm, direction=direction)
+
+    assert sorted(numbers.tokens) == sorted(expected)
+    for token_id, token in enumerate(numbers.tokens):
+        assert tm.get(numbers.starts[token_id]) == token[0]
+        assert tm.get(numbers.ends[token_id]) == token[-1]
+        assert numbers.label(numbers.ends[token_id]) == token_id
+
+
+def test_tokens_on_wide_and_memory_mapped_maps(tmp_path):
+    """Test tokens on maps that are not plain byte buffers."""
+    tm = TextMap(["😊12", "3.."])
+    assert tokens(tm).tokens == ["12", "3"]
+
+    path = tmp_path / "map.txt"
+    path.write_text("\n".join(SCHEMATIC) + "\n")
+    assert tokens(TextMap.from_file(path), r"[*#]").starts == [(3, 1), (6, 3), (3, 4)]
@@ -0,0 +1,58 @@
+"""Test cases for the trace_beams function."""
+
+from aoc.grid import trace_beams
+from aoc.types import Direction, TextMap
+
+
+UP, DOWN, LEFT, RIGHT = Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT
+
+MIRRORS = {
+    "/": {RIGHT: [UP], LEFT: [DOWN], UP: [RIGHT], DOWN: [LEFT]},
+    "\\": {RIGHT: [DOWN], LEFT: [UP], UP: [LEFT], DOWN: [RIGHT]},
+    "|": {RIGHT: [UP, DOWN], LEFT: [UP, DOWN]},
+    "-": {UP: [LEFT, RIGHT], DOWN: [LEFT, RIGHT]},
+}
+
+CONTRAPTION = [
+    ".|...\\....",
+    "|.-.\\.....",
+    ".....|-...",
+    "........|.",
+    "..........",
+    ".........\\",
+    "..../.\\\\..",
+    ".-.-/..|..",
+    ".|....-|.\\",
+    "..//.|....",
+]
+
+
+def test_single_entry():
+    """Energizes the cells of the beam entering at the top-left corner."""
+    (energized,) = trace_beams(TextMap(CONTRAPTION), [((0, 0), RIGHT)], MIRRORS)
+
+    assert len(energized) == 46
+    assert (5, 1) in energized and (4, 1) not in energized
+
+
+def test_all_border_entries():
+    """Shares the traced segments between all entries along the border."""
+    entries = [((x, 0), DOWN) for x in range(10)] + [((9, y), LEFT) for y in range(10)]
+    energized = trace_beams(TextMap(CONTRAPTION), entries, MIRRORS)
+
+    assert len(energized) == len(entries)
+    assert max(map(len, energized)) == 51
+    assert len(energized[3]) == 51
+
+
+def test_loops_absorbers_and_outside_entries():
+    """Follows beams around loops, stops at absorbers and ignores entries off the map."""
+    tm = TextMap(["/.\\", "...", "\\#/"])
+    deflections = MIRRORS | {"#": {DOWN: []}}
+
+    around, absorbed, outside = trace_beams(
+        tm, [((1, 0), RIGHT), ((1, 0), DOWN), ((3, 0), LEFT)], deflections
+    )
+    assert list(around) == [(0, 0), (1, 0), (2, 0), (0, 1), (2, 1), (0, 2), (1, 2), (2, 2)]
+    assert list(absorbed) == [(1, 0), (1, 1), (1, 2)]
+    assert not outside
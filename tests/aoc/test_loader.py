@@ -138,3 +138,14 @@ def test_as_textmap_empty(empty_file: Path):
 
     assert isinstance(result, TextMap)
     assert result.as_lines() == []
+
+
+def test_as_textmap_memory_map(tmp_path: Path):
+    """Test that `as_textmap` can memory-map the file instead of reading it."""
+    p = tmp_path / "map.txt"
+    p.write_text("#.#\n..#\n")
+    result = Loader(p).as_textmap(memory_map=True)
+
+    assert isinstance(result, TextMap)
+    assert result.as_lines() == ["#.#", "..#"]
+    assert result == Loader(p).as_textmap()
@@ -0,0 +1,105 @@
+"""Tests for the CellMask class and TextMap.mask."""
+
+import pytest
+
+from aoc.grid import (
+    adjacency_map,
+    dijkstra,
+    dijkstra_with_direction,
+    find_shortest_path,
+    group_adjacent,
+)
+from aoc.types import CellMask, TextMap
+
+
+MAZE = ["#S..#", "#.#.#", "#...E"]
+
+
+def test_mask():
+    """Test that a mask selects the cells holding any of the characters."""
+    tm = TextMap(MAZE)
+    mask = tm.mask(".SE")
+
+    assert len(mask) == 9
+    assert (1, 0) in mask and (4, 2) in mask
+    assert (0, 0) not in mask and (5, 0) not in mask
+    assert list(mask) == [(1, 0), (2, 0), (3, 0), (1, 1), (3, 1), (1, 2), (2, 2), (3, 2), (4, 2)]
+    assert list(mask.cells())[:3] == [1, 2, 3]
+    assert mask == CellMask.from_coordinates(list(mask), tm.width, tm.height)
+    assert not tm.mask("x")
+    assert len(TextMap([]).mask(".")) == 0
+
+
+def test_mask_wide_map():
+    """Test masks of a map holding characters outside Latin-1."""
+    tm = TextMap(["€.", ".€"])
+    assert list(tm.mask("€")) == [(0, 0), (1, 1)]
+
+
+def test_mask_set_operations():
+    """Test union, intersection, difference and complement of masks."""
+    tm = TextMap(MAZE)
+    walls, open_cells, start = tm.mask("#"), tm.mask("."), tm.mask("S")
+
+    assert len(walls | open_cells) == 13
+    assert not walls & open_cells
+    assert list((open_cells | start) - open_cells) == [(1, 0)]
+    assert list(walls ^ ~open_cells) == [(1, 0), (4, 2)]
+    assert ~walls == tm.mask(".SE")
+
+    with pytest.raises(ValueError):
+        walls | TextMap(["##"]).mask("#")
+
+
+def test_mask_shift():
+    """Test moving masks, dropping the cells that leave the map."""
+    mask = TextMap(["#..", ".#.", "..#"]).mask("#")
+
+    assert list(mask.shift(1, 0)) == [(1, 0), (2, 1)]
+    assert list(mask.shift(-1, -1)) == [(0, 0), (1, 1)]
+    assert list(mask.shift(0, 2)) == [(0, 2)]
+    assert not mask.shift(3, 0)
+
+
+def test_mask_add_discard():
+    """Test adding and removing single cells."""
+    mask = CellMask(3, 2)
+    mask.add((2, 1))
+    mask.add((0, 0))
+    mask.discard((0, 0))
+    mask.discard((5, 5))
+
+    assert list(mask) == [(2, 1)]
+    with pytest.raises(IndexError):
+        mask.add((3, 0))
+
+
+def test_mask_in_grid_helpers():
+    """Test that masks can be passed to the grid helpers instead of coordinates."""
+    tm = TextMap(MAZE)
+    passable = tm.mask(".SE")
+
+    path = find_shortest_path(passable, tm.find("S"), tm.find("E"))
+    assert len(path) == 6
+    assert group_adjacent(passable) == {frozenset(passable)}
+    scores = {c: state["score"] for c, state in dijkstra(passable, tm.find("S")).items()}
+    assert scores == {c: state["score"] for c, state in dijkstra(list(passable), (1, 0)).items()}
+    assert adjacency_map(passable) == adjacency_map(list(passable))
+    assert adjacency_map(passable, True) == adjacency_map(list(passable), True)
+    assert group_adjacent(passable, False, True) == group_adjacent(list(passable), False, True)
+    assert dijkstra_with_direction(passable, tm.find("S")) == dijkstra_with_direction(
+        list(passable), tm.find("S")
+    )
+
+
+def test_mask_to_graph():
+    """Test compiling a mask into a graph of its cells."""
+    graph = TextMap(MAZE).mask(".SE").to_graph()
+
+    assert len(graph) == 9
+    assert graph.coordinates[:3] == [(1, 0), (2, 0), (3, 0)]
+    assert sorted(graph.coordinate(n) for n in graph.neighbours(graph.node((3, 2)))) == [
+        (2, 2),
+        (3, 1),
+        (4, 2),
+    ]
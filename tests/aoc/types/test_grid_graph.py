@@ -0,0 +1,96 @@
+"""Tests for the GridGraph class."""
+
+import pytest
+
+from aoc.constants import UNREACHABLE
+from aoc.grid import dijkstra, find_shortest_path, group_adjacent
+from aoc.types import GridGraph, TextMap
+
+
+MAZE = ["..#.", ".##.", "...#", "#..."]
+
+
+def test_to_graph():
+    """Test that the passable cells become nodes in reading order, linked to their neighbours."""
+    graph = TextMap(MAZE).to_graph(".")
+
+    assert len(graph) == 11
+    assert graph.coordinates[:3] == [(0, 0), (1, 0), (3, 0)]
+    assert graph.node((3, 0)) == 2
+    assert (2, 0) not in graph
+    assert sorted(graph.coordinate(n) for n in graph.neighbours(graph.node((0, 1)))) == [
+        (0, 0),
+        (0, 2),
+    ]
+    assert list(graph.neighbours(graph.node((3, 0)))) == [graph.node((3, 1))]
+    assert graph.offsets[-1] == len(graph.adjacency)
+
+    with pytest.raises(KeyError):
+        graph.node((2, 0))
+
+
+def test_to_graph_multiple_characters_and_diagonals():
+    """Test a graph over several passable characters, with diagonal adjacency."""
+    graph = TextMap(["S#", "#E"]).to_graph("SE", diagonal_sides=True)
+
+    assert graph.coordinates == [(0, 0), (1, 1)]
+    assert list(graph.neighbours(0)) == [1]
+
+
+def test_graph_from_coordinates():
+    """Test that a graph built from coordinates matches one compiled from a map."""
+    tm = TextMap(MAZE)
+    graph = GridGraph(tm.find_all("."))
+
+    assert graph.coordinates == tm.to_graph(".").coordinates
+    assert graph.adjacency == tm.to_graph(".").adjacency
+    assert len(GridGraph([])) == 0
+
+    shifted = GridGraph([(-5, -5), (-4, -5)])
+    assert list(shifted.neighbours(shifted.node((-5, -5)))) == [1]
+
+
+def test_searches_on_graph():
+    """Test that the grid searches give the same results on a graph as on coordinates."""
+    tm = TextMap(MAZE)
+    coordinates = tm.find_all(".")
+    graph = tm.to_graph(".")
+
+    path = find_shortest_path(graph, (0, 0), (3, 3))
+    assert len(path) == len(find_shortest_path(coordinates, (0, 0), (3, 3))) == 7
+    assert path[0] == (0, 0) and path[-1] == (3, 3)
+    assert find_shortest_path(graph, (0, 0), (3, 0)) == []
+    with pytest.raises(ValueError, match="end"):
+        find_shortest_path(graph, (0, 0), (2, 0))
+    with pytest.raises(ValueError, match="start"):
+        find_shortest_path(graph, (9, 9), (0, 0))
+
+    markers = TextMap(["S.#", "#.E"])
+    with pytest.raises(ValueError, match="start"):
+        find_shortest_path(markers.to_graph("."), (0, 0), (2, 1))
+    assert len(find_shortest_path(markers.to_graph(".SE"), (0, 0), (2, 1))) == 4
+
+    path_tree = dijkstra(graph, (0, 0))
+    expected = dijkstra(coordinates, (0, 0))
+    assert {c: v["score"] for c, v in path_tree.items()} == {
+        c: v["score"] for c, v in expected.items()
+    }
+    assert len(path_tree[(3, 3)]["tiles"]) == 6
+    assert path_tree[(3, 0)]["score"] == UNREACHABLE
+
+    assert group_adjacent(graph) == group_adjacent(coordinates)
+
+
+def test_wrapped_graph():
+    """Test that the graph of a wrapped map connects the cells on opposite edges."""
+    tm = TextMap(["..#", "#.#", "..."])
+    graph = tm.wrapped().to_graph(".")
+
+    path = find_shortest_path(graph, (0, 0), (2, 2))
+    assert path == [(0, 0), (0, 2), (2, 2)]
+    assert len(find_shortest_path(tm.to_graph("."), (0, 0), (2, 2))) == 5
+    assert sorted(graph.coordinate(n) for n in graph.neighbours(graph.node((0, 2)))) == [
+        (0, 0),
+        (1, 2),
+        (2, 2),
+    ]
@@ -0,0 +1,97 @@
+"""Tests for the IntGrid class."""
+
+import pytest
+
+from aoc.types import IntGrid, TextMap
+
+
+@pytest.fixture
+def grid():
+    """Grid of heights with one cell that is not a digit."""
+    return IntGrid.from_textmap(TextMap(["0123", "1.34", "9876"]))
+
+
+def test_from_textmap(grid):
+    """Test that digits become their values and other characters the non digit value."""
+    assert (grid.width, grid.height) == (4, 3)
+    assert grid.bounds == (0, 0, 3, 2)
+    assert grid.as_lines() == ["0 1 2 3", "1 -1 3 4", "9 8 7 6"]
+
+
+@pytest.mark.parametrize("typecode", ["h", "i"])
+def test_from_textmap_typecodes(typecode):
+    """Test loading into wider integers, and from a map of wide characters."""
+    grid = IntGrid.from_textmap(TextMap(["12😊"]), non_digit=1000, typecode=typecode)
+    assert grid.get_many([(0, 0), (1, 0), (2, 0)]) == (1, 2, 1000)
+
+
+@pytest.mark.parametrize("typecode, non_digit", [("b", 200), ("b", -129), ("h", 40000)])
+def test_from_textmap_non_digit_out_of_range(typecode, non_digit):
+    """Test that a non digit value that does not fit the typecode is rejected, not wrapped."""
+    with pytest.raises(ValueError):
+        IntGrid.from_textmap(TextMap(["1.", "23"]), non_digit=non_digit, typecode=typecode)
+    with pytest.raises(ValueError):
+        IntGrid.from_textmap(TextMap(["12", "34"]), non_digit=non_digit, typecode=typecode)
+
+
+def test_get_and_set(grid):
+    """Test reading and writing values."""
+    assert grid.get(3, 1) == 4
+    assert grid.get((0, 2)) == 9
+    assert grid.get(4, 0, out_of_bounds_value=-5) == -5
+
+    grid.set(1, 1, 2)
+    grid.set((0, 0), 7)
+    grid.set_many([(3, 0), (3, 2)], -3)
+    assert grid.as_lines() == ["7 1 2 -3", "1 2 3 4", "9 8 7 -3"]
+
+    with pytest.raises(ValueError):
+        grid.get(4, 0)
+    with pytest.raises(IndexError):
+        grid.set(4, 0, 1)
+    with pytest.raises(IndexError):
+        grid.set_many([(0, 3)], 1)
+    with pytest.raises(OverflowError):
+        grid.set(0, 0, 200)
+
+
+def test_find(grid):
+    """Test finding values in reading order."""
+    assert grid.find(3) == (3, 0)
+    assert grid.find_all(3) == [(3, 0), (2, 1)]
+    assert grid.find_all(-1) == [(1, 1)]
+    assert grid.find_all(5) == []
+    assert grid.find_all(1000) == []
+
+    wide = IntGrid(3, 2, fill=300, typecode="h")
+    wide.set(2, 1, 5)
+    assert wide.find_all(300) == [(0, 0), (1, 0), (2, 0), (0, 1), (1, 1)]
+
+    with pytest.raises(ValueError):
+        grid.find(5)
+
+
+def test_copy_and_bounds(grid):
+    """Test that a copy is independent, and bounds checks."""
+    copied = grid.copy()
+    copied.set(0, 0, 5)
+    assert grid.get(0, 0) == 0
+    assert grid.within_bounds([(0, 0), (3, 2)])
+    assert not grid.within_bounds((4, 2))
+
+
+def test_invalid_typecode():
+    """Test that only signed integer typecodes are accepted."""
+    with pytest.raises(ValueError):
+        IntGrid(2, 2, typecode="f")
+
+
+def test_to_array(grid):
+    """Test that the NumPy view shares memory with the grid."""
+    np = pytest.importorskip("numpy")
+
+    heights = grid.to_array()
+    assert heights.shape == (3, 4)
+    assert heights.dtype == np.int8
+    heights[0, 0] = 5
+    assert grid.get(0, 0) == 5
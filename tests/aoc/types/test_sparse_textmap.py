@@ -0,0 +1,117 @@
+"""Tests for the SparseTextMap class."""
+
+import pytest
+
+from aoc.types import SparseTextMap, TextMap
+
+
+def test_get_and_set():
+    """Test that unset cells are fill and set cells can be read back, anywhere."""
+    sm = SparseTextMap(".", chunk_size=4)
+
+    assert sm.get(10**9, -(10**9)) == "."
+    sm.set(-3, -7, "#")
+    sm.set((10**6, 5), "@")
+
+    assert sm.get(-3, -7) == "#"
+    assert sm.get((10**6, 5)) == "@"
+    assert sm.get(-4, -7) == "."
+    assert sm.bounds == (-3, -7, 10**6, 5)
+    assert (sm.width, sm.height) == (10**6 + 4, 13)
+
+    with pytest.raises(TypeError):
+        sm.set(1.5, 2, "#")
+
+
+def test_chunks_are_allocated_on_demand():
+    """Test that only chunks holding something other than fill are stored."""
+    sm = SparseTextMap(".", chunk_size=8)
+    sm.set_many([(0, 0), (1, 1), (1000, 1000)], "#")
+    assert len(sm._chunks) == 2
+
+    sm.set((1000, 1000), ".")
+    sm.set((5, 5), ".")
+    assert len(sm._chunks) == 1
+    assert sm.bounds == (0, 0, 1, 1)
+
+    sm.set_many([(0, 0), (1, 1)], ".")
+    assert not sm._chunks
+    assert (sm.width, sm.height) == (0, 0)
+    with pytest.raises(ValueError):
+        _ = sm.bounds
+
+
+def test_bounds_follow_writes():
+    """Test that the kept bounds grow with writes and shrink when an edge cell is cleared."""
+    sm = SparseTextMap(".", chunk_size=4)
+    sm.set_many([(1, 1), (2, 3)], "#")
+    assert sm.bounds == (1, 1, 2, 3)
+
+    sm.set(-5, 2, "#")
+    sm.set(9, 9, "@")
+    assert sm.bounds == (-5, 1, 9, 9)
+
+    sm.set(1, 1, ".")
+    sm.set(2, 2, ".")
+    assert sm.bounds == (-5, 2, 9, 9)
+    sm.set(9, 9, ".")
+    assert sm.bounds == (-5, 2, 2, 3)
+    assert (sm.width, sm.height) == (8, 2)
+    assert sm.copy().bounds == sm.bounds
+
+
+def test_find():
+    """Test finding characters across chunks, in reading order."""
+    sm = SparseTextMap(chunk_size=4)
+    sm.set_many([(9, 0), (-2, 1), (0, 3), (5, -4)], "#")
+    sm.set(1, 1, "@")
+
+    assert sm.find_all("#") == [(5, -4), (9, 0), (-2, 1), (0, 3)]
+    assert sm.find("#") == (5, -4)
+    assert sm.find("@") == (1, 1)
+    assert sm.find_all("X") == []
+    assert sm.find_all_many() == {"#": sm.find_all("#"), "@": [(1, 1)]}
+
+    with pytest.raises(ValueError):
+        sm.find("X")
+    with pytest.raises(ValueError):
+        sm.find_all(" ")
+
+
+def test_find_first_in_later_chunk():
+    """Test that find checks every chunk in the first chunk row holding the character."""
+    sm = SparseTextMap(chunk_size=4)
+    sm.set_many([(1, 3), (6, 0)], "#")
+
+    assert sm.find("#") == (6, 0)
+
+
+def test_unicode_widening():
+    """Test that setting a non Latin-1 character keeps the existing cells."""
+    sm = SparseTextMap(".", chunk_size=4)
+    sm.set(0, 0, "#")
+    sm.set(-1, -1, "😊")
+
+    assert sm.get(0, 0) == "#"
+    assert sm.find_all("😊") == [(-1, -1)]
+    assert sm.as_lines() == ["😊.", ".#"]
+
+
+def test_textmap_round_trip():
+    """Test conversion from and to a dense TextMap."""
+    tm = TextMap([".#..", "....", "..@."])
+    sm = SparseTextMap.from_textmap(tm, ".")
+
+    assert sm.find_all_many() == {"#": [(1, 0)], "@": [(2, 2)]}
+    assert sm.as_lines() == ["#.", "..", ".@"]
+    assert SparseTextMap().to_textmap().as_lines() == []
+
+    copied = sm.copy()
+    copied.set(1, 0, ".")
+    assert sm.get(1, 0) == "#"
+
+
+def test_invalid_chunk_size():
+    """Test that the chunk size must be a power of two."""
+    with pytest.raises(ValueError):
+        SparseTextMap(chunk_size=12)
@@ -3,7 +3,9 @@
 import pytest
 from io import StringIO
 from unittest.mock import patch
-from aoc.types import TextMap
+from aoc.grid import next_blocker, tokens
+from aoc.loader import Loader
+from aoc.types import Direction, TextMap
 
 
 @pytest.fixture
@@ -107,7 +109,7 @@ def test_init(tm, sample_map):
     """
     assert tm._n_rows == len(sample_map)
     assert tm._n_columns == len(sample_map[0])
-    assert "".join(sample_map) == tm._map_string
+    assert "".join(sample_map) == tm.as_string()
 
 
 def test_init_empty():
@@ -192,6 +194,54 @@ def test_get_many_out_of_bounds(tm):
         tm.get_many(coords)
 
 
+def test_get_many_out_of_bounds_character(tm):
+    """Test that get_many fills coordinates outside the map with the given character."""
+    assert tm.get_many([(0, 0), (-1, 1), (2, 3), (2, 1)], "#") == ("A", "#", "#", "F")
+
+
+def test_get_and_set_cells(tm):
+    """Test reading and writing cells by their index y * width + x."""
+    assert tm.get_cells([0, 4, 8]) == ("A", "E", "I")
+    assert tm.get_cells([2, 9, -1], "?") == ("C", "?", "?")
+    with pytest.raises(ValueError):
+        tm.get_cells([9])
+
+    tm.set_cells([1, 3], "x")
+    assert tm.as_lines() == ["AxC", "xEF", "GHI"]
+    with pytest.raises(IndexError):
+        tm.set_cells([5, 9], "y")
+    assert tm.get(2, 1) == "F"
+
+
+def test_set_many_checks_before_writing(tm):
+    """Test that set_many leaves the map unchanged if any coordinate is out of bounds."""
+    with pytest.raises(IndexError):
+        tm.set_many([(0, 0), (3, 0)], "Z")
+    assert tm.as_lines() == ["ABC", "DEF", "GHI"]
+
+
+@pytest.mark.parametrize("tracked", [False, True])
+def test_get_and_set_many_arrays(tm, tracked):
+    """Test that NumPy arrays of coordinates or cell indices are read and written as a whole."""
+    np = pytest.importorskip("numpy")
+    if tracked:
+        tm.enable_index()
+
+    coordinates = np.array([[0, 0], [2, 1], [5, 5], [1, -1]])
+    assert tm.get_many(coordinates, "#") == ("A", "F", "#", "#")
+    assert tm.get_cells(np.array([8, 4, 0])) == ("I", "E", "A")
+    with pytest.raises(ValueError):
+        tm.get_many(coordinates)
+
+    with pytest.raises(IndexError):
+        tm.set_many(coordinates, "Z")
+    tm.set_many(coordinates[:2], "Z")
+    tm.set_cells(np.array([7, 8]), "€")
+    assert tm.as_lines() == ["ZBC", "DEZ", "G€€"]
+    assert tm.find_all("Z") == [(0, 0), (2, 1)]
+    assert tm.window(1, 1, 2, 2).get_many(np.array([[0, 0], [1, 1]])) == ("E", "€")
+
+
 def test_set(tm):
     """
     Test the set method.
@@ -369,6 +419,102 @@ def test_pad_zero_padding(tm):
     assert padded.as_lines() == tm.as_lines()
 
 
+def test_bordered(tm):
+    """
+    Test bordered, get_unchecked and neighbors.
+
+    Ensures the border is readable without checks, but stays outside the map.
+    """
+    bordered = tm.bordered("#")
+    assert bordered.as_lines() == tm.as_lines()
+    assert (bordered.width, bordered.height) == (3, 3)
+    assert bordered.get(-1, 0, "?") == "?"
+    assert bordered.get_unchecked(-1, -1) == "#"
+    assert bordered.get_unchecked(3, 1) == "#"
+    assert bordered.get_unchecked(1, 1) == "E"
+    assert bordered.neighbors((0, 0)) == [
+        ((0, -1), "#"),
+        ((-1, 0), "#"),
+        ((1, 0), "B"),
+        ((0, 1), "D"),
+    ]
+    assert [c for _, c in bordered.neighbors((1, 1), diagonal_sides=True)] == list("ABCDFGHI")
+
+    with pytest.raises(ValueError):
+        tm.neighbors((1, 1))
+
+
+def test_bordered_copy_and_widen(tm):
+    """
+    Test that copies and widened maps keep the border.
+
+    Ensures writes go to the right cells after the map is widened.
+    """
+    bordered = tm.bordered(".", size=2).copy()
+    bordered.set(1, 1, "é")
+    bordered.set(2, 2, "€")
+    assert bordered.as_lines() == ["ABC", "DéF", "GH€"]
+    assert bordered.get_unchecked(-2, 4) == "."
+    assert [c for _, c in bordered.neighbors((2, 2))] == ["F", "H", ".", "."]
+
+
+def test_translate(tm):
+    """Test translating characters through a table, into a new map."""
+    assert tm.translate({"A": "a", "E": "."}).as_lines() == ["aBC", "D.F", "GHI"]
+    assert tm.translate({"I": "€"}).as_lines() == ["ABC", "DEF", "GH€"]
+    assert tm.window(1, 1, 2, 2).translate({"F": "f"}).as_lines() == ["Ef", "HI"]
+    assert tm.as_lines() == ["ABC", "DEF", "GHI"]
+
+    with pytest.raises(ValueError):
+        tm.translate({"A": "xy"})
+    with pytest.raises(ValueError):
+        tm.translate({"A": ""})
+    with pytest.raises(ValueError):
+        TextMap(["a€", "bc"]).translate({"a": "xy"})
+    with pytest.raises(ValueError):
+        tm.translate({"AB": "x"})
+
+
+def test_expand():
+    """Test expanding every cell into a tile."""
+    warehouse = TextMap(["#O.@", "#.O#"])
+
+    doubled = warehouse.expand({"O": "[]", "#": "##", ".": "..", "@": "@."})
+    assert doubled.as_lines() == ["##[]..@.", "##..[]##"]
+    assert warehouse.expand({"O": ["ab", "cd"]}).as_lines() == [
+        "##ab..@@",
+        "##cd..@@",
+        "##..ab##",
+        "##..cd##",
+    ]
+    assert warehouse.expand({"@": ["€"], "O": ["o"]}).as_lines() == ["#o.€", "#.o#"]
+
+    with pytest.raises(ValueError):
+        warehouse.expand({"O": "[]", "#": "###"})
+    with pytest.raises(ValueError):
+        warehouse.expand({})
+    with pytest.raises(ValueError, match="single characters"):
+        warehouse.expand({"O": "[]", "#.": ".."})
+    with pytest.raises(ValueError, match="single characters"):
+        warehouse.expand({"": ".."})
+
+
+def test_cells(tm):
+    """Test iterating over all cells, and over the cells holding some characters."""
+    cells = list(tm.cells())
+    assert len(cells) == 9
+    assert cells[:2] == [(0, 0, 0, "A"), (1, 1, 0, "B")]
+    assert cells[5] == (5, 2, 1, "F")
+
+    assert list(tm.cells("EA")) == [(0, 0, 0, "A"), (4, 1, 1, "E")]
+    assert list(tm.cells(tm.mask("I"))) == [(8, 2, 2, "I")]
+    assert list(tm.window(1, 1, 2, 2).cells("H")) == [(2, 0, 1, "H")]
+    assert list(TextMap([]).cells()) == []
+
+    with pytest.raises(ValueError):
+        list(tm.cells(TextMap(["AB"]).mask("A")))
+
+
 def test_as_string(tm):
     """
     Test as_string method.
@@ -379,6 +525,17 @@ def test_as_string(tm):
     assert tm.as_string() == expected
 
 
+def test_codes(tm):
+    """Test copying the character codes of the cells, narrow and wide."""
+    assert tm.codes() == bytearray(b"ABCDEFGHI")
+    assert tm.window(1, 1, 2, 2).codes() == bytearray(b"EFHI")
+    assert list(TextMap(["a€"]).codes()) == [ord("a"), ord("€")]
+
+    codes = tm.codes()
+    codes[0] = ord("x")
+    assert tm.get(0, 0) == "A"
+
+
 def test_within_bounds(tm):
     """
     Test within_bounds method.
@@ -755,3 +912,541 @@ def test_compare(tm):
 
     with pytest.raises(NotImplementedError):
         tm == "ABC"  # noqa: B015
+
+
+def test_set_is_in_place(tm):
+    """Test that set writes into the existing buffer instead of rebuilding it."""
+    buffer = tm._data
+    tm.set(1, 1, "X")
+    assert tm._data is buffer
+    assert tm.as_string() == "ABCDXFGHI"
+
+
+def test_set_invalid_value(tm):
+    """Test that set only accepts a single character."""
+    with pytest.raises(TypeError):
+        tm.set(0, 0, "XY")
+
+
+def test_set_many_out_of_bounds(tm):
+    """Test that set_many raises for out-of-bounds coordinates."""
+    with pytest.raises(IndexError):
+        tm.set_many([(0, 0), (3, 3)], "Z")
+
+
+def test_set_unicode_widens_map(tm):
+    """Test that writing a non Latin-1 character keeps the rest of the map intact."""
+    tm.set(2, 2, "😊")
+    assert tm.as_lines() == ["ABC", "DEF", "GH😊"]
+    assert tm.find("😊") == (2, 2)
+    assert tm.find_all("E") == [(1, 1)]
+
+    tm.set(2, 2, "I")
+    assert tm == TextMap(["ABC", "DEF", "GHI"])
+
+
+def test_switch_tiles(tm):
+    """Test switching tiles, ignoring pairs that are out of bounds."""
+    tm.switch_tiles([((0, 0), (2, 2)), ((1, 1), (3, 3))])
+    assert tm.as_lines() == ["IBC", "DEF", "GHA"]
+
+
+def test_to_array_shares_memory(tm):
+    """Test that to_array returns a (height, width) uint8 view on the map."""
+    np = pytest.importorskip("numpy")
+    array = tm.to_array()
+
+    assert array.shape == (3, 3)
+    assert array.dtype == np.uint8
+    assert chr(array[1, 2]) == "F"
+
+    array[0, 0] = ord("Z")
+    assert tm.get(0, 0) == "Z"
+
+    tm.set(2, 2, "Y")
+    assert chr(array[2, 2]) == "Y"
+
+
+def test_to_array_wide_map(tm):
+    """Test that maps with non Latin-1 characters cannot be viewed as uint8."""
+    pytest.importorskip("numpy")
+    tm.set(0, 0, "😊")
+    with pytest.raises(ValueError):
+        tm.to_array()
+
+
+def test_from_array(tm):
+    """Test that from_array wraps an array without copying it."""
+    np = pytest.importorskip("numpy")
+    array = np.frombuffer(b"ABCDEFGHI", dtype=np.uint8).reshape(3, 3).copy()
+    from_array = TextMap.from_array(array)
+
+    assert from_array == tm
+    assert from_array.find_all("E") == [(1, 1)]
+
+    from_array.set(1, 1, "X")
+    assert chr(array[1, 1]) == "X"
+
+    array[2, 2] = ord("Q")
+    assert from_array.as_lines() == ["ABC", "DXF", "GHQ"]
+
+    from_array.set(0, 0, "😊")
+    assert from_array.get(0, 0) == "😊"
+    assert chr(array[0, 0]) == "A"
+
+
+def test_from_array_invalid():
+    """Test that from_array only accepts 2D uint8 arrays."""
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        TextMap.from_array(np.zeros((2, 2), dtype=np.int64))
+    with pytest.raises(ValueError):
+        TextMap.from_array(np.zeros(4, dtype=np.uint8))
+
+
+def test_find_all_many(tm):
+    """Test finding all characters in a single pass."""
+    tm.set(2, 0, "A")
+    positions = tm.find_all_many()
+
+    assert positions["A"] == [(0, 0), (2, 0)]
+    assert positions["I"] == [(2, 2)]
+    assert len(positions) == 8
+
+
+def test_find_all_many_subset(tm):
+    """Test finding a chosen subset of characters, including absent ones."""
+    tm.set(2, 0, "😊")
+    positions = tm.find_all_many("A😊Z")
+    assert positions == {"A": [(0, 0)], "😊": [(2, 0)], "Z": []}
+
+    assert TextMap(["ABA"]).find_all_many(["A", "Z"]) == {"A": [(0, 0), (2, 0)], "Z": []}
+
+
+def test_index_is_maintained(tm):
+    """Test that the character index follows writes to the map."""
+    tm.enable_index()
+    assert tm.indexed
+
+    tm.set(1, 1, "A")
+    tm.set_many([(2, 2)], "A")
+    tm.switch_tiles([((0, 0), (1, 0))])
+
+    assert tm.find("A") == (1, 0)
+    assert tm.find_all("A") == [(1, 0), (1, 1), (2, 2)]
+    assert tm.find_all("E") == []
+    assert tm.find_all_many(["A", "B"]) == {"A": [(1, 0), (1, 1), (2, 2)], "B": [(0, 0)]}
+    with pytest.raises(ValueError):
+        tm.find("E")
+
+    copied = tm.copy()
+    copied.set(0, 0, "A")
+    assert copied.find("A") == (0, 0)
+    assert tm.find("A") == (1, 0)
+
+    tm.disable_index()
+    assert not tm.indexed
+    assert tm.find_all("A") == [(1, 0), (1, 1), (2, 2)]
+
+
+def test_row_and_column(tm):
+    """Test reading single rows and columns."""
+    assert tm.row(1) == "DEF"
+    assert tm.column(2) == "CFI"
+
+    with pytest.raises(IndexError):
+        tm.row(3)
+    with pytest.raises(IndexError):
+        tm.column(-1)
+
+
+@pytest.mark.parametrize(
+    "direction",
+    [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1), (-1, 1), (1, -1)],
+)
+@pytest.mark.parametrize("lines", [["ABCD", "EFGH", "IJKL"], ["AB", "CD", "EF", "GH"], ["A"]])
+def test_lines(lines, direction):
+    """Test that every cell is covered once and lines follow the direction."""
+    tm = TextMap(lines)
+    dx, dy = direction
+
+    seen = []
+    for (x, y), line in tm.lines(direction):
+        assert line == "".join(tm.get(x + i * dx, y + i * dy) for i in range(len(line)))
+        assert not tm.within_bounds((x - dx, y - dy))
+        assert not tm.within_bounds((x + len(line) * dx, y + len(line) * dy))
+        seen.extend((x + i * dx, y + i * dy) for i in range(len(line)))
+
+    assert sorted(seen) == sorted((x, y) for x in range(tm.width) for y in range(tm.height))
+
+
+def test_lines_invalid_direction(tm):
+    """Test that lines only accepts unit directions."""
+    with pytest.raises(ValueError):
+        list(tm.lines((2, 0)))
+    with pytest.raises(ValueError):
+        list(tm.lines((0, 0)))
+
+
+def test_find_word():
+    """Test finding a word in all eight directions."""
+    tm = TextMap(["XMAS", "MM.A", "A.AM", "S..S", "SAMX"])
+    found = tm.find_word("XMAS")
+
+    assert sorted(found) == [
+        ((0, 0), (0, 1)),
+        ((0, 0), (1, 0)),
+        ((0, 0), (1, 1)),
+        ((3, 4), (-1, 0)),
+    ]
+    assert tm.find_word("XMAS", directions=[(1, 0)]) == [((0, 0), (1, 0))]
+    assert tm.find_word("") == []
+
+
+@pytest.mark.parametrize("content", ["ABC\nDEF\nGHI\n", "ABC\nDEF\nGHI", "ABC\r\nDEF\r\nGHI\r\n"])
+def test_from_file(tmp_path, tm, content):
+    """Test memory-mapping a map file, with and without trailing and carriage return line ends."""
+    path = tmp_path / "map.txt"
+    path.write_bytes(content.encode())
+    mapped = TextMap.from_file(path)
+
+    assert mapped == tm
+    assert mapped.as_lines() == ["ABC", "DEF", "GHI"]
+    assert (mapped.width, mapped.height) == (3, 3)
+    assert mapped.get(2, 1) == "F"
+    assert mapped.find("G") == (0, 2)
+    assert mapped.find_all("I") == [(2, 2)]
+    assert mapped.find_all("\n") == []
+    assert mapped.find_all_many()["E"] == [(1, 1)]
+    assert mapped.column(2) == "CFI"
+    assert dict(mapped.lines((1, 1)))[(0, 0)] == "AEI"
+    assert mapped.copy() == tm
+
+
+def test_from_file_is_copy_on_write(tmp_path):
+    """Test that writes to a memory-mapped map never reach the file."""
+    path = tmp_path / "map.txt"
+    path.write_text("AB\nCD\n")
+    mapped = TextMap.from_file(path)
+
+    mapped.set(1, 1, "X")
+    mapped.switch_tiles([((0, 0), (1, 0))])
+    assert mapped.as_lines() == ["BA", "CX"]
+    assert path.read_text() == "AB\nCD\n"
+
+    mapped.set(0, 0, "😊")
+    assert mapped.as_lines() == ["😊A", "CX"]
+
+
+def test_from_file_index(tmp_path):
+    """Test the character index on a memory-mapped map."""
+    path = tmp_path / "map.txt"
+    path.write_text("AB\nCA\n")
+    mapped = TextMap.from_file(path)
+    mapped.enable_index()
+
+    mapped.set(1, 0, "A")
+    assert mapped.find_all("A") == [(0, 0), (1, 0), (1, 1)]
+    assert mapped.find("C") == (0, 1)
+
+
+@pytest.mark.parametrize("content", ["AB\nC\n", "AB\n\nCD\n", "AB\nCD\nE\n"])
+def test_from_file_not_a_grid(tmp_path, content):
+    """Test that files that are not a rectangular grid are loaded as usual."""
+    path = tmp_path / "map.txt"
+    path.write_text(content)
+    lines = [line.strip() for line in content.splitlines() if line.strip()]
+    assert TextMap.from_file(path) == TextMap(lines)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [" ab \n cd \n", "ab \ncd \n", "ab\n cd", "a\tb\ncd\n", "a\rb\ncd\n", "\né#\n.é\n", "é#\n.é"],
+)
+def test_from_file_matches_loader(tmp_path, content):
+    """Test that files the mapped layout would read differently are loaded as text."""
+    path = tmp_path / "map.txt"
+    path.write_bytes(content.encode())
+    assert TextMap.from_file(path) == TextMap(Loader(path).as_lines())
+
+
+def test_from_file_empty(tmp_path):
+    """Test memory-mapping an empty file."""
+    path = tmp_path / "map.txt"
+    path.write_text("")
+    assert TextMap.from_file(path).as_lines() == []
+
+
+def test_from_file_to_array(tmp_path):
+    """Test the array view on a memory-mapped map skips the line breaks."""
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "map.txt"
+    path.write_text("AB\nCD\n")
+    array = TextMap.from_file(path).to_array()
+
+    assert array.shape == (2, 2)
+    assert bytes(np.ascontiguousarray(array)) == b"ABCD"
+
+
+def test_snapshot_restore(tm):
+    """Test rolling back writes to a snapshot."""
+    base = tm.snapshot()
+    tm.set(0, 0, "X")
+    tm.set_many([(1, 1), (2, 2)], "Y")
+
+    nested = tm.snapshot()
+    tm.switch_tiles([((0, 0), (2, 0))])
+    assert tm.as_lines() == ["CBX", "DYF", "GHY"]
+
+    tm.restore(nested)
+    assert tm.as_lines() == ["XBC", "DYF", "GHY"]
+
+    tm.restore(base)
+    assert tm == TextMap(["ABC", "DEF", "GHI"])
+
+    # A snapshot can be restored repeatedly
+    tm.set(1, 0, "Z")
+    tm.restore(base)
+    assert tm.get(1, 0) == "B"
+
+    with pytest.raises(ValueError):
+        tm.restore(nested + 1)
+
+    tm.release_snapshots()
+    with pytest.raises(ValueError):
+        tm.restore(base)
+
+
+def test_restore_rejects_invalidated_snapshots():
+    """Test that snapshots taken after a restored snapshot can not be restored anymore."""
+    tm = TextMap(["...."])
+    first = tm.snapshot()
+    tm.set(0, 0, "a")
+    second = tm.snapshot()
+    tm.set(1, 0, "b")
+
+    tm.restore(first)
+    tm.set(2, 0, "c")
+    tm.set(3, 0, "d")
+    with pytest.raises(ValueError):
+        tm.restore(second)
+    assert tm.as_lines() == ["..cd"]
+
+    third = tm.snapshot()
+    tm.set(0, 0, "e")
+    tm.restore(third)
+    tm.restore(first)
+    assert tm.as_lines() == ["...."]
+
+
+def test_snapshot_restore_with_index_and_widening(tmp_path):
+    """Test that restoring keeps the character index valid, also after widening the map."""
+    path = tmp_path / "map.txt"
+    path.write_text("AB\nCD\n")
+    mapped = TextMap.from_file(path)
+    mapped.enable_index()
+
+    snapshot = mapped.snapshot()
+    mapped.set(1, 1, "A")
+    mapped.set(0, 1, "😊")
+    assert mapped.find_all("A") == [(0, 0), (1, 1)]
+
+    mapped.restore(snapshot)
+    assert mapped.as_lines() == ["AB", "CD"]
+    assert mapped.find_all("A") == [(0, 0)]
+    assert mapped.find("D") == (1, 1)
+
+
+def test_wrapped_view():
+    """Test that a wrapped view folds coordinates and shares the cells of the map."""
+    tm = TextMap(["abc", "def"])
+    torus = tm.wrapped()
+
+    assert torus.wrapping and not tm.wrapping
+    assert torus.get(3, 0) == "a"
+    assert torus.get((-1, -1)) == "f"
+    assert torus.get_many([(4, 3), (-3, 2)]) == ("e", "a")
+    assert torus.within_bounds((100, -100))
+    assert not tm.within_bounds((3, 0))
+
+    torus.set(-1, 2, "X")
+    torus.set_many([(3, 1), (6, -2)], "Y")
+    assert tm.as_lines() == ["YbX", "Yef"]
+
+    torus.switch_tiles([((0, 0), (-1, -1))])
+    assert tm.as_lines() == ["fbX", "YeY"]
+    assert torus.copy().wrapping
+
+    with pytest.raises(ValueError):
+        TextMap([]).wrapped()
+
+
+def test_wrapped_writes_keep_map_current():
+    """Test that writes through a wrapped view update the bookkeeping of the map."""
+    tm = TextMap(["....", "....", "...."])
+    assert next_blocker(tm, (0, 1), Direction.RIGHT, "#") == (4, 1)
+    assert tm.count("#") == 0
+
+    tm.wrapped().set(2, 4, "#")
+    assert next_blocker(tm, (0, 1), Direction.RIGHT, "#") == (2, 1)
+    assert tm.count("#") == 1
+    assert tm.fingerprint == TextMap(["....", "..#.", "...."]).fingerprint
+
+
+def test_window_view():
+    """Test that a window reads and writes a rectangle of the map without copying it."""
+    tm = TextMap(["#....", "..#1.", ".#..2", "....."])
+    window = tm.window(1, 1, 4, 2)
+
+    assert (window.width, window.height) == (4, 2)
+    assert window.as_lines() == [".#1.", "#..2"]
+    assert window.find_all("#") == [(1, 0), (0, 1)]
+    assert window.count("#") == 2
+    assert window.get(4, 0, "?") == "?"
+    assert list(tokens(window)) == ["1", "2"]
+    assert window.window(1, 0, 2, 1).as_lines() == ["#1", ".."]
+    assert len(window.to_graph(".")) == 4
+    assert window.copy().as_lines() == window.as_lines()
+
+    window.set(0, 0, "X")
+    window.set_many([(3, 0), (3, 1)], "Y")
+    assert tm.as_lines() == ["#....", ".X#1Y", ".#..Y", "....."]
+
+    with pytest.raises(ValueError):
+        tm.window(1, 1, 5, 2)
+    with pytest.raises(ValueError):
+        tm.window(2, 0, 1, 0)
+
+
+def test_window_writes_keep_map_current():
+    """Test that writes through a window update the bookkeeping of the map."""
+    tm = TextMap(["#..", "...", "..#"])
+    assert tm.count("#") == 2
+    assert next_blocker(tm, (0, 1), Direction.RIGHT, "#") == (3, 1)
+    tm.enable_index()
+    snapshot = tm.snapshot()
+    fingerprint = tm.fingerprint
+
+    window = tm.window(0, 0, 1, 1)
+    window.set(1, 1, "#")
+    assert tm.count("#") == 3
+    assert next_blocker(tm, (0, 1), Direction.RIGHT, "#") == (1, 1)
+    assert tm.find_all("#") == [(0, 0), (1, 1), (2, 2)]
+    assert tm.fingerprint == TextMap(["#..", ".#.", "..#"]).fingerprint
+    assert window.fingerprint == TextMap(["#.", ".#"]).fingerprint
+
+    window.set(0, 1, "€")
+    assert tm.as_lines() == ["#..", "€#.", "..#"]
+    assert window.as_lines() == ["#.", "€#"]
+
+    tm.restore(snapshot)
+    assert tm.as_lines() == ["#..", "...", "..#"]
+    assert tm.fingerprint == fingerprint
+    with pytest.raises(ValueError):
+        window.snapshot()
+    with pytest.raises(ValueError):
+        window.enable_index()
+
+
+def test_fingerprint():
+    """Test that the fingerprint follows the cells of the map through every kind of write."""
+    tm = TextMap(["ab", "cd"])
+    original = tm.fingerprint
+
+    assert TextMap(["ab", "cd"]).fingerprint == original
+    assert TextMap(["ba", "cd"]).fingerprint != original
+
+    tm.set(0, 0, "x")
+    assert tm.fingerprint == TextMap(["xb", "cd"]).fingerprint
+    tm.set(0, 0, "a")
+    assert tm.fingerprint == original
+
+    tm.switch_tiles([((0, 0), (1, 1))])
+    assert tm.fingerprint == TextMap(["db", "ca"]).fingerprint
+    tm.set_many([(0, 0), (1, 1)], "😊")
+    assert tm.fingerprint == TextMap(["😊b", "c😊"]).fingerprint
+    assert tm.copy().fingerprint == tm.fingerprint
+
+
+def test_fingerprint_on_memory_mapped_map_and_restore(tmp_path):
+    """Test that the fingerprint does not depend on the layout and is restored with snapshots."""
+    path = tmp_path / "map.txt"
+    path.write_text("ab\r\ncd\r\n")
+    tm = TextMap.from_file(path)
+    assert tm.fingerprint == TextMap(["ab", "cd"]).fingerprint
+
+    snapshot = tm.snapshot()
+    tm.set(1, 1, "#")
+    assert tm.fingerprint == TextMap(["ab", "c#"]).fingerprint
+    tm.restore(snapshot)
+    assert tm.fingerprint == TextMap(["ab", "cd"]).fingerprint
+
+
+@pytest.mark.parametrize(
+    "values,bounds,expected",
+    [
+        ("#", None, 5),
+        ("#", (1, 0, 2, 1), 3),
+        ("#", (0, 0, 0, 0), 1),
+        (".#", None, 10),
+        (["O", "#"], (0, 1, 3, 2), 5),
+        ("#", (-5, -5, 10, 10), 5),
+        ("#", (4, 0, 8, 2), 0),
+        ("#", (2, 2, 1, 1), 0),
+        ("X", None, 0),
+    ],
+)
+def test_count(values, bounds, expected):
+    """Test counting characters in the map and in rectangles."""
+    tm = TextMap(["#.#.", ".##O", "#..O"])
+    assert tm.count(values, bounds) == expected
+
+
+def test_count_after_writes(tmp_path):
+    """Test that counts follow writes, snapshots and non compact layouts."""
+    path = tmp_path / "map.txt"
+    path.write_text("#.#\n.##\n#..\n")
+    tm = TextMap.from_file(path)
+    assert tm.count("#", (0, 0, 1, 1)) == 2
+    assert tm.count(".") == 4
+
+    snapshot = tm.snapshot()
+    tm.set(0, 1, "#")
+    assert tm.count("#", (0, 0, 1, 1)) == 3
+    tm.switch_tiles([((2, 0), (2, 2))])
+    assert tm.count("#", (0, 2, 2, 2)) == 2
+    assert tm.count(".") == 3
+
+    tm.restore(snapshot)
+    assert tm.count("#") == 5
+    tm.set(1, 1, "😊")
+    assert tm.count("😊#", (1, 0, 2, 1)) == 3
+
+
+@pytest.mark.parametrize("fill", [".", "€"])
+def test_count_small_rectangles_between_writes(fill):
+    """Test counting small rectangles directly while the table is dropped, on both layouts."""
+    tm = TextMap([fill * 8] * 8)
+    tm.set_many([(1, 1), (2, 1), (6, 6)], "#")
+    assert tm.count("#", (0, 0, 2, 2)) == 2
+
+    tm.set(2, 2, "#")
+    assert tm.count("#", (1, 1, 2, 2)) == 3
+    assert tm.count("#", (2, 0, 7, 7)) == 3
+    tm.set(6, 6, fill)
+    assert tm.count("#" + fill, (5, 5, 6, 6)) == 4
+    assert tm.count("#", (0, 0, 7, 3)) == 3
+
+
+def test_jump_table():
+    """Test that the jump tables are built once and patched by writes."""
+    tm = TextMap(["#..", "...", "..#"])
+    jumps = tm.jump_table("#")
+
+    assert list(jumps[1, 0]) == [3, 3, 3, 3, 3, 3, 2, 2, 3]
+    assert list(jumps[0, 1]) == [3, 3, 2, 3, 3, 2, 3, 3, 3]
+    assert tm.jump_table(["#"]) is jumps
+
+    tm.set(1, 1, "#")
+    assert list(jumps[1, 0])[3:6] == [1, 3, 3]
+    assert list(jumps[-1, 0])[3:6] == [-1, -1, 1]
@@ -0,0 +1,100 @@
+"""Tests for the TextMapView class."""
+
+import pytest
+
+from aoc.types import TextMap
+
+
+SAMPLE = ["abc", "def"]
+
+
+@pytest.mark.parametrize(
+    "transform,expected",
+    [
+        (lambda tm: tm.transpose(), ["ad", "be", "cf"]),
+        (lambda tm: tm.flip_horizontal(), ["cba", "fed"]),
+        (lambda tm: tm.flip_vertical(), ["def", "abc"]),
+        (lambda tm: tm.rotate(), ["da", "eb", "fc"]),
+        (lambda tm: tm.rotate(2), ["fed", "cba"]),
+        (lambda tm: tm.rotate(-1), ["cf", "be", "ad"]),
+        (lambda tm: tm.rotate(4), ["abc", "def"]),
+        (lambda tm: tm.rotate().rotate().rotate(), ["cf", "be", "ad"]),
+        (lambda tm: tm.transpose().flip_horizontal(), ["da", "eb", "fc"]),
+        (lambda tm: tm.flip_vertical().transpose(), ["da", "eb", "fc"]),
+    ],
+)
+def test_transforms(transform, expected):
+    """Test that transforms, and compositions of them, remap the cells."""
+    view = transform(TextMap(SAMPLE))
+
+    assert view.as_lines() == expected
+    assert (view.width, view.height) == (len(expected[0]), len(expected))
+    assert view.get(0, 0) == expected[0][0]
+    assert view.get((view.width - 1, view.height - 1)) == expected[-1][-1]
+    assert view.row(view.height - 1) == expected[-1]
+    assert view.column(0) == "".join(line[0] for line in expected)
+    assert view.materialize().as_lines() == expected
+
+
+def test_view_reads_and_writes_through():
+    """Test that a view reads through to the map, and writes to the cells of the map."""
+    tm = TextMap(SAMPLE)
+    view = tm.rotate()
+
+    tm.set(0, 1, "X")
+    assert view.row(0) == "Xa"
+
+    view.set(0, 0, "Y")
+    view.set((1, 2), "Z")
+    assert view.as_lines() == ["Ya", "eb", "fZ"]
+    assert tm.as_lines() == ["abZ", "Yef"]
+
+    tm.set(0, 0, "W")
+    assert view.get(1, 0) == "W"
+
+    with pytest.raises(IndexError):
+        view.set(2, 0, "#")
+    with pytest.raises(TypeError):
+        view.set((0, 0), 1, "#")
+
+
+def test_view_writes_keep_map_current():
+    """Test that writes through a view update the bookkeeping of the map."""
+    tm = TextMap(SAMPLE)
+    tm.enable_index()
+    snapshot = tm.snapshot()
+
+    view = tm.transpose().flip_horizontal()
+    view.set(0, 2, "#")
+    view.set(1, 1, "😊")
+    assert tm.as_lines() == ["a😊c", "de#"]
+    assert tm.find_all("#") == [(2, 1)]
+    assert tm.fingerprint == TextMap(["a😊c", "de#"]).fingerprint
+    assert view.as_lines() == ["da", "e😊", "#c"]
+
+    tm.restore(snapshot)
+    assert tm.as_lines() == SAMPLE
+
+
+def test_view_bounds():
+    """Test reading outside the view."""
+    view = TextMap(SAMPLE).transpose()
+
+    assert view.bounds == (0, 0, 1, 2)
+    assert view.get(2, 0, out_of_bounds_character="#") == "#"
+    with pytest.raises(ValueError):
+        view.get(2, 0)
+    with pytest.raises(IndexError):
+        view.row(3)
+
+
+def test_view_on_wide_and_memory_mapped_maps(tmp_path):
+    """Test views on maps that are not compact byte buffers."""
+    tm = TextMap(["a😊", "bc"])
+    assert tm.transpose().materialize().as_lines() == ["ab", "😊c"]
+
+    path = tmp_path / "map.txt"
+    path.write_text("abc\r\ndef\r\n")
+    mapped = TextMap.from_file(path)
+    assert mapped.rotate().as_lines() == ["da", "eb", "fc"]
+    assert mapped.flip_horizontal().materialize() == TextMap(["cba", "fed"])
@@ -0,0 +1,37 @@
+"""Tests for the TokenIndex class."""
+
+from aoc.grid import tokens
+from aoc.types import TextMap
+
+
+SCHEMATIC = ["467..114..", "...*......", "..35..633.", "......#...", "617*......"]
+
+
+def test_tokens_and_labels():
+    """Test that tokens are found in reading order and their cells are labelled."""
+    numbers = tokens(TextMap(SCHEMATIC))
+
+    assert numbers.tokens == ["467", "114", "35", "633", "617"]
+    assert numbers.starts[2] == (2, 2) and numbers.ends[2] == (3, 2)
+    assert len(numbers) == 5 and numbers[3] == "633"
+    assert [numbers.label((x, 0)) for x in range(4)] == [0, 0, 0, -1]
+    assert numbers.label((-1, 0)) == -1 and numbers.label((10, 0)) == -1
+
+
+def test_touching():
+    """Test finding the tokens around a cell through the labels."""
+    numbers = tokens(TextMap(SCHEMATIC))
+
+    assert numbers.touching((3, 1)) == [0, 2]
+    assert numbers.touching((3, 4)) == [4]
+    assert numbers.touching((3, 1), diagonal_sides=False) == [2]
+    assert numbers.touching([(6, 3), (3, 4)]) == [3, 4]
+
+
+def test_touching_without_cells():
+    """Test that looking around no cells finds no tokens."""
+    numbers = tokens(TextMap(SCHEMATIC))
+
+    assert numbers.touching(()) == []
+    assert numbers.touching([]) == []
+    assert numbers.touching(((3, 1),)) == [0, 2]